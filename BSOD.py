@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 import os
 import subprocess
+import tempfile
 import threading
 import traceback
 import datetime
@@ -12,7 +13,7 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton,
     QHBoxLayout, QFileDialog, QMessageBox, QTextEdit, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QEventLoop
 from PyQt6.QtGui import QPainter, QColor, QFont, QClipboard, QPaintEvent, QPainterPath, QPen
 
 # BSOD GUI
@@ -218,10 +219,12 @@ def _format_exception(ex_type, ex_value, tb) -> str:
     ts = datetime.datetime.now().isoformat()
     return f"Timestamp: {ts}\n{header}\nTraceback:\n{text}"
 
-def _show_bsod(details: str, code: Optional[int] = None, restart_callback: Optional[Callable] = None):
+def _show_bsod(details: str, code: Optional[int] = None, restart_callback: Optional[Callable] = None,
+               wait: bool = False):
     """
     Show BSOD window; if no QApplication exists, create one (blocks).
-    If QApplication exists, show BSOD window on top (non-blocking).
+    If QApplication exists, show BSOD window on top (non-blocking), unless
+    wait=True, in which case block in a local event loop until it is closed.
     """
     app = QApplication.instance()
     created_app = False
@@ -241,6 +244,15 @@ def _show_bsod(details: str, code: Optional[int] = None, restart_callback: Optio
             app.exec()
         except Exception:
             pass
+    elif wait:
+        # the monitor has a QApplication but no running loop; wait for Restart/Quit
+        loop = QEventLoop()
+        win.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        win.destroyed.connect(loop.quit)
+        try:
+            loop.exec()
+        except Exception:
+            pass
 
 # Excepthook for convenience (legacy)
 def bsod_excepthook(ex_type, ex_value, tb):
@@ -280,7 +292,109 @@ def install_global_handlers(restart_callback: Optional[Callable] = None):
 
 # Supervised runner
 
-def run_with_bsod(main_callable: Callable, *args, restart_callback: Optional[Callable] = None, **kwargs):
+SUP_ENV = "LUX_SUPERVISED"
+# set to "1" to keep a pre-initialised standby child for fast restarts
+STANDBY_OPT_ENV = "LUX_STANDBY_CHILD"
+# set by the monitor on the standby child itself
+STANDBY_ENV = "LUX_STANDBY"
+STANDBY_ACTIVATE = "activate"
+# give the active child a head start before warming the standby next to it
+STANDBY_DELAY_SECONDS = 5
+
+
+class _SupervisedChild:
+    """A child interpreter running the same argv; output goes to temp files so a
+    child that is idle (standby) or chatty can never block on a full pipe."""
+
+    def __init__(self, env: dict, standby: bool = False):
+        self.standby = standby
+        env = dict(env)
+        env[SUP_ENV] = "1"
+        if standby:
+            env[STANDBY_ENV] = "1"
+        else:
+            env.pop(STANDBY_ENV, None)
+        self._out = tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace")
+        self._err = tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace")
+        try:
+            self.proc = subprocess.Popen(
+                [sys.executable] + sys.argv,
+                stdin=subprocess.PIPE if standby else None,
+                stdout=self._out,
+                stderr=self._err,
+                env=env,
+                text=True
+            )
+        except Exception:
+            self._close_files()
+            raise
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def activate(self) -> bool:
+        """Tell a standby child to start the app. False if it is no longer usable."""
+        if not self.standby or not self.alive():
+            return False
+        try:
+            self.proc.stdin.write(STANDBY_ACTIVATE + "\n")
+            self.proc.stdin.flush()
+            self.proc.stdin.close()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def wait(self, timeout: Optional[float] = None):
+        """Wait for exit; returns (code, stdout, stderr). Raises TimeoutExpired like Popen.wait."""
+        code = self.proc.wait(timeout=timeout)
+        out, err = self._read(self._out), self._read(self._err)
+        self._close_files()
+        return (code if code is not None else -1), out, err
+
+    def discard(self):
+        try:
+            if self.proc.stdin:
+                self.proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            if self.alive():
+                self.proc.terminate()
+                try:
+                    self.proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.proc.kill()
+                    self.proc.wait()
+        except Exception:
+            traceback.print_exc()
+        self._close_files()
+
+    @staticmethod
+    def _read(f) -> str:
+        try:
+            f.seek(0)
+            return f.read()
+        except Exception:
+            return ""
+
+    def _close_files(self):
+        for f in (self._out, self._err):
+            try:
+                f.close()
+            except Exception:
+                pass
+
+
+def _wait_for_activation() -> bool:
+    """Standby child: block (imports done, QApplication created, no windows) until the monitor says go."""
+    try:
+        line = sys.stdin.readline()
+    except Exception:
+        return False
+    return line.strip() == STANDBY_ACTIVATE
+
+def run_with_bsod(main_callable: Callable, *args, restart_callback: Optional[Callable] = None,
+                  standby: Optional[bool] = None, **kwargs):
     """
     Supervised runner.
 
@@ -292,38 +406,67 @@ def run_with_bsod(main_callable: Callable, *args, restart_callback: Optional[Cal
           to restart child (Attempt Restart).
       - If LUX_SUPERVISED == "1": behave like previous run_with_bsod: run
         main_callable inside try/except so Python exceptions become non-zero exits.
+
+    standby (default: LUX_STANDBY_CHILD=1): the monitor also keeps one standby
+    child that has finished its imports and startup but waits before calling
+    main_callable. Attempt Restart activates it instead of spawning a cold one.
     """
-    SUP_ENV = "LUX_SUPERVISED"
+    if standby is None:
+        standby = os.environ.get(STANDBY_OPT_ENV) == "1"
 
     # MONITOR mode
     if os.environ.get(SUP_ENV) != "1":
         # We're the monitor process.
+        spare = None
+
+        def _warm_spare(env):
+            try:
+                return _SupervisedChild(env, standby=True)
+            except Exception:
+                traceback.print_exc()
+                return None
+
+        def _drop_spare():
+            if spare is not None:
+                spare.discard()
+
         while True:
             env = os.environ.copy()
-            env[SUP_ENV] = "1"
 
             try:
-                # spawn child: same interpreter + same argv
-                p = subprocess.Popen(
-                    [sys.executable] + sys.argv,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    env=env,
-                    text=True
-                )
+                # hand over to the warm standby if there is one, otherwise cold start
+                if spare is not None and spare.activate():
+                    child = spare
+                else:
+                    _drop_spare()
+                    # spawn child: same interpreter + same argv
+                    child = _SupervisedChild(env)
+                spare = None
             except Exception as e:
+                _drop_spare()
                 details = f"Failed to spawn child process: {e}\n\nTraceback:\n{traceback.format_exc()}"
                 # show BSOD and then return non-zero
-                _show_bsod(details=details, code=None, restart_callback=restart_callback)
+                _show_bsod(details=details, code=None, restart_callback=restart_callback, wait=True)
                 return 1
 
-            out, err = p.communicate()
-            code = p.returncode if p.returncode is not None else -1
+            if standby:
+                try:
+                    code, out, err = child.wait(timeout=STANDBY_DELAY_SECONDS)
+                except subprocess.TimeoutExpired:
+                    spare = _warm_spare(env)
+                    code, out, err = child.wait()
+            else:
+                code, out, err = child.wait()
 
             # If child exits cleanly, exit monitor cleanly
             if code == 0:
+                _drop_spare()
                 return 0
 
+            # crashed early: warm a standby while the user reads the BSOD
+            if standby and spare is None:
+                spare = _warm_spare(env)
+
             # child crashed or returned non-zero -> show BSOD with child's output
             details = (
                 f"Child process exited with code {code}\n\n"
@@ -342,13 +485,14 @@ def run_with_bsod(main_callable: Callable, *args, restart_callback: Optional[Cal
                     pass
 
             # show BSOD; pass restart setter so when user clicks Attempt Restart we set the event
-            _show_bsod(details=details, code=code, restart_callback=_set_restart)
+            _show_bsod(details=details, code=code, restart_callback=_set_restart, wait=True)
 
             if restart_event.is_set():
-                # user requested restart -> loop to spawn child again
+                # user requested restart -> loop to spawn (or activate) child again
                 continue
             else:
                 # user quit or closed BSOD -> exit with child's code
+                _drop_spare()
                 try:
                     return int(code)
                 except Exception:
@@ -374,6 +518,10 @@ def run_with_bsod(main_callable: Callable, *args, restart_callback: Optional[Cal
 
             sys.excepthook = _child_excepthook
 
+            # standby child: everything up to here is already initialised, wait for the monitor
+            if os.environ.get(STANDBY_ENV) == "1" and not _wait_for_activation():
+                return 0
+
             # Run main callable (expected to create QApplication and exec)
             main_callable(*args, **kwargs)
 
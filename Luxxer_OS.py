@@ -1,3 +1,12 @@
+# first import so the rest are timed when startup profiling is on
+import startup_profiler
+import single_instance
+
+# a desktop is already running: hand it this request (e.g. --open Calculator)
+# and exit before paying for the imports below
+if __name__ == "__main__" and single_instance.forward_if_running():
+    raise SystemExit(0)
+
 import sys
 import os
 import io
@@ -6,7 +15,9 @@ import json
 import csv
 import math
 import time
+import shlex
 import shutil
+import socket
 import random
 import string
 import hashlib
@@ -21,8 +32,10 @@ import threading
 import warnings
 import secrets
 import base64
+import bisect
 import binascii
 import zlib
+import importlib
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
@@ -35,25 +48,19 @@ try:
 except Exception:
     psutil = None
 
-try:
-    import pyautogui
-except Exception:
-    pyautogui = None
-
-try:
-    from moviepy.editor import VideoFileClip
-except Exception:
-    VideoFileClip = None
+# pyautogui, moviepy, requests, paramiko, numpy and sounddevice are heavy and only
+# needed by a few apps - they are imported on first use via _safe_import().
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 from PyQt6.QtCore import (
     Qt, QTimer, QThread, pyqtSignal, QRegularExpression, QPropertyAnimation,
-    QRect, QEasingCurve, QPoint, QSize, QMimeData, QUrl
+    QRect, QRectF, QEasingCurve, QPoint, QPointF, QSize, QMimeData, QUrl, QObject, QEvent
 )
 from PyQt6.QtGui import (
     QIcon, QPixmap, QPainter, QPen, QColor, QAction, QTextCharFormat,
-    QFont, QSyntaxHighlighter, QCursor, QGuiApplication, QMouseEvent, QImage, QDrag
+    QFont, QSyntaxHighlighter, QCursor, QGuiApplication, QMouseEvent, QImage, QDrag, QPixmapCache,
+    QKeySequence, QImageReader
 )
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -61,7 +68,7 @@ from PyQt6.QtWidgets import (
     QTreeWidget, QTreeWidgetItem, QColorDialog, QInputDialog, QProgressBar, QSplitter,
     QFrame, QMenu, QComboBox, QGridLayout, QDockWidget, QSpinBox, QCheckBox,
     QMdiArea, QMdiSubWindow, QScrollArea, QSizePolicy, QMenuBar, QTableWidget,
-    QTableWidgetItem, QSlider, QDialog, QTabWidget, QToolBar, QPlainTextEdit, QCalendarWidget,
+    QTableWidgetItem, QSlider, QDialog, QTabWidget, QToolBar, QPlainTextEdit, QCalendarWidget, QToolTip,
 )
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
@@ -75,39 +82,14 @@ except Exception:
     QPdfDocument = None
     QT_PDF_AVAILABLE = False
 
-try:
-    from PyQt6.QtWebEngineWidgets import QWebEngineView
-    from PyQt6.QtWebEngineCore import QWebEngineProfile
-    WEBENGINE_AVAILABLE = True
-except Exception:
-    QWebEngineView = None
-    QWebEngineProfile = None
-    WEBENGINE_AVAILABLE = False
-
 try:
     from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaMetaData
     MEDIA_AVAILABLE = True
 except Exception:
     MEDIA_AVAILABLE = False
 
-try:
-    from cryptography.fernet import Fernet, InvalidToken
-    CRYPTO_AVAILABLE = True
-except Exception:
-    Fernet = None
-    CRYPTO_AVAILABLE = False
-
-try:
-    import pytesseract
-    from PIL import Image
-    OCR_AVAILABLE = True
-except Exception:
-    pytesseract = None
-    Image = None
-    OCR_AVAILABLE = False
-
 from iconadderonmainscreen import IconAdderAreaMarquee
-from BSOD import run_with_bsod, install_global_handlers
+from BSOD import run_with_bsod, install_global_handlers, STANDBY_ENV
 
 try:
     from start_menu_file import StartMenu
@@ -120,64 +102,28 @@ except Exception:
     StartScreen = None
     apply_theme_global = None
 
-try:
-    from games_all import GamesApp
-except Exception:
-    GamesApp = None
-
-try:
-    from applicationadder import ApplicationAdder
-except Exception:
-    ApplicationAdder = None
+from app_registry import AppRegistry
+from app_pool import AppInstancePool, process_rss
+from app_preloader import LaunchHistory, IdlePreloader
+from app_suspend import SuspendManager, suspend_widget, resume_widget
+import stall_detector
+import app_accounting
+import leak_detector
+import input_replay
+import task_executor
+from task_executor import run_in_main
+import async_loop
+import memory_governor
+import power_manager
+import engines
+import frame_hud
 
 def _safe_import(name):
     try:
-        module = __import__(name)
-        return module
+        return importlib.import_module(name)
     except Exception:
         return None
 
-RandomChallengeApp = _safe_import("RandomChallenge").RandomChallengeApp if _safe_import("RandomChallenge") else None
-MotivationAIChat = _safe_import("MotivationAIChat").MotivationAIChat if _safe_import("MotivationAIChat") else None
-JokeGeneratorApp = _safe_import("JokeGenerator").JokeGeneratorApp if _safe_import("JokeGenerator") else None
-
-try:
-    from apps_extra3 import (
-        WebBrowserApp, BrowserTab, TabbedBrowserApp, IncognitoBrowserApp, ReaderModeBrowserApp,
-        RSSFeedReaderApp, LocalNotesApp, SecureVaultLiteApp, ImageGalleryApp,
-        BatchImageResizerApp, AudioPlayerProApp, VideoStreamPlayerApp, JSONInspectorApp,
-        CSVEditorProApp, SQLiteBrowserApp, APIRequesterApp, AutomationScriptApp, OCRToolApp,
-        PodcastManagerApp, EpubReaderApp, ColorGradingApp, FontPreviewerApp, IconSetManagerApp,
-        ClipStackApp, WindowTilerApp, DesktopSpacesApp, NetworkSpeedTesterApp, FocusTimerApp,
-        PasswordGeneratorApp, WallpapersManagerApp
-    )
-except Exception:
-    WebBrowserApp = TabbedBrowserApp = IncognitoBrowserApp = ReaderModeBrowserApp = None
-    RSSFeedReaderApp = LocalNotesApp = SecureVaultLiteApp = ImageGalleryApp = None
-    BatchImageResizerApp = AudioPlayerProApp = VideoStreamPlayerApp = JSONInspectorApp = None
-    CSVEditorProApp = SQLiteBrowserApp = APIRequesterApp = AutomationScriptApp = None
-    OCRToolApp = PodcastManagerApp = EpubReaderApp = ColorGradingApp = None
-    FontPreviewerApp = IconSetManagerApp = ClipStackApp = WindowTilerApp = None
-    DesktopSpacesApp = NetworkSpeedTesterApp = FocusTimerApp = None
-    PasswordGeneratorApp = WallpapersManagerApp = None
-
-try:
-    from apps_extra import HackerSimulatorApp, ASCIIPainterApp, FortuneTellerApp
-except Exception:
-    HackerSimulatorApp = ASCIIPainterApp = FortuneTellerApp = None
-
-try:
-    from apps_extra2 import (
-        HabitTrackerApp, PomodoroApp, RandomStoryApp, TravelTipsApp,
-        QRCodeGeneratorApp, ColorPaletteApp, RecipeBoxApp, BudgetTrackerApp,
-        TerminalGamesApp, AmbientSoundApp, ScreenOrganizerApp, ThemePreviewApp
-    )
-except Exception:
-    HabitTrackerApp = PomodoroApp = RandomStoryApp = TravelTipsApp = None
-    QRCodeGeneratorApp = ColorPaletteApp = RecipeBoxApp = None
-    BudgetTrackerApp = TerminalGamesApp = AmbientSoundApp = None
-    ScreenOrganizerApp = ThemePreviewApp = None
-
 try:
     from settings_utils import save_state, load_state
 except Exception:
@@ -246,7 +192,8 @@ def vfs_delete_safe(path: str):
 
 # Worker threads for long ops
 
-class WorkerThread(QThread):
+class WorkerThread(QObject):
+    """fn(progress, status, *args, **kwargs) on the shared task executor; finished gets the result or exception."""
     progress = pyqtSignal(int)
     finished = pyqtSignal(object)
     status = pyqtSignal(str)
@@ -256,6 +203,10 @@ class WorkerThread(QThread):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.task = None
+
+    def start(self, priority=task_executor.PRIORITY_NORMAL):
+        self.task = task_executor.submit(self.run, priority=priority, name=getattr(self.fn, '__qualname__', None))
 
     def run(self):
         try:
@@ -264,6 +215,22 @@ class WorkerThread(QThread):
         except Exception as e:
             self.finished.emit(e)
 
+    def isRunning(self):
+        return self.task is not None and not self.task.done()
+
+    def cancel(self):
+        if self.task is not None:
+            self.task.cancel()
+
+    def wait(self, msecs=None):
+        if self.task is None:
+            return True
+        try:
+            self.task.result(None if msecs is None else msecs / 1000.0)
+        except Exception:
+            pass
+        return self.task.done()
+
 APPS_LIST = [
     'Notebook','Paint','Explorer','WebBrowser','Settings','WinRAR','Zer3 IDE','Calculator',
     'Cyber Tools','GuardianAV','CMD','RandomChallenge', 'MotivationAIChat', 'JokeGenerator',
@@ -283,6 +250,7 @@ APPS_LIST = [
     'APIRequester','AutomationScript','OCRTool','PodcastManager','EpubReader','ColorGrading',
     'FontPreviewer','IconSetManager','ClipStack','WindowTiler','DesktopSpaces',
     'NetworkSpeedTester','FocusTimer','PasswordGenerator','WallpapersManager',
+    'StallMonitor','Luxxer Apps',
 ]
 
 class MusicPlayerApp(QMainWindow):
@@ -892,6 +860,11 @@ class ScreenRecorderApp(QMainWindow):
 
         self.recording = False
         self.frames = []
+        self._record_task = None
+        self._buffered_bytes = 0
+        self._spill = threading.Event()
+        memory_governor.register("ScreenRecorder frames", self._frame_bytes, self._spill_frames,
+                                 priority=memory_governor.PRIORITY_BUFFER, owner=self)
 
         self.layout.addWidget(QLabel("Screen recording simple demo (saves PNG frames)."))
 
@@ -902,21 +875,65 @@ class ScreenRecorderApp(QMainWindow):
     def toggle(self):
         self.recording = not self.recording
         self.btn.setText("Stop recording" if self.recording else "Start recording")
-        if self.recording:
-            threading.Thread(target=self.record_screen, daemon=True).start()
-        else:
-            self.save_frames()
+        if self.recording and self._record_task is None:
+            # frames are saved by _on_record_stopped once the capture loop has exited
+            self._record_task = task_executor.submit(self.record_screen, owner=self, long_running=True)
+            self._record_task.then(self._on_record_stopped)
 
     def record_screen(self):
-        while self.recording:
-            img = pyautogui.screenshot()
-            self.frames.append(img)
+        pyautogui = _safe_import("pyautogui")
+        if pyautogui is None:
+            return False
+        task = task_executor.current_task()
+        folder = self._new_folder()
+        frames = []
+        saved = 0
+        self._spill.clear()
+        while self.recording and not task.is_cancelled():
+            frame = pyautogui.screenshot()
+            frames.append(frame)
+            self._buffered_bytes += frame.width * frame.height * 3
+            if self._spill.is_set():
+                # memory pressure: move what is buffered to disk and keep recording
+                saved = self._write_frames(folder, frames, saved)
+                frames = []
+                self._buffered_bytes = 0
+                self._spill.clear()
+        self._buffered_bytes = 0
+        return folder, frames, saved
+
+    def _frame_bytes(self):
+        return self._buffered_bytes
+
+    def _spill_frames(self, level):
+        # done by the capture thread after its current frame
+        self._spill.set()
+        return self._buffered_bytes
+
+    def _on_record_stopped(self, result):
+        self._record_task = None
+        self.recording = False
+        self.btn.setText("Start recording")
+        if result is False:
+            QMessageBox.warning(self, "ScreenRecorder", "pyautogui is not installed (pip install pyautogui).")
+            return
+        folder, self.frames, saved = result
+        self.save_frames(folder, saved)
 
-    def save_frames(self):
-        folder = os.path.join(tempfile.gettempdir(), f"luxxer_rec_{int(datetime.datetime.now().timestamp())}")
+    @staticmethod
+    def _new_folder():
+        return os.path.join(tempfile.gettempdir(), f"luxxer_rec_{int(datetime.datetime.now().timestamp())}")
+
+    @staticmethod
+    def _write_frames(folder, frames, first=0):
         os.makedirs(folder, exist_ok=True)
-        for i, frame in enumerate(self.frames):
+        for i, frame in enumerate(frames, first):
             frame.save(os.path.join(folder, f"frame_{i}.png"))
+        return first + len(frames)
+
+    def save_frames(self, folder=None, first=0):
+        folder = folder or self._new_folder()
+        self._write_frames(folder, self.frames, first)
         self.frames = []
         QMessageBox.information(self, "Saved", f"Frames saved to {folder}")
 
@@ -961,8 +978,12 @@ class VideoEditorApp(QMainWindow):
     def load_video(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open video", "", "Videos (*.mp4 *.mkv *.avi *.mov)")
         if path:
+            editor = _safe_import("moviepy.editor")
+            if editor is None:
+                QMessageBox.warning(self, "Error", "moviepy is not installed (pip install moviepy).")
+                return
             self.video_path = path
-            self.clip = VideoFileClip(path)
+            self.clip = editor.VideoFileClip(path)
             self.start_spin.setMaximum(int(self.clip.duration))
             self.end_spin.setMaximum(int(self.clip.duration))
             self.label.setText(f"Loaded: {os.path.basename(path)} | Duration: {int(self.clip.duration)}s")
@@ -990,6 +1011,8 @@ class VideoEditorApp(QMainWindow):
             QMessageBox.warning(self, "Error", "Load a video first.")
 
 class ImageEditorProApp(QMainWindow):
+    MAX_HISTORY = 20
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ImageEditorPro - Luxxer")
@@ -1041,10 +1064,23 @@ class ImageEditorProApp(QMainWindow):
 
         self.current_image = None
         self.history = []  # lista za undo
+        memory_governor.register("ImageEditorPro undo", self._history_bytes, self._trim_history,
+                                 priority=memory_governor.PRIORITY_HISTORY, owner=self)
 
     def push_history(self):
         if self.current_image:
             self.history.append(self.current_image.copy())
+            del self.history[:-self.MAX_HISTORY]
+
+    def _history_bytes(self):
+        return sum(memory_governor.pixmap_bytes(pm) for pm in self.history)
+
+    def _trim_history(self, level):
+        # keep the last few undo steps while memory is low, none when critical
+        if level >= memory_governor.LEVEL_CRITICAL:
+            self.history.clear()
+        else:
+            del self.history[:-3]
 
     def load_image(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Image", "", "Images (*.png *.jpg *.bmp)")
@@ -1619,13 +1655,19 @@ class BackupRestoreApp(QMainWindow):
             if not save_path:
                 return
 
-            with tarfile.open(save_path, "w:gz") as tar:
-                tar.add(src_dir, arcname=os.path.basename(src_dir))
-
-            QMessageBox.information(self, "Backup", f"Backup created at:\n{save_path}")
+            # same engine as `python -m luxxer backup`
+            self._target = save_path
+            task = task_executor.submit(engines.create_backup, src_dir, save_path, owner=self)
+            task.then(self._on_backup_done, self._on_backup_failed)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Backup failed:\n{e}")
 
+    def _on_backup_done(self, _count):
+        QMessageBox.information(self, "Backup", f"Backup created at:\n{self._target}")
+
+    def _on_backup_failed(self, e):
+        QMessageBox.warning(self, "Error", f"Backup failed:\n{e}")
+
     def restore_backup(self):
         try:
             path, _ = QFileDialog.getOpenFileName(
@@ -1637,13 +1679,18 @@ class BackupRestoreApp(QMainWindow):
             if not restore_dir:
                 return
 
-            with tarfile.open(path, "r:gz") as tar:
-                tar.extractall(path=restore_dir)
-
-            QMessageBox.information(self, "Restore", f"Backup restored to:\n{restore_dir}")
+            self._target = restore_dir
+            task = task_executor.submit(engines.restore_backup, path, restore_dir, owner=self)
+            task.then(self._on_restore_done, self._on_restore_failed)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Restore failed:\n{e}")
 
+    def _on_restore_done(self, _count):
+        QMessageBox.information(self, "Restore", f"Backup restored to:\n{self._target}")
+
+    def _on_restore_failed(self, e):
+        QMessageBox.warning(self, "Error", f"Restore failed:\n{e}")
+
 class DiskCleanerApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -1946,9 +1993,10 @@ class NetworkMonitorApp(QMainWindow):
         l.addWidget(self.refresh_btn)
 
         # Timer for real-time refresh
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh_interfaces)
         self.timer.start(2000) # refresh
+        power_manager.register_timer(self.timer, owner=self)
 
         self.refresh_interfaces()
 
@@ -1964,8 +2012,6 @@ class NetworkMonitorApp(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Cannot fetch interfaces: {e}")
 
-import requests
-
 class VPNClientApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -2000,11 +2046,13 @@ class VPNClientApp(QMainWindow):
         self.ip_label = QLabel("Current IP: Unknown")
         l.addWidget(self.ip_label)
 
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_status)
+        power_manager.register_timer(self.timer, owner=self)
 
         self.connected = False
         self.vpn_server = None
+        self._status_task = None
 
     def connect_vpn(self):
         server = self.server_input.text().strip()
@@ -2033,12 +2081,21 @@ class VPNClientApp(QMainWindow):
     def update_status(self):
         if not self.connected or not self.vpn_server:
             return
+        # non-blocking; skip this tick if the previous lookup is still running
+        if self._status_task is None or self._status_task.done():
+            self._status_task = async_loop.run(self._update_status(), owner=self)
 
+    async def _update_status(self):
         try:
-            ip = requests.get("https://api.ipify.org").text.strip()
+            response = (await async_loop.fetch("https://api.ipify.org", timeout=10)).raise_for_status()
+            ip = (await response.text()).strip()
+            if not self.connected:
+                return
             self.status_label.setText(f"Status: Connected to {self.vpn_server}")
             self.ip_label.setText(f"Current IP: {ip}")
         except Exception as e:
+            if not self.connected:
+                return
             self.status_label.setText("Status: Connection error")
             self.ip_label.setText("Current IP: Unknown")
 
@@ -2091,8 +2148,6 @@ class RemoteDesktopApp(QMainWindow):
         self.status_label.setText("Status: Disconnected")
         QMessageBox.information(self, "RemoteDesktop", "Disconnected")
 
-import paramiko
-
 class SSHClientApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -2134,6 +2189,7 @@ class SSHClientApp(QMainWindow):
 
         self.ssh_client = None
         self.transport = None
+        self._reader = None
 
     def connect_ssh(self):
         host = self.host_input.text().strip()
@@ -2144,6 +2200,11 @@ class SSHClientApp(QMainWindow):
             QMessageBox.warning(self, "SSHClient", "Enter host, username, and password")
             return
 
+        paramiko = _safe_import("paramiko")
+        if paramiko is None:
+            QMessageBox.warning(self, "SSHClient", "paramiko is not installed (pip install paramiko).")
+            return
+
         try:
             self.ssh_client = paramiko.SSHClient()
             self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -2156,21 +2217,29 @@ class SSHClientApp(QMainWindow):
             self.transport = self.ssh_client.get_transport().open_session()
             self.transport.get_pty()
             self.transport.invoke_shell()
+            # wake up regularly so disconnecting / closing the window stops the reader
+            self.transport.settimeout(0.5)
 
-            threading.Thread(target=self.read_output, daemon=True).start()
+            self._reader = task_executor.submit(self.read_output, self.transport, owner=self, long_running=True)
 
         except Exception as e:
             QMessageBox.critical(self, "SSHClient", f"Connection failed: {e}")
 
-    def read_output(self):
-        while True:
-            if self.transport is None or self.transport.closed:
+    def read_output(self, transport):
+        task = task_executor.current_task()
+        while not task.is_cancelled() and not transport.closed:
+            try:
+                data = transport.recv(1024)
+            except socket.timeout:
+                continue
+            if not data:
                 break
-            data = self.transport.recv(1024).decode("utf-8")
-            if data:
-                self.output_area.append(data)
+            run_in_main(self.output_area.append, data.decode("utf-8", errors="replace"), owner=self)
 
     def disconnect_ssh(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
         if self.ssh_client:
             self.ssh_client.close()
             self.ssh_client = None
@@ -2202,27 +2271,43 @@ class PortScannerApp(QMainWindow):
         self.results_list = QListWidget()
         l.addWidget(self.results_list)
 
+        self._scan = None
+
     def scan_ports(self):
         host = self.host_input.text().strip()
         if not host:
             QMessageBox.warning(self, "PortScanner", "Enter host IP first")
             return
+        if self._scan is not None:
+            self._scan.cancel()
 
         self.results_list.clear()
         QMessageBox.information(self, "PortScanner", f"Scanning {host}...")
 
+        def progress(done, total, port):
+            task_executor.check_cancelled()
+            task_executor.report_progress(done * 100 // total, f"port {port}")
+
         def do_scan():
-            for port in range(1, 1025):  # scanning common ports (1–1024)
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(0.5)
-                result = sock.connect_ex((host, port))
-                if result == 0:
-                    self.results_list.addItem(f"Port {port}: OPEN")
-                sock.close()
+            # common ports (1-1024), same engine as `python -m luxxer portscan`
+            engines.scan_ports(host, range(1, 1025), progress=progress,
+                               on_open=lambda port: run_in_main(self.results_list.addItem, f"Port {port}: OPEN", owner=self))
+
+        # bound methods, so nothing is delivered once the window is gone
+        self._scan = task = task_executor.submit(do_scan, owner=self)
+        task.progress.connect(self._on_scan_progress)
+        task.then(self._on_scan_done, self._on_scan_failed)
 
-            self.results_list.addItem("Scan complete.")
+    def _on_scan_progress(self, value, _message):
+        self.scan_btn.setText(f"Scanning... {value}%")
 
-        threading.Thread(target=do_scan, daemon=True).start()
+    def _on_scan_done(self, _result):
+        self.scan_btn.setText("Scan Ports")
+        self.results_list.addItem("Scan complete.")
+
+    def _on_scan_failed(self, e):
+        self.scan_btn.setText("Scan Ports")
+        self.results_list.addItem(f"Scan failed: {e}")
 
 class ClipboardManagerApp(QMainWindow):
     def __init__(self):
@@ -2321,10 +2406,7 @@ class SchedulerApp(QMainWindow):
     def trigger_alarm(self, alarm_time):
         QMessageBox.information(self, "Alarm", f"Alarm fired at {alarm_time.strftime('%H:%M:%S')}!")
 
-import tempfile
 import wave
-import numpy as np
-import sounddevice as sd
 
 class VoiceRecorderApp(QMainWindow):
     def __init__(self):
@@ -2343,8 +2425,13 @@ class VoiceRecorderApp(QMainWindow):
         # Recording state
         self.recording = False
         self.audio_data = []
+        self._audio_lock = threading.Lock()
+        self._wav = None
+        self._has_recording = False
         self.fs = 44100  # Sample rate
         self.temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False).name
+        memory_governor.register("VoiceRecorder audio", self._audio_bytes, self._flush_audio,
+                                 priority=memory_governor.PRIORITY_BUFFER, owner=self)
 
         # Buttons
         self.btn = QPushButton("Start recording")
@@ -2362,8 +2449,18 @@ class VoiceRecorderApp(QMainWindow):
             self.stop_recording()
 
     def start_recording(self):
+        sd = _safe_import("sounddevice")
+        if sd is None or _safe_import("numpy") is None:
+            QMessageBox.warning(self, "VoiceRecorder", "sounddevice and numpy are required (pip install sounddevice numpy).")
+            return
         self.recording = True
-        self.audio_data = []
+        with self._audio_lock:
+            self.audio_data = []
+        # chunks are appended to the WAV as they are flushed, so a long take never sits in memory
+        self._wav = wave.open(self.temp_file, "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)  # 16-bit audio
+        self._wav.setframerate(self.fs)
         self.btn.setText("Stop recording")
         self.stream = sd.InputStream(samplerate=self.fs, channels=1, callback=self.audio_callback)
         self.stream.start()
@@ -2376,22 +2473,40 @@ class VoiceRecorderApp(QMainWindow):
         self.stream.close()
 
         # Save to WAV
-        audio_np = np.concatenate(self.audio_data, axis=0)
-        with wave.open(self.temp_file, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit audio
-            wf.setframerate(self.fs)
-            wf.writeframes((audio_np * 32767).astype(np.int16).tobytes())
+        self._flush_audio()
+        self._wav.close()
+        self._wav = None
+        self._has_recording = True
 
         QMessageBox.information(self, "VoiceRecorder", f"Recording stopped and saved to {self.temp_file}")
 
     def audio_callback(self, indata, frames, time, status):
         if status:
             print(status)
-        self.audio_data.append(indata.copy())
+        with self._audio_lock:
+            self.audio_data.append(indata.copy())
+
+    def _audio_bytes(self):
+        with self._audio_lock:
+            return sum(chunk.nbytes for chunk in self.audio_data)
+
+    def _flush_audio(self, level=None):
+        # write buffered chunks to the open WAV; on stop and under memory pressure
+        if self._wav is None:
+            return 0
+        with self._audio_lock:
+            chunks, self.audio_data = self.audio_data, []
+        if not chunks:
+            return 0
+        np = _safe_import("numpy")
+        audio_np = np.concatenate(chunks, axis=0)
+        self._wav.writeframes((audio_np * 32767).astype(np.int16).tobytes())
+        return audio_np.nbytes
 
     def playback(self):
-        if self.audio_data:
+        if self._has_recording:
+            np = _safe_import("numpy")
+            sd = _safe_import("sounddevice")
             # Load WAV file
             with wave.open(self.temp_file, "rb") as wf:
                 data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
@@ -2571,9 +2686,10 @@ class TaskManagerApp(QMainWindow):
         layout.addLayout(hbox)
 
         # Timer for real-time update
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh)
         self.timer.start(2000)  # every 2 seconds
+        power_manager.register_timer(self.timer, owner=self)
 
         self.refresh()
 
@@ -3288,10 +3404,14 @@ class MailApp(QMainWindow):
         # Drafts
         self.drafts = []
 
+        # IMAP calls block, they run on worker threads one at a time
+        self._mail_task = None
+
         # Auto-refresh
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh_inbox)
         self.timer.start(60000)  # every 60s
+        power_manager.register_timer(self.timer, owner=self)
 
     def login(self):
         email_addr, ok1 = QInputDialog.getText(self, "Login", "Email:")
@@ -3314,33 +3434,50 @@ class MailApp(QMainWindow):
             QMessageBox.warning(self, "Login", "Unknown provider, please modify manually.")
             return
 
+        if self._mail_task is not None and not self._mail_task.done():
+            self._mail_task.cancel()
+        self._mail_task = async_loop.run(self._login(), owner=self)
+
+    async def _login(self):
         try:
             # Test IMAP connection
-            self.imap = imaplib.IMAP4_SSL(self.imap_server)
-            self.imap.login(self.email_address, self.password)
-            QMessageBox.information(self, "Login", "Login successful!")
-            self.refresh_inbox()
+            imap = await async_loop.to_thread(imaplib.IMAP4_SSL, self.imap_server)
+            await async_loop.to_thread(imap.login, self.email_address, self.password)
+            self.imap = imap
         except Exception as e:
-            QMessageBox.warning(self, "Login", f"Failed to login: {e}")
+            run_in_main(QMessageBox.warning, self, "Login", f"Failed to login: {e}", owner=self)
+            return
+        run_in_main(QMessageBox.information, self, "Login", "Login successful!", owner=self)
+        await self._refresh_inbox()
 
     def refresh_inbox(self):
         if not hasattr(self, 'imap'):
             return
+        if self._mail_task is not None and not self._mail_task.done():
+            return
+        self._mail_task = async_loop.run(self._refresh_inbox(), owner=self)
+
+    @staticmethod
+    def _fetch_recent(imap, count=20):
+        imap.select("inbox")
+        status, messages = imap.search(None, "ALL")
+        mails = []
+        for num in messages[0].split()[-count:][::-1]:  # last 20 emails
+            status, data = imap.fetch(num, "(RFC822)")
+            msg = email.message_from_bytes(data[0][1])
+            mails.append({"sender": msg.get("From"), "subject": msg.get("Subject"), "date": msg.get("Date"), "raw": msg})
+        return mails
+
+    async def _refresh_inbox(self):
         try:
-            self.inbox_list.clear()
-            self.inbox = []
-            self.imap.select("inbox")
-            status, messages = self.imap.search(None, "ALL")
-            for num in messages[0].split()[-20:][::-1]:  # last 20 emails
-                status, data = self.imap.fetch(num, "(RFC822)")
-                msg = email.message_from_bytes(data[0][1])
-                sender = msg.get("From")
-                subject = msg.get("Subject")
-                date = msg.get("Date")
-                self.inbox.append({"sender": sender, "subject": subject, "date": date, "raw": msg})
-                self.inbox_list.addItem(f"{date} | {sender} | {subject}")
+            mails = await async_loop.to_thread(self._fetch_recent, self.imap)
         except Exception as e:
-            QMessageBox.warning(self, "Inbox", f"Failed to refresh: {e}")
+            run_in_main(QMessageBox.warning, self, "Inbox", f"Failed to refresh: {e}", owner=self)
+            return
+        self.inbox_list.clear()
+        self.inbox = mails
+        for mail in mails:
+            self.inbox_list.addItem(f"{mail['date']} | {mail['sender']} | {mail['subject']}")
 
     def filter_inbox(self, text):
         self.inbox_list.clear()
@@ -3362,24 +3499,31 @@ class MailApp(QMainWindow):
             if not ok:
                 return
             body = dlg.toPlainText()
-            try:
-                smtp = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                smtp.starttls()
-                smtp.login(self.email_address, self.password)
-                msg = MIMEMultipart()
-                msg['From'] = self.email_address
-                msg['To'] = recipient
-                msg['Subject'] = subject
-                msg.attach(MIMEText(body, 'plain'))
-                smtp.send_message(msg)
-                smtp.quit()
-                QMessageBox.information(self, "Email", "Email sent successfully!")
-            except Exception as e:
-                QMessageBox.warning(self, "Email", f"Failed to send email: {e}")
+            msg = MIMEMultipart()
+            msg['From'] = self.email_address
+            msg['To'] = recipient
+            msg['Subject'] = subject
+            msg.attach(MIMEText(body, 'plain'))
+            async_loop.run(self._send_mail(msg), owner=self)
 
         dlg.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         dlg.customContextMenuRequested.connect(lambda _: send_mail())
 
+    def _smtp_send(self, msg):
+        smtp = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        smtp.starttls()
+        smtp.login(self.email_address, self.password)
+        smtp.send_message(msg)
+        smtp.quit()
+
+    async def _send_mail(self, msg):
+        try:
+            await async_loop.to_thread(self._smtp_send, msg)
+        except Exception as e:
+            run_in_main(QMessageBox.warning, self, "Email", f"Failed to send email: {e}", owner=self)
+            return
+        run_in_main(QMessageBox.information, self, "Email", "Email sent successfully!", owner=self)
+
 # Worker to run commands in a separate thread
 class CmdWorker(QThread):
     output = pyqtSignal(str)
@@ -3678,6 +3822,9 @@ class CyberToolsApp(QMainWindow):
         self.hash_btn = QPushButton(tr("run"))
         self.hash_btn.clicked.connect(self._hash_run)
         hl.addWidget(self.hash_btn)
+        self.hash_file_btn = QPushButton("File...")
+        self.hash_file_btn.clicked.connect(self._hash_file)
+        hl.addWidget(self.hash_file_btn)
         l.addLayout(hl)
         l.addWidget(QLabel(tr("about") + ":"))
         self.hash_out = QLineEdit()
@@ -3694,6 +3841,19 @@ class CyberToolsApp(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Hash error", str(e))
 
+    def _hash_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Hash file")
+        if not path:
+            return
+        # read in chunks off the GUI thread, same engine as `python -m luxxer hash`
+        self.hash_out.setText(f"Hashing {os.path.basename(path)}...")
+        task = task_executor.submit(engines.hash_file, path, self.hash_algo.text() or "sha256", owner=self)
+        task.then(self.hash_out.setText, self._on_hash_failed)
+
+    def _on_hash_failed(self, e):
+        self.hash_out.clear()
+        QMessageBox.warning(self, "Hash error", str(e))
+
     def _build_hash_compare_panel(self):
         p = QWidget(); l = QVBoxLayout(); p.setLayout(l)
         row = QHBoxLayout()
@@ -4339,26 +4499,15 @@ class GuardianAVApp(QMainWindow):
     def scan(self):
         self.progress.setValue(0)
         self.out.clear()
-        signatures = ['BAD_SIGNATURE', 'MALWARE', 'EICAR']
-        # simulate scanning virtual fs
-        entries = []
-        def rec(node, path=''):
-            for k,v in node.items():
-                if isinstance(v, dict):
-                    rec(v, f'{path}/{k}')
-                else:
-                    entries.append((f'{path}/{k}', v))
-        rec(APP_STATE['files'])
-        total = len(entries) or 1
-        found = []
-        for i, (p, content) in enumerate(entries):
-            self.progress.setValue(int(100*(i+1)/total))
+        # scan the virtual fs, same engine as `python -m luxxer avscan`
+        entries = engines.vfs_entries(APP_STATE['files'])
+
+        def progress(done, total, p):
+            self.progress.setValue(int(100*done/total))
             self.out.append(f'Scanning {p}...')
-            time.sleep(0.15)
-            for sig in signatures:
-                if sig in str(content):
-                    self.out.append(f'Found signature {sig} in {p}!')
-                    found.append((p,sig))
+
+        found = engines.av_scan(entries, progress=progress,
+                                on_found=lambda p, sig: self.out.append(f'Found signature {sig} in {p}!'))
         if not found:
             self.out.append('No threats found in Virtual FS (mock scan).')
         else:
@@ -4397,10 +4546,15 @@ class WinRarApp(QMainWindow):
         dest, _ = QFileDialog.getSaveFileName(self, 'Save archive', '', 'Zip Files (*.zip)')
         if not dest:
             return
-        base = os.path.splitext(dest)[0]
-        shutil.make_archive(base, 'zip', os.path.dirname(src), os.path.basename(src))
+        task = task_executor.submit(engines.create_zip, src, dest, owner=self)
+        task.then(self._on_archive_done, self._on_archive_failed)
+
+    def _on_archive_done(self, _path):
         QMessageBox.information(self, 'Done', 'Archive created (zip)')
 
+    def _on_archive_failed(self, e):
+        QMessageBox.warning(self, 'Error', f'Archive failed: {e}')
+
 APP_STATE = {}
 APP_STATE.setdefault('settings', {'lang': 'en', 'username': 'user'})
 
@@ -4556,9 +4710,11 @@ class Taskbar(QWidget):
         h.addWidget(self.time_label)
 
         # Update timer
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_taskbar)
         self.timer.start(1000)
+        # the clock shows minutes, a few seconds late is fine while idle
+        power_manager.register_timer(self.timer, idle_interval=15000, owner=self)
 
     def update_taskbar(self):
         self.cpu_bar.setValue(int(psutil.cpu_percent()))
@@ -4756,35 +4912,32 @@ def instantiate_app_widget(app_class):
     l.addWidget(QLabel(str(inst)))
     return w
 
+def _make_placeholder_class(name):
+    # derive candidate class name (remove spaces/punct)
+    class_base = ''.join(ch for ch in name if ch.isalnum())
+    class_name = f"{class_base}App"
+
+    def __init__(self):
+        QWidget.__init__(self)
+        self.setWindowTitle(name)
+        layout = QVBoxLayout(self)
+        lbl = QLabel(f"{name}\n(placeholder)")
+        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lbl.setWordWrap(True)
+        layout.addWidget(lbl)
+        self.setMinimumSize(480, 320)
+
+    new_cls = type(class_name, (QWidget,), {"__init__": __init__})
+    print(f"[placeholder] Created {class_name} for '{name}'")
+    return new_cls
+
 def create_placeholders(app_names):
+    # apps without a registry entry get a placeholder, built lazily on first launch
     for name in app_names:
-        # derive candidate class name (remove spaces/punct)
-        class_base = ''.join(ch for ch in name if ch.isalnum())
-        class_name = f"{class_base}App"
-
-        if class_name in globals() and isinstance(globals()[class_name], type):
-            # real class provided elsewhere — keep it
+        if name in APP_MAPPING:
+            # real app registered elsewhere — keep it
             continue
-
-        # create placeholder widget class
-        def make_init(disp):
-            def __init__(self):
-                super().__init__()
-                self.setWindowTitle(disp)
-                layout = QVBoxLayout(self)
-                lbl = QLabel(f"{disp}\n(placeholder)")
-                lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                lbl.setWordWrap(True)
-                layout.addWidget(lbl)
-                self.setMinimumSize(480, 320)
-            return __init__
-
-        new_cls = type(class_name, (QWidget,), {"__init__": make_init(name)})
-        globals()[class_name] = new_cls
-        print(f"[placeholder] Created {class_name} for '{name}'")
-
-# create placeholder classes now (won't override real ones if present)
-create_placeholders(APPS_LIST)
+        APP_MAPPING.register_placeholder(name)
 
 try:
     import screeninfo
@@ -4809,43 +4962,42 @@ def safe_save_text(parent, title: str, default_name: str, text: str):
 
 def safe_run_command(parent, command: str, callback_stdout=None, shell=False):
     def runner(cmd):
-        try:
-            if isinstance(cmd, str) and not shell:
-                parts = shlex.split(cmd)
-            else:
-                parts = cmd
-            # Popen with text mode to get str output
-            proc = subprocess.Popen(parts, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, shell=shell)
-            out_lines = []
-            # stream output while running
-            for line in proc.stdout:
-                out_lines.append(line)
-            proc.wait()
-            output = "".join(out_lines)
-            if callback_stdout:
-                try:
-                    # call back on main thread via Qt: show via simple invocation
-                    callback_stdout(output)
-                except Exception:
-                    print("[safe_run_command] callback failed")
-            else:
-                # fallback: show message box on main thread using queued call
-                def show_result():
-                    QMessageBox.information(parent, f"Command finished", output or "(no output)")
-                try:
-                    # if parent is a QWidget, use its thread to schedule; simple call is OK here
-                    show_result()
-                except Exception:
-                    print("[safe_run_command] could not show result")
-        except Exception as e:
-            traceback.print_exc()
+        if isinstance(cmd, str) and not shell:
+            parts = shlex.split(cmd)
+        else:
+            parts = cmd
+        # Popen with text mode to get str output
+        proc = subprocess.Popen(parts, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, shell=shell)
+        out_lines = []
+        # stream output while running
+        for line in proc.stdout:
+            if task_executor.current_task().is_cancelled():
+                proc.kill()
+                break
+            out_lines.append(line)
+        proc.wait()
+        return "".join(out_lines)
+
+    # callback / message boxes run on the GUI thread, never in the runner
+    def on_output(output):
+        if callback_stdout:
             try:
-                QMessageBox.warning(parent, "Run failed", f"Failed to run command: {e}")
+                callback_stdout(output)
             except Exception:
-                print("[safe_run_command] failed to report:", e)
+                print("[safe_run_command] callback failed")
+                traceback.print_exc()
+        else:
+            QMessageBox.information(parent, "Command finished", output or "(no output)")
 
-    t = threading.Thread(target=runner, args=(command,), daemon=True)
-    t.start()
+    def on_error(e):
+        try:
+            QMessageBox.warning(parent, "Run failed", f"Failed to run command: {e}")
+        except Exception:
+            print("[safe_run_command] failed to report:", e)
+
+    task = task_executor.submit(runner, command, owner=parent if isinstance(parent, QObject) else None,
+                                long_running=True)
+    return task.then(on_output, on_error)
 
 class SafeApp(QWidget):
     def __init__(self, app_name: str = "Unknown App"):
@@ -4881,48 +5033,32 @@ class SafeApp(QWidget):
             except Exception:
                 pass
 
-# DockButton
-class DockButton(QPushButton):
-    def __init__(self, name, base_size=56):
-        super().__init__(name[0].upper() if name else '?')
-        self.full_name = name
-        self.base_size = int(base_size)
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+# Dock items
+class DockItem:
+    """One dock entry. It has no widget of its own; DockStrip lays it out, paints and hit-tests it."""
 
-        # drag helpers
-        self._drag_start_pos = None
+    # a deployment can add thousands of these
+    __slots__ = ('name', 'glyph', 'icon', 'on_click', 'base_size', 'scale',
+                 '_target_scale', '_min_scale', '_max_scale')
+
+    def __init__(self, name, base_size=56, icon=None, on_click=None):
+        self.name = name
+        self.glyph = name[0].upper() if name else '?'
+        self.icon = icon
+        self.on_click = on_click
+        self.base_size = int(base_size)
 
         # scale management
-        self._scale = 1.0
+        self.scale = 1.0
         self._target_scale = 1.0
         self._min_scale = 0.9
         self._max_scale = 1.8
-        self.setFixedSize(self.base_size, self.base_size)
-        self.setToolTip(name)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        # default style
-        self._apply_style(self.base_size)
-
-    def _apply_style(self, size_px):
-        font_px = max(10, int(size_px * 0.36))
-        border_radius = int(size_px * 0.18)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(0,0,0,0.65);
-                color: white;
-                font-weight: 700;
-                font-size: {font_px}px;
-                border-radius: {border_radius}px;
-                border: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255,255,255,0.06);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(255,255,255,0.04);
-            }}
-        """)
+
+    def size(self):
+        return max(12, int(round(self.base_size * self.scale)))
+
+    def at_rest(self):
+        return self.scale == 1.0 and self._target_scale == 1.0
 
     def set_scale_limits(self, min_s, max_s):
         self._min_scale = min_s
@@ -4932,56 +5068,302 @@ class DockButton(QPushButton):
         self._target_scale = max(self._min_scale, min(self._max_scale, s))
 
     def step_towards_target(self, smooth=0.22):
-        ds = (self._target_scale - self._scale) * smooth
+        ds = (self._target_scale - self.scale) * smooth
         if abs(ds) < 0.001:
-            if abs(self._target_scale - self._scale) > 0.0001:
-                self._scale = self._target_scale
-                self._apply_scale()
+            if abs(self._target_scale - self.scale) > 0.0001:
+                self.scale = self._target_scale
                 return True
             return False
-        self._scale += ds
-        self._apply_scale()
+        self.scale += ds
         return True
 
-    def _apply_scale(self):
-        ns = max(12, int(round(self.base_size * self._scale)))
-        self.setFixedSize(ns, ns)
-        self._apply_style(ns)
-
     def reset_scale(self):
-        self._target_scale = 1.0
+        self.scale = self._target_scale = 1.0
+
+
+# DockStrip
+class DockStrip(QWidget):
+    """Paints the dock's visible items in one paintEvent; clicks, tooltips and drags are hit-tested by geometry.
+
+    Items at rest all have the dock's base size, so item i sits at
+    MARGIN + i * pitch plus the extra width of the few magnified items
+    before it; layout, hit-testing and painting only ever touch the items
+    in view or magnified, however many entries the dock holds."""
+
+    MARGIN = 10
+    # item pixmaps are cached in QPixmapCache per SIZE_BUCKET px of size, so an
+    # animation frame is a few drawPixmap() calls instead of a stylesheet per button
+    SIZE_BUCKET = 4
+
+    STATE_NORMAL = 0
+    STATE_HOVER = 1
+    STATE_PRESSED = 2
+    BACKGROUNDS = {STATE_NORMAL: QColor(0, 0, 0, 166), STATE_HOVER: QColor(255, 255, 255, 15),
+                   STATE_PRESSED: QColor(255, 255, 255, 10)}
+
+    def __init__(self, dock, spacing=8):
+        super().__init__()
+        self.dock = dock
+        self.spacing = int(spacing)
+        self.setMouseTracking(True)
+        # type-to-filter once the dock was clicked
+        self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+
+        # layout: indices of magnified items (sorted) and the running sum of their extra width
+        self.active = []
+        self._extra = [0]
+        self.x0 = 0
+        self._rest_width = 0
+        self._content_width = 0
+
+        self._hover = -1
+        self._pressed = -1
+        self._press_pos = None
+
+    @property
+    def view(self):
+        return self.dock.view
+
+    # Layout
+
+    def set_active(self, indices):
+        """Indices of the items not at their base size; call after scales changed."""
+        self.active = sorted(indices)
+        base = self.dock.base_btn_size
+        extra = [0]
+        for i in self.active:
+            extra.append(extra[-1] + self.view[i].size() - base)
+        self._extra = extra
+        self.relayout()
+
+    def relayout(self):
+        count = len(self.view)
+        pitch = self.dock.base_btn_size + self.spacing
+        self._rest_width = 2 * self.MARGIN + max(0, count * pitch - self.spacing)
+        width = self._rest_width + self._extra[-1]
+        if width != self._content_width:
+            self._content_width = width
+            # one resize of this widget; the scroll area picks it up
+            self.setMinimumWidth(width)
+        self._place()
+
+    def _place(self):
+        # centred on the resting width, so magnified items don't slide the whole
+        # row, but never pushed past the right edge
+        self.x0 = max(0, min((self.width() - self._rest_width) // 2, self.width() - self._content_width))
+
+    def resizeEvent(self, ev):
+        self._place()
+        super().resizeEvent(ev)
+
+    def item_left(self, index):
+        pitch = self.dock.base_btn_size + self.spacing
+        return self.x0 + self.MARGIN + index * pitch + self._extra[bisect.bisect_left(self.active, index)]
+
+    def item_rect(self, index):
+        size = self.view[index].size()
+        return QRect(self.item_left(index), (self.height() - size) // 2, size, size)
+
+    def index_near(self, x):
+        """The last item starting at or before x (clamped to the view)."""
+        lo, hi = 0, len(self.view) - 1
+        if hi < 0:
+            return -1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.item_left(mid) <= x:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def index_at(self, pos):
+        i = self.index_near(pos.x())
+        if i >= 0 and self.item_rect(i).contains(pos):
+            return i
+        return -1
+
+    # Painting
+
+    def _state(self, index):
+        if index == self._pressed and index == self._hover:
+            return self.STATE_PRESSED
+        return self.STATE_HOVER if index == self._hover else self.STATE_NORMAL
+
+    def item_pixmap(self, item, size, state=STATE_NORMAL):
+        bucket = max(12, int(round(size / self.SIZE_BUCKET)) * self.SIZE_BUCKET)
+        dpr = self.devicePixelRatioF()
+        key = f"dock:{item.icon or item.glyph}:{bucket}:{state}:{dpr}"
+        pix = QPixmapCache.find(key)
+        if pix is None or pix.isNull():
+            pix = self._render_item(item, bucket, state, dpr)
+            QPixmapCache.insert(key, pix)
+        return pix
+
+    def _render_item(self, item, size, state, dpr):
+        pix = QPixmap(int(size * dpr), int(size * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(self.BACKGROUNDS[state])
+        radius = int(size * 0.18)
+        p.drawRoundedRect(QRectF(0, 0, size, size), radius, radius)
+        icon = QIcon(item.icon) if item.icon and os.path.exists(item.icon) else None
+        if icon is not None and not icon.isNull():
+            inner = int(size * 0.64)
+            offset = (size - inner) // 2
+            icon.paint(p, QRect(offset, offset, inner, inner))
+        else:
+            font = QFont(self.font())
+            font.setBold(True)
+            font.setPixelSize(max(10, int(size * 0.36)))
+            p.setFont(font)
+            p.setPen(QColor('white'))
+            p.drawText(QRect(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, item.glyph)
+        p.end()
+        return pix
+
+    def paintEvent(self, ev):
+        view = self.view
+        if not view:
+            return
+        clip = ev.rect()
+        p = QPainter(self)
+        # only the items inside the exposed rect
+        for i in range(max(0, self.index_near(clip.left())), len(view)):
+            left = self.item_left(i)
+            if left > clip.right():
+                break
+            item = view[i]
+            size = item.size()
+            pix = self.item_pixmap(item, size, self._state(i))
+            # the bucket pixmap is centred on the item's exact box
+            logical = pix.width() / pix.devicePixelRatio()
+            p.drawPixmap(QPointF(left + (size - logical) / 2, (self.height() - logical) / 2), pix)
+        p.end()
+
+    # Input
+
+    def reset_input(self):
+        self._hover = self._pressed = -1
+        self._press_pos = None
+        self.unsetCursor()
+
+    def _set_hover(self, index):
+        if index == self._hover:
+            return
+        for i in (self._hover, index):
+            if 0 <= i < len(self.view):
+                self.update(self.item_rect(i))
+        self._hover = index
+        if index >= 0:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.unsetCursor()
 
     def mousePressEvent(self, ev):
-        if ev.button() == Qt.MouseButton.LeftButton:
-            self._drag_start_pos = ev.pos()
+        index = self.index_at(ev.pos())
+        if ev.button() == Qt.MouseButton.LeftButton and index >= 0:
+            self._pressed = index
+            self._press_pos = ev.pos()
+            self.update(self.item_rect(index))
+            ev.accept()
+            return
         super().mousePressEvent(ev)
 
     def mouseMoveEvent(self, ev):
+        self._set_hover(self.index_at(ev.pos()))
         # start drag if moved beyond threshold
-        if ev.buttons() & Qt.MouseButton.LeftButton and self._drag_start_pos is not None:
-            if (ev.pos() - self._drag_start_pos).manhattanLength() > QApplication.startDragDistance():
-                try:
-                    mime = QMimeData()
-                    mime.setText(self.full_name)
-                    # include a pixmap snapshot so desktop can show same icon
-                    pix = self.grab()
-                    if not pix.isNull():
-                        # attach image data to mime
-                        mime.setImageData(pix.toImage())
-                    drag = QDrag(self)
-                    drag.setMimeData(mime)
-                    # set feedback pixmap (scaled a bit)
-                    small = pix.scaled(max(24, pix.width()//2), max(24, pix.height()//2),
-                                       Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    drag.setPixmap(small)
-                    # Use CopyAction — dock -> desktop should create a shortcut (copy)
-                    drag.exec(Qt.DropAction.CopyAction)
-                except Exception:
-                    traceback.print_exc()
+        if ev.buttons() & Qt.MouseButton.LeftButton and self._pressed >= 0 and self._press_pos is not None:
+            if (ev.pos() - self._press_pos).manhattanLength() > QApplication.startDragDistance():
+                index, self._pressed, self._press_pos = self._pressed, -1, None
+                self._start_drag(index)
+        # the dock tracks the cursor for magnification
         super().mouseMoveEvent(ev)
 
+    def mouseReleaseEvent(self, ev):
+        index, self._pressed, self._press_pos = self._pressed, -1, None
+        if 0 <= index < len(self.view):
+            self.update(self.item_rect(index))
+            if ev.button() == Qt.MouseButton.LeftButton and self.index_at(ev.pos()) == index:
+                self._activate(index)
+            ev.accept()
+            return
+        super().mouseReleaseEvent(ev)
+
+    def leaveEvent(self, ev):
+        self._set_hover(-1)
+        super().leaveEvent(ev)
+
+    def keyPressEvent(self, ev):
+        key = ev.key()
+        text = ev.text()
+        no_mods = not (ev.modifiers() & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.AltModifier))
+        if key == Qt.Key.Key_Escape and self.dock.filter_text:
+            self.dock.set_filter("")
+        elif key == Qt.Key.Key_Backspace and self.dock.filter_text:
+            self.dock.set_filter(self.dock.filter_text[:-1])
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and self.dock.filter_text and self.view:
+            self._activate(0)
+        elif text and text.isprintable() and no_mods and (text != " " or self.dock.filter_text):
+            self.dock.set_filter(self.dock.filter_text + text)
+        else:
+            super().keyPressEvent(ev)
+            return
+        ev.accept()
+
+    def event(self, ev):
+        if ev.type() == QEvent.Type.ToolTip:
+            index = self.index_at(ev.pos())
+            if index >= 0:
+                QToolTip.showText(ev.globalPos(), self.view[index].name, self, self.item_rect(index))
+            else:
+                QToolTip.hideText()
+                ev.ignore()
+            return True
+        return super().event(ev)
+
+    def _activate(self, index):
+        item = self.view[index]
+        # a launch ends the search
+        if self.dock.filter_text:
+            self.dock.set_filter("")
+        try:
+            if item.on_click is not None:
+                item.on_click()
+            else:
+                self.dock._launch_safe(item.name)
+        except Exception:
+            traceback.print_exc()
+
+    def _start_drag(self, index):
+        try:
+            item = self.view[index]
+            mime = QMimeData()
+            mime.setText(item.name)
+            # include a pixmap snapshot so desktop can show same icon
+            pix = self.item_pixmap(item, item.size())
+            if not pix.isNull():
+                mime.setImageData(pix.toImage())
+            drag = QDrag(self)
+            drag.setMimeData(mime)
+            # set feedback pixmap (scaled a bit)
+            small = pix.scaled(max(24, pix.width()//2), max(24, pix.height()//2),
+                               Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            drag.setPixmap(small)
+            # Use CopyAction — dock -> desktop should create a shortcut (copy)
+            drag.exec(Qt.DropAction.CopyAction)
+        except Exception:
+            traceback.print_exc()
+
 # BottomDock
 class BottomDock(QScrollArea):
+    # True while the magnification timer runs, False once every button is at rest
+    animating = pyqtSignal(bool)
+
     def __init__(self, main_ref, apps_list, base_btn_size=56, max_scale=1.8, influence=140, spacing=8):
         super().__init__()
         self.setObjectName('bottom_dock')
@@ -4997,36 +5379,109 @@ class BottomDock(QScrollArea):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setFixedHeight(self.base_btn_size + 22)
 
-        # Container for buttons
-        self.container = QWidget()
-        self.layout = QHBoxLayout(self.container)
-        self.layout.setContentsMargins(10, 6, 10, 6)
-        self.layout.setSpacing(self.spacing)
-        self.setWidget(self.container)
-
-        # Buttons list
-        self.buttons = []
-        for name in apps_list:
-            btn = DockButton(name, self.base_btn_size)
-            btn.clicked.connect(lambda checked=False, n=name: self._launch_safe(n))
-            self.layout.addWidget(btn)
-            btn.setMouseTracking(True)
-            btn.set_scale_limits(0.95, self.max_scale)
-            self.buttons.append(btn)
+        # every entry, and the ones matching the typed filter (the same list when there is none)
+        self.items = []
+        self.view = self.items
+        self.filter_text = ""
+
+        # one painted strip shows the view (no widget per app)
+        self.strip = DockStrip(self, self.spacing)
+        self.setWidget(self.strip)
+        self.filter_label = QLabel(self.viewport())
+        self.filter_label.setStyleSheet("background-color: rgba(0,0,0,0.75); color: white; "
+                                        "border-radius: 6px; padding: 2px 8px;")
+        self.filter_label.hide()
+        self.add_apps(apps_list)
 
         # mouse tracking state
         self.setMouseTracking(True)
-        self.container.setMouseTracking(True)
         self._last_pos = None
 
-        # timer-driven smooth updates (~60fps)
+        # smooth updates (~60fps), only while the cursor moves over the dock or
+        # buttons are still growing/shrinking; see _wake() and _on_timer()
+        self.ticks = 0
+        self._animating = False
         self._timer = QTimer(self)
         self._timer.setInterval(16)
         self._timer.timeout.connect(self._on_timer)
-        self._timer.start()
+        power_manager.register_timer(self._timer, stop=True, owner=self)
 
         # smooth scroll animation holder
         self._scroll_anim = None
+        # scrolling moves the buttons under a resting cursor
+        self.horizontalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    def add_apps(self, names):
+        names = list(names)
+        with startup_profiler.span('BottomDock buttons', count=len(names)):
+            for name in names:
+                self._append(DockItem(name, self.base_btn_size))
+            self._items_changed()
+
+    def add_app(self, name, icon=None, on_click=None):
+        """Add one entry; on_click() replaces launch_app(name) when given."""
+        item = self._append(DockItem(name, self.base_btn_size, icon=icon, on_click=on_click))
+        self._items_changed()
+        return item
+
+    def remove_app(self, name):
+        # while strip.active still indexes the old view
+        self._rest_active()
+        self.items = [i for i in self.items if i.name != name]
+        self._items_changed()
+
+    def _append(self, item):
+        item.set_scale_limits(0.95, self.max_scale)
+        self.items.append(item)
+        return item
+
+    def _items_changed(self):
+        self._set_view(self._matching(self.filter_text))
+
+    # Type-to-filter
+
+    def _matching(self, text):
+        needle = text.casefold()
+        if not needle:
+            return self.items
+        return [i for i in self.items if needle in i.name.casefold()]
+
+    def set_filter(self, text):
+        """Show only the entries whose name contains `text` (case-insensitive); "" shows all."""
+        self.filter_text = text
+        self._set_view(self._matching(text))
+        self.horizontalScrollBar().setValue(0)
+        if text:
+            self.filter_label.setText(f"{text}  ({len(self.view)})")
+            self.filter_label.adjustSize()
+            self._place_filter_label()
+            self.filter_label.show()
+            self.filter_label.raise_()
+        else:
+            self.filter_label.hide()
+
+    def _place_filter_label(self):
+        vp = self.viewport()
+        self.filter_label.move(vp.width() - self.filter_label.width() - 8,
+                               (vp.height() - self.filter_label.height()) // 2)
+
+    def _rest_active(self):
+        for i in self.strip.active:
+            if i < len(self.view):
+                self.view[i].reset_scale()
+
+    def _set_view(self, view):
+        # indices change: everything starts again from rest
+        self._rest_active()
+        self.view = view
+        self.strip.reset_input()
+        self.strip.set_active([])
+        self.strip.update()
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        if self.filter_label.isVisible():
+            self._place_filter_label()
 
     def _launch_safe(self, name):
         try:
@@ -5049,16 +5504,39 @@ class BottomDock(QScrollArea):
 
     def enterEvent(self, ev):
         self._update_cursor_local()
+        self._wake()
         super().enterEvent(ev)
 
     def leaveEvent(self, ev):
         self._last_pos = None
+        self._wake()
         super().leaveEvent(ev)
 
     def mouseMoveEvent(self, ev):
         self._update_cursor_local()
+        self._wake()
         super().mouseMoveEvent(ev)
 
+    def _on_scrolled(self, _value):
+        if self._last_pos is not None:
+            self._wake()
+
+    def is_animating(self):
+        return self._timer.isActive()
+
+    def _wake(self):
+        if not self._timer.isActive():
+            self._timer.start()
+        if not self._animating:
+            self._animating = True
+            self.animating.emit(True)
+
+    def _sleep(self):
+        self._timer.stop()
+        if self._animating:
+            self._animating = False
+            self.animating.emit(False)
+
     def wheelEvent(self, ev):
         delta = -ev.angleDelta().y()
         sb = self.horizontalScrollBar()
@@ -5083,43 +5561,58 @@ class BottomDock(QScrollArea):
         self._scroll_anim = anim
 
     def center_button_index(self, index, duration=300):
-        if index < 0 or index >= len(self.buttons):
+        if index < 0 or index >= len(self.view):
             return
-        b = self.buttons[index]
-        btn_center = b.geometry().left() + b.width() // 2
+        btn_center = self.strip.item_left(index) + self.view[index].size() // 2
         viewport_center = self.viewport().width() // 2
         target = btn_center - viewport_center
         self.smooth_scroll_to(target, duration=duration)
 
-    def _on_timer(self):
-        if not self.buttons:
-            return
 
-        if self._last_pos is None:
-            for b in self.buttons:
-                b.set_target_scale(1.0)
-                b.step_towards_target(smooth=0.25)
+    def _on_timer(self):
+        self.ticks += 1
+        view = self.view
+        strip = self.strip
+        if not view:
+            self._sleep()
             return
 
-        px = self._last_pos.x()
-        scroll_val = self.horizontalScrollBar().value()
-        sigma = max(1.0, (self.influence / 3.0))
-        two_sigma_sq = 2.0 * (sigma * sigma)
-
-        for i, b in enumerate(self.buttons):
-            btn_left = b.geometry().left()
-            btn_center_in_self = btn_left - scroll_val + (b.width() // 2)
-            dist = abs(px - btn_center_in_self)
-            if dist < self.influence * 1.6:
-                factor = math.exp(-(dist * dist) / two_sigma_sq)
-            else:
-                factor = 0.0
-            factor = max(0.0, min(1.0, factor))
-            target = 1.0 + (self.max_scale - 1.0) * factor
-            b.set_target_scale(target)
-
-        for b in self.buttons:
-            b.step_towards_target(smooth=0.22)
+        # only the items near the cursor and those still magnified are touched,
+        # so a tick costs the same with ten entries or ten thousand
+        near = range(0)
+        if self._last_pos is not None:
+            px = self._last_pos.x() + self.horizontalScrollBar().value()
+            reach = self.influence * 1.6
+            near = range(strip.index_near(px - reach), strip.index_near(px + reach) + 1)
+            sigma = max(1.0, (self.influence / 3.0))
+            two_sigma_sq = 2.0 * (sigma * sigma)
+            for i in near:
+                b = view[i]
+                dist = abs(px - (strip.item_left(i) + b.size() // 2))
+                if dist < reach:
+                    factor = math.exp(-(dist * dist) / two_sigma_sq)
+                else:
+                    factor = 0.0
+                factor = max(0.0, min(1.0, factor))
+                b.set_target_scale(1.0 + (self.max_scale - 1.0) * factor)
+
+        touched = list(near)
+        for i in strip.active:
+            if i not in near:
+                view[i].set_target_scale(1.0)
+                touched.append(i)
+
+        smooth = 0.25 if self._last_pos is None else 0.22
+        moved = False
+        for i in touched:
+            moved = view[i].step_towards_target(smooth=smooth) or moved
+        if moved:
+            # new sizes: recompute positions and repaint the visible part of the strip
+            strip.set_active([i for i in touched if not view[i].at_rest()])
+            strip.update()
+        else:
+            # cursor resting and every item settled: nothing to do until the next event
+            self._sleep()
 
 class PlaceholderApp(QMainWindow):
     def __init__(self, title: str, desc: str = ""):
@@ -5135,123 +5628,270 @@ class PlaceholderApp(QMainWindow):
         w.setLayout(l)
         self.setCentralWidget(w)
 
-APP_MAPPING = {
-    'Notebook': NotebookApp,
-    'Paint': PaintApp,
-    'Explorer': ExplorerApp,
-    'WebBrowser': WebBrowserApp,
+APP_MAPPING = AppRegistry({
+    'Notebook': 'Luxxer_OS:NotebookApp',
+    'Paint': 'Luxxer_OS:PaintApp',
+    'Explorer': 'Luxxer_OS:ExplorerApp',
+    'WebBrowser': 'apps_extra3:WebBrowserApp',
     'Settings': lambda: SettingsApp(main_win) if 'main_win' in globals() else SettingsApp(None),
-    'GamesApp': GamesApp,
-    'ApplicationAdder': ApplicationAdderApp,
-    'WinRAR': WinRarApp,
-    'Zer3 IDE': Zer3IDE,
-    'Calculator': CalculatorApp,
-    'JokeGenerator': JokeGeneratorApp,
-    'MotivationAIChat': lambda: MotivationAIChat(),
-    'RandomChallenge': RandomChallengeApp,
-    'Cyber Tools': CyberToolsApp,
-    'GuardianAV': GuardianAVApp,
-    'CMD': CmdApp,
-    'TaskManager': TaskManagerApp,
-    'FilePreview': FilePreviewApp,
-    'Calendar': CalendarApp,
-    'Mail': MailApp,
-    'Contacts': ContactsApp,
-    'HackerSimulator': HackerSimulatorApp,
-    'ASCIIPainter': ASCIIPainterApp,
-    'FortuneTeller': FortuneTellerApp,
-    'Photos': PhotosApp,
-    'MusicPlayer': MusicPlayerApp,
-    'VideoPlayer': VideoPlayerApp,
-    'PDFReader': PDFReaderApp,
-    'OfficeWriter': OfficeWriterApp,
-    'Spreadsheet': SpreadsheetApp,
-    'Presentation': PresentationApp,
-    'StickyNotes': StickyNotesApp,
-    'Screenshot': ScreenshotApp,
-    'ScreenRecorder': ScreenRecorderApp,
-    'ImageEditorPro': ImageEditorProApp,
-    'VideoEditor': VideoEditorApp,
-    'MediaConverter': MediaConverterApp,
-    'TerminalEmulator': TerminalEmulatorApp,
-    'ShellX': ShellXApp,
-    'GitClient': GitClientApp,
-    'DockerManager': DockerManagerApp,
-    'PackageManager': PackageManagerApp,
-    'AppStore': AppStoreApp,
-    'BackupRestore': BackupRestoreApp,
-    'DiskCleaner': DiskCleanerApp,
-    'DiskManager': DiskManagerApp,
-    'SystemInfo': SystemInfoApp,
-    'DeviceManager': DeviceManagerApp,
-    'PrinterManager': PrinterManagerApp,
-    'LuxxerWeb': LuxxerWebApp,
-    'NetworkMonitor': NetworkMonitorApp,
-    'VPNClient': VPNClientApp,
-    'RemoteDesktop': RemoteDesktopApp,
-    'SSHClient': SSHClientApp,
-    'PortScanner': PortScannerApp,
-    'WiFiAnalyzer': WiFiAnalyzerApp,
-    'ClipboardManager': ClipboardManagerApp,
-    'Scheduler': SchedulerApp,
-    'VoiceRecorder': VoiceRecorderApp,
-    'HabitTracker': HabitTrackerApp,
-    'Pomodoro': PomodoroApp,
-    'RandomStory': RandomStoryApp,
-    'TravelTips': TravelTipsApp,
-    'QRCodeGenerator': QRCodeGeneratorApp,
-    'ColorPalette': ColorPaletteApp,
-    'RecipeBox': RecipeBoxApp,
-    'BudgetTracker': BudgetTrackerApp,
-    'TerminalGames': TerminalGamesApp,
-    'AmbientSound': AmbientSoundApp,
-    'ScreenOrganizer': ScreenOrganizerApp,
-    'ThemePreview': ThemePreviewApp,
-    'TabbedBrowser': TabbedBrowserApp,
-    'IncognitoBrowser': IncognitoBrowserApp,
-    'ReaderModeBrowser': ReaderModeBrowserApp,
-    'RSSFeedReader': RSSFeedReaderApp,
-    'LocalNotes': LocalNotesApp,
-    'SecureVaultLite': SecureVaultLiteApp,
-    'ImageGallery': ImageGalleryApp,
-    'BatchImageResizer': BatchImageResizerApp,
-    'AudioPlayerPro': AudioPlayerProApp,
-    'VideoStreamPlayer': VideoStreamPlayerApp,
-    'JSONInspector': JSONInspectorApp,
-    'CSVEditorPro': CSVEditorProApp,
-    'SQLiteBrowser': SQLiteBrowserApp,
-    'APIRequester': APIRequesterApp,
-    'AutomationScript': AutomationScriptApp,
-    'OCRTool': OCRToolApp,
-    'PodcastManager': PodcastManagerApp,
-    'EpubReader': EpubReaderApp,
-    'ColorGrading': ColorGradingApp,
-    'FontPreviewer': FontPreviewerApp,
-    'IconSetManager': IconSetManagerApp,
-    'ClipStack': ClipStackApp,
-    'WindowTiler': WindowTilerApp,
-    'DesktopSpaces': DesktopSpacesApp,
-    'NetworkSpeedTester': NetworkSpeedTesterApp,
-    'FocusTimer': FocusTimerApp,
-    'PasswordGenerator': PasswordGeneratorApp,
-    'WallpapersManager': WallpapersManagerApp
-}
+    'GamesApp': 'games_all:GamesApp',
+    'WinRAR': 'Luxxer_OS:WinRarApp',
+    'Zer3 IDE': 'Luxxer_OS:Zer3IDE',
+    'Calculator': 'Luxxer_OS:CalculatorApp',
+    'JokeGenerator': 'JokeGenerator:JokeGeneratorApp',
+    'MotivationAIChat': 'MotivationAIChat:MotivationAIChat',
+    'RandomChallenge': 'RandomChallenge:RandomChallengeApp',
+    'Cyber Tools': 'Luxxer_OS:CyberToolsApp',
+    'GuardianAV': 'Luxxer_OS:GuardianAVApp',
+    'CMD': 'Luxxer_OS:CmdApp',
+    'TaskManager': 'Luxxer_OS:TaskManagerApp',
+    'FilePreview': 'Luxxer_OS:FilePreviewApp',
+    'Calendar': 'Luxxer_OS:CalendarApp',
+    'Mail': 'Luxxer_OS:MailApp',
+    'Contacts': 'Luxxer_OS:ContactsApp',
+    'HackerSimulator': 'apps_extra:HackerSimulatorApp',
+    'ASCIIPainter': 'apps_extra:ASCIIPainterApp',
+    'FortuneTeller': 'apps_extra:FortuneTellerApp',
+    'Photos': 'Luxxer_OS:PhotosApp',
+    'MusicPlayer': 'Luxxer_OS:MusicPlayerApp',
+    'VideoPlayer': 'Luxxer_OS:VideoPlayerApp',
+    'PDFReader': 'Luxxer_OS:PDFReaderApp',
+    'OfficeWriter': 'Luxxer_OS:OfficeWriterApp',
+    'Spreadsheet': 'Luxxer_OS:SpreadsheetApp',
+    'Presentation': 'Luxxer_OS:PresentationApp',
+    'StickyNotes': 'Luxxer_OS:StickyNotesApp',
+    'Screenshot': 'Luxxer_OS:ScreenshotApp',
+    'ScreenRecorder': 'Luxxer_OS:ScreenRecorderApp',
+    'ImageEditorPro': 'Luxxer_OS:ImageEditorProApp',
+    'VideoEditor': 'Luxxer_OS:VideoEditorApp',
+    'MediaConverter': 'Luxxer_OS:MediaConverterApp',
+    'TerminalEmulator': 'Luxxer_OS:TerminalEmulatorApp',
+    'ShellX': 'Luxxer_OS:ShellXApp',
+    'GitClient': 'Luxxer_OS:GitClientApp',
+    'DockerManager': 'Luxxer_OS:DockerManagerApp',
+    'PackageManager': 'Luxxer_OS:PackageManagerApp',
+    'AppStore': 'Luxxer_OS:AppStoreApp',
+    'BackupRestore': 'Luxxer_OS:BackupRestoreApp',
+    'DiskCleaner': 'Luxxer_OS:DiskCleanerApp',
+    'DiskManager': 'Luxxer_OS:DiskManagerApp',
+    'SystemInfo': 'Luxxer_OS:SystemInfoApp',
+    'DeviceManager': 'Luxxer_OS:DeviceManagerApp',
+    'PrinterManager': 'Luxxer_OS:PrinterManagerApp',
+    'LuxxerWeb': 'Luxxer_OS:LuxxerWebApp',
+    'NetworkMonitor': 'Luxxer_OS:NetworkMonitorApp',
+    'VPNClient': 'Luxxer_OS:VPNClientApp',
+    'RemoteDesktop': 'Luxxer_OS:RemoteDesktopApp',
+    'SSHClient': 'Luxxer_OS:SSHClientApp',
+    'PortScanner': 'Luxxer_OS:PortScannerApp',
+    'ClipboardManager': 'Luxxer_OS:ClipboardManagerApp',
+    'Scheduler': 'Luxxer_OS:SchedulerApp',
+    'VoiceRecorder': 'Luxxer_OS:VoiceRecorderApp',
+    'HabitTracker': 'apps_extra2:HabitTrackerApp',
+    'Pomodoro': 'apps_extra2:PomodoroApp',
+    'RandomStory': 'apps_extra2:RandomStoryApp',
+    'TravelTips': 'apps_extra2:TravelTipsApp',
+    'QRCodeGenerator': 'apps_extra2:QRCodeGeneratorApp',
+    'ColorPalette': 'apps_extra2:ColorPaletteApp',
+    'RecipeBox': 'apps_extra2:RecipeBoxApp',
+    'BudgetTracker': 'apps_extra2:BudgetTrackerApp',
+    'TerminalGames': 'apps_extra2:TerminalGamesApp',
+    'AmbientSound': 'apps_extra2:AmbientSoundApp',
+    'ScreenOrganizer': 'apps_extra2:ScreenOrganizerApp',
+    'ThemePreview': 'apps_extra2:ThemePreviewApp',
+    'TabbedBrowser': 'apps_extra3:TabbedBrowserApp',
+    'IncognitoBrowser': 'apps_extra3:IncognitoBrowserApp',
+    'ReaderModeBrowser': 'apps_extra3:ReaderModeBrowserApp',
+    'RSSFeedReader': 'apps_extra3:RSSFeedReaderApp',
+    'LocalNotes': 'apps_extra3:LocalNotesApp',
+    'SecureVaultLite': 'apps_extra3:SecureVaultLiteApp',
+    'ImageGallery': 'apps_extra3:ImageGalleryApp',
+    'BatchImageResizer': 'apps_extra3:BatchImageResizerApp',
+    'AudioPlayerPro': 'apps_extra3:AudioPlayerProApp',
+    'VideoStreamPlayer': 'apps_extra3:VideoStreamPlayerApp',
+    'JSONInspector': 'apps_extra3:JSONInspectorApp',
+    'CSVEditorPro': 'apps_extra3:CSVEditorProApp',
+    'SQLiteBrowser': 'apps_extra3:SQLiteBrowserApp',
+    'APIRequester': 'apps_extra3:APIRequesterApp',
+    'AutomationScript': 'apps_extra3:AutomationScriptApp',
+    'OCRTool': 'apps_extra3:OCRToolApp',
+    'PodcastManager': 'apps_extra3:PodcastManagerApp',
+    'EpubReader': 'apps_extra3:EpubReaderApp',
+    'ColorGrading': 'apps_extra3:ColorGradingApp',
+    'FontPreviewer': 'apps_extra3:FontPreviewerApp',
+    'IconSetManager': 'apps_extra3:IconSetManagerApp',
+    'ClipStack': 'apps_extra3:ClipStackApp',
+    'WindowTiler': 'apps_extra3:WindowTilerApp',
+    'DesktopSpaces': 'apps_extra3:DesktopSpacesApp',
+    'NetworkSpeedTester': 'apps_extra3:NetworkSpeedTesterApp',
+    'FocusTimer': 'apps_extra3:FocusTimerApp',
+    'PasswordGenerator': 'apps_extra3:PasswordGeneratorApp',
+    'WallpapersManager': 'apps_extra3:WallpapersManagerApp',
+    'StallMonitor': 'stall_detector:StallViewerApp',
+    'Luxxer Apps': 'app_accounting:LuxxerAppsMonitor'
+}, aliases={'Luxxer_OS': sys.modules[__name__]}, placeholder=_make_placeholder_class)
+
+# apps in APPS_LIST without a real implementation (e.g. WiFiAnalyzer)
+create_placeholders(APPS_LIST)
+
+DEFAULT_WALLPAPER = "ScreenPhoto2-2560x1440px.png"
+
+class AppSubWindow(QMdiSubWindow):
+    """Subwindow that reports when it is closed, while its app widget still exists
+    (WA_DeleteOnClose deletes both right after)."""
+    closed = pyqtSignal()
+
+    def closeEvent(self, ev):
+        super().closeEvent(ev)
+        if ev.isAccepted():
+            self.closed.emit()
+
+class SessionPlaceholder(QWidget):
+    """Stand-in for an app window restored from the last session; the real app
+    is only constructed when the window is focused, un-minimised or clicked."""
+    load_requested = pyqtSignal()
+
+    def __init__(self, app_name, parent=None):
+        QWidget.__init__(self, parent)
+        self.app_name = app_name
+        layout = QVBoxLayout(self)
+        layout.addStretch(1)
+        label = QLabel(f"{app_name}\n(restored from last session)")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(label)
+        btn = QPushButton(f"Open {app_name}")
+        btn.clicked.connect(self.load_requested.emit)
+        layout.addWidget(btn, 0, Qt.AlignmentFlag.AlignCenter)
+        layout.addStretch(1)
+
+    def mousePressEvent(self, ev):
+        self.load_requested.emit()
+        super().mousePressEvent(ev)
+
+# Wallpaper decoding (QImage only, so all of it is safe off the GUI thread)
+
+def decode_wallpaper(path, size):
+    """`path` decoded straight to the smallest size covering `size` (never enlarged).
+
+    QImageReader.setScaledSize lets the decoder skip most of an 8K photo instead
+    of decoding every pixel and scaling afterwards."""
+    reader = QImageReader(path)
+    source = reader.size()
+    if source.isValid() and source.width() >= size.width() and source.height() >= size.height():
+        reader.setScaledSize(source.scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    image = reader.read()
+    if image.isNull():
+        print(f"[Wallpaper] cannot read {path}: {reader.errorString()}")
+    return image
+
+def scale_to_cover(image, size):
+    target = image.size().scaled(size, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+    if target == image.size():
+        return image
+    return image.scaled(target, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+def screen_sizes():
+    """{screen name: size in device pixels} for every connected screen (call on the GUI thread)."""
+    sizes = {}
+    for screen in QGuiApplication.screens():
+        dpr = screen.devicePixelRatio()
+        sizes[screen.name()] = QSize(int(screen.size().width() * dpr), int(screen.size().height() * dpr))
+    return sizes or {'': QSize(1280, 800)}
+
+def load_wallpaper_variants(path, sizes, viewport=None):
+    """Decode `path` once, for the largest of `sizes`, and derive a covering copy per screen.
+
+    Returns ({screen name: QImage}, QImage covering `viewport` or None), or
+    ({}, None) when there is no readable image."""
+    if not path:
+        return {}, None
+    wanted = list(sizes.values()) + ([viewport] if viewport is not None else [])
+    base = decode_wallpaper(path, QSize(max(s.width() for s in wanted), max(s.height() for s in wanted)))
+    if base.isNull():
+        return {}, None
+    variants = {name: scale_to_cover(base, size) for name, size in sizes.items()}
+    return variants, (scale_to_cover(base, viewport) if viewport is not None else None)
+
+def _wallpaper_job(generation, path, sizes, key, persist):
+    viewport = QSize(max(1, int(key[1] * key[3])), max(1, int(key[2] * key[3])))
+    variants, scaled = load_wallpaper_variants(path, sizes, viewport)
+    return {'generation': generation, 'path': path, 'key': key, 'persist': persist,
+            'variants': variants, 'viewport': scaled}
+
+def _rescale_job(image, key):
+    return key, scale_to_cover(image, QSize(max(1, int(key[1] * key[3])), max(1, int(key[2] * key[3]))))
 
 class MainWindow(QMainWindow):
-    def __init__(self, APPS_LIST, APP_STATE=None):
+    # dock buttons created per build step, keeps each step short enough that
+    # the start screen animations keep running while the desktop is pre-built
+    DOCK_BATCH_SIZE = 12
+    WALLPAPER_RESCALE_MS = 150
+
+    def __init__(self, APPS_LIST, APP_STATE=None, staged=False, wallpaper_variants=None):
         super().__init__()
-        self.APP_STATE = APP_STATE or {}
+        self.APP_STATE = APP_STATE if APP_STATE is not None else {}
         self.APP_STATE.setdefault('desktop_icons', [])
         self.setWindowTitle("Luxxer OS")
         self.setWindowIcon(QIcon("icon.ico"))
         self.resize(1280, 800)
 
-        wallpaper_path = self.APP_STATE.get('settings', {}).get('wallpaper', "ScreenPhoto2-2560x1440px.png")
-        self.wallpaper = QPixmap(wallpaper_path) if wallpaper_path else QPixmap()
+        self._first_paint_done = False
+        self.app_pool = self._make_app_pool()
+        # app name -> RSS growth measured when it was last constructed
+        self._app_sizes = {}
+        self.launch_history = LaunchHistory(self.APP_STATE.setdefault('launch_history', {}))
+        self.preloader = None
+        # ((path, width, height, device pixel ratio), QPixmap): the wallpaper scaled to
+        # cover the desktop viewport, rebuilt only when the path or the viewport changes
+        self.wallpaper_path = self.APP_STATE.get('settings', {}).get('wallpaper', DEFAULT_WALLPAPER)
+        self._scaled_wallpaper = None
+        # {screen name: QImage} decoded for each screen, see load_wallpaper_variants();
+        # self.wallpaper is the one for the screen this window is on
+        self._wallpaper_variants = dict(wallpaper_variants or {})
+        self.wallpaper = QImage()
+        self._wallpaper_generation = 0
+        self._wallpaper_task = None
+        self._rescale_pending = None
+        if self._wallpaper_variants:
+            with startup_profiler.span('wallpaper to pixmap'):
+                self._use_wallpaper_variant(QGuiApplication.primaryScreen())
+        # after a resize the old copy is shown until the size settles, then rescaled once
+        self._wallpaper_rescale = QTimer(self)
+        self._wallpaper_rescale.setSingleShot(True)
+        self._wallpaper_rescale.setInterval(self.WALLPAPER_RESCALE_MS)
+        self._wallpaper_rescale.timeout.connect(self._on_wallpaper_rescale)
+        # given back first when the memory governor sees pressure
+        memory_governor.register("wallpaper", self._wallpaper_bytes, self._shed_wallpaper, owner=self)
+        memory_governor.register("app pool", self._pooled_bytes, self._evict_pooled_apps, owner=self)
+        self._build = self._build_steps(list(APPS_LIST))
+        self.built = False
+
+        # staged=True: caller drives build_step() (see DesktopPrebuilder)
+        if not staged:
+            self.finish_build()
+
+    # Staged construction
+
+    def build_step(self):
+        """Run the next construction step; returns True once the desktop is fully built."""
+        if self.built:
+            return True
+        try:
+            next(self._build)
+        except StopIteration:
+            self.built = True
+        return self.built
 
+    def finish_build(self):
+        while not self.build_step():
+            pass
+
+    def _build_steps(self, apps_list):
         # MDI area (desktop background + app subwindows)
         self.mdi = QMdiArea()
         self.mdi.paintEvent = self._paint_background
+        # not pre-decoded: a plain background shows until the worker is done
+        if not self._wallpaper_variants and self.wallpaper_path:
+            self._request_wallpaper(self.wallpaper_path)
 
         self.icon_area = IconAdderAreaMarquee(self.mdi.viewport(), cell_size=120, spacing=12)
         self.icon_area.setGeometry(self.mdi.viewport().rect())
@@ -5268,8 +5908,16 @@ class MainWindow(QMainWindow):
         self.icon_area.icon_added.connect(self._on_icon_added)
         self.icon_area.icon_activated.connect(self._on_icon_activated)
 
-        # Bottom dock (assumed to exist)
-        self.dock = BottomDock(self, APPS_LIST)
+        # pause apps nobody can see
+        self.suspender = SuspendManager(self.mdi, desktop=self, parent=self)
+        self.suspender.enabled = self.APP_STATE.get('settings', {}).get('suspend_hidden_apps', True)
+        yield
+
+        # Bottom dock, buttons added in batches
+        self.dock = BottomDock(self, [])
+        for i in range(0, len(apps_list), self.DOCK_BATCH_SIZE):
+            self.dock.add_apps(apps_list[i:i + self.DOCK_BATCH_SIZE])
+            yield
 
         # central layout
         central = QWidget()
@@ -5281,7 +5929,7 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
 
         # app mapping placeholder
-        self.app_map = {name: lambda n=name: QLabel(f"{n} (Placeholder)") for name in APPS_LIST}
+        self.app_map = {name: lambda n=name: QLabel(f"{n} (Placeholder)") for name in apps_list}
 
         # context menu on desktop viewport
         self.mdi.viewport().setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -5292,15 +5940,129 @@ class MainWindow(QMainWindow):
         self._patch_mouse_press(self.mdi.viewport())
         self._patch_mouse_press(self.centralWidget())
 
-        # load icons from state after show (use timer so geometry is ready)
-        QTimer.singleShot(40, self._load_desktop_icons)
+        # frame times, loop latency and paint/timer counts over the desktop
+        hud_action = QAction("Frame-time HUD", self)
+        hud_action.setShortcut(QKeySequence("Ctrl+Shift+H"))
+        hud_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        hud_action.triggered.connect(self.toggle_frame_hud)
+        self.addAction(hud_action)
+        yield
+
+        # restore desktop icons; the icon area re-flows them once it gets its real size
+        self._load_desktop_icons()
+        yield
+
+        # previous session's windows, as placeholders
+        self._init_session()
+        yield
+
+        self._init_preloader()
+
+    # Session restore
+
+    def _init_session(self):
+        self._restoring_session = False
+        self._session_timer = QTimer(self)
+        self._session_timer.setSingleShot(True)
+        self._session_timer.setInterval(1000)
+        self._session_timer.timeout.connect(self._save_session)
+        self.mdi.subWindowActivated.connect(self._on_subwindow_activated)
+        QApplication.instance().aboutToQuit.connect(self._save_session)
+        if self.APP_STATE.get('settings', {}).get('restore_session', True):
+            self._restore_session()
+
+    def _restore_session(self):
+        entries = self.APP_STATE.get('session', []) or []
+        if not entries:
+            return
+        self._restoring_session = True
+        try:
+            with startup_profiler.span('restore session', count=len(entries)):
+                for entry in entries:
+                    name = entry.get('app')
+                    if not name or name not in APP_MAPPING:
+                        continue
+                    placeholder = SessionPlaceholder(name)
+                    sub = self._add_subwindow(name, placeholder)
+                    placeholder.load_requested.connect(lambda s=sub: self._hydrate_subwindow(s))
+                    geom = entry.get('geometry')
+                    if geom and len(geom) == 4:
+                        sub.setGeometry(*[int(v) for v in geom])
+                    if entry.get('minimized'):
+                        sub.showMinimized()
+                    elif entry.get('maximized'):
+                        sub.showMaximized()
+        except Exception:
+            traceback.print_exc()
+        # QMdiArea activates the top window when the desktop is first shown;
+        # that is not the user focusing it, so stay in restore mode until then
+        if not self.isVisible():
+            return
+        self._restoring_session = False
+
+    def _end_session_restore(self):
+        self._restoring_session = False
+
+    def _on_subwindow_activated(self, sub):
+        if sub is not None and not self._restoring_session:
+            self._hydrate_subwindow(sub)
+
+    def _on_subwindow_state_changed(self, sub, old_state, new_state):
+        if (old_state & Qt.WindowState.WindowMinimized) and not (new_state & Qt.WindowState.WindowMinimized):
+            if not self._restoring_session:
+                self._hydrate_subwindow(sub)
+
+    def _hydrate_subwindow(self, sub):
+        placeholder = sub.widget()
+        if not isinstance(placeholder, SessionPlaceholder):
+            return
+        app_widget = self._create_app_widget(placeholder.app_name)
+        if app_widget is None:
+            return
+        sub.setWidget(app_widget)
+        placeholder.deleteLater()
+
+    def _session_snapshot(self):
+        entries = []
+        for sub in self.mdi.subWindowList(QMdiArea.WindowOrder.StackingOrder):
+            name = sub.property('app_name')
+            if not name:
+                continue
+            minimized, maximized = sub.isMinimized(), sub.isMaximized()
+            g = sub.normalGeometry() if (minimized or maximized) else sub.geometry()
+            if not g.isValid():
+                g = sub.geometry()
+            entries.append({
+                'app': name,
+                'geometry': [g.x(), g.y(), g.width(), g.height()],
+                'minimized': minimized,
+                'maximized': maximized,
+            })
+        return entries
+
+    def _schedule_session_save(self):
+        try:
+            self._session_timer.start()
+        except RuntimeError:
+            pass  # window already gone (app quitting)
+
+    def _save_session(self):
+        try:
+            self.APP_STATE['session'] = self._session_snapshot()
+            if save_state:
+                save_state(self.APP_STATE)
+        except RuntimeError:
+            pass
+        except Exception:
+            traceback.print_exc()
 
     def _load_desktop_icons(self):
         try:
             names = self.APP_STATE.get('desktop_icons', []) or []
-            self.icon_area.clear_icons()
-            for n in names:
-                self.icon_area.add_icon(n)
+            with startup_profiler.span('_load_desktop_icons', count=len(names)):
+                self.icon_area.clear_icons()
+                for n in names:
+                    self.icon_area.add_icon(n)
         except Exception:
             traceback.print_exc()
 
@@ -5318,6 +6080,26 @@ class MainWindow(QMainWindow):
     def showEvent(self, ev):
         super().showEvent(ev)
         QTimer.singleShot(0, self._position_icon_area)
+        handle = self.windowHandle()
+        if handle is not None and not getattr(self, '_screen_hooked', False):
+            handle.screenChanged.connect(self._on_screen_changed)
+            self._screen_hooked = True
+        self._schedule_suspend_update()
+        if getattr(self, '_restoring_session', False):
+            QTimer.singleShot(0, self._end_session_restore)
+
+    def hideEvent(self, ev):
+        super().hideEvent(ev)
+        self._schedule_suspend_update()
+
+    def changeEvent(self, ev):
+        super().changeEvent(ev)
+        if ev.type() == QEvent.Type.WindowStateChange:
+            self._schedule_suspend_update()
+
+    def _schedule_suspend_update(self):
+        if getattr(self, 'suspender', None) is not None:
+            self.suspender.schedule()
 
     def _on_icon_added(self, name: str, index: int, pos: QPoint):
         try:
@@ -5365,12 +6147,17 @@ class MainWindow(QMainWindow):
         menu.addSeparator()
         a_settings = menu.addAction("Settings")
         a_change_wallpaper = menu.addAction("Change wallpaper...")
+        a_hud = menu.addAction("Frame-time HUD")
+        a_hud.setCheckable(True)
+        hud = frame_hud.get_hud()
+        a_hud.setChecked(hud is not None and hud.isVisible())
         menu.addSeparator()
         a_exit = menu.addAction("Exit Luxxer")
 
         a_refresh.triggered.connect(self._apply_mdi_background)
         a_settings.triggered.connect(lambda: self.launch_app("Settings"))
         a_change_wallpaper.triggered.connect(self._choose_wallpaper)
+        a_hud.triggered.connect(self.toggle_frame_hud)
         a_exit.triggered.connect(QApplication.instance().quit)
 
         a_copy.triggered.connect(self._copy_to_clipboard)
@@ -5378,48 +6165,182 @@ class MainWindow(QMainWindow):
 
         menu.exec(global_pos)
 
+    def toggle_frame_hud(self):
+        try:
+            frame_hud.toggle(self)
+        except Exception:
+            traceback.print_exc()
+
     def _choose_wallpaper(self):
         path, _ = QFileDialog.getOpenFileName(self, "Choose wallpaper", "", "Images (*.png *.jpg *.jpeg *.bmp);;All Files (*)")
         if path:
             self.set_wallpaper(path)
 
     def set_wallpaper(self, path: str):
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            QMessageBox.warning(self, "Wallpaper", "Failed to load image.")
+        """Decode `path` in the background; the current wallpaper stays until the new one is ready."""
+        self._request_wallpaper(path, persist=True)
+
+    def _request_wallpaper(self, path, persist=False):
+        self._wallpaper_generation += 1
+        if self._wallpaper_task is not None:
+            self._wallpaper_task.cancel()
+        task = task_executor.submit(_wallpaper_job, self._wallpaper_generation, path, screen_sizes(),
+                                    self._wallpaper_key(path), persist, owner=self,
+                                    priority=task_executor.PRIORITY_HIGH, name="wallpaper decode")
+        task.then(self._on_wallpaper_loaded, self._on_wallpaper_failed)
+        self._wallpaper_task = task
+
+    def _on_wallpaper_loaded(self, result):
+        if result['generation'] != self._wallpaper_generation:
+            return  # another wallpaper was picked meanwhile
+        self._wallpaper_task = None
+        if not result['variants']:
+            if result['persist']:
+                QMessageBox.warning(self, "Wallpaper", "Failed to load image.")
             return
-        self.wallpaper = pixmap
-        try:
-            self.mdi.viewport().update()
-        except Exception:
-            self.update()
-        if self.APP_STATE is not None:
-            self.APP_STATE.setdefault('settings', {})['wallpaper'] = path
+        self.wallpaper_path = result['path']
+        self._wallpaper_variants = result['variants']
+        self._scaled_wallpaper = None
+        self._wallpaper_rescale.stop()
+        if result['viewport'] is not None and result['key'] == self._wallpaper_key():
+            self._set_scaled_wallpaper(result['key'], result['viewport'])
+        if not self._use_wallpaper_variant(self.screen()):
+            self.wallpaper = next(iter(self._wallpaper_variants.values()))
+        self.mdi.viewport().update()
+        if result['persist'] and self.APP_STATE is not None:
+            self.APP_STATE.setdefault('settings', {})['wallpaper'] = result['path']
             if save_state:
                 try:
                     save_state(self.APP_STATE)
                 except Exception:
                     pass
 
+    def _on_wallpaper_failed(self, error):
+        print(f"[Wallpaper] decoding failed: {error}")
+        self._wallpaper_task = None
+
+    def _use_wallpaper_variant(self, screen):
+        """Make the copy decoded for `screen` the current wallpaper; False when there is none."""
+        image = self._wallpaper_variants.get(screen.name()) if screen is not None else None
+        if image is None:
+            return False
+        self.wallpaper = image
+        if self._scaled_wallpaper is None:
+            # painted centred as it is until the viewport's own copy is scaled in the background
+            dpr = screen.devicePixelRatio()
+            pm = QPixmap.fromImage(image)
+            pm.setDevicePixelRatio(dpr)
+            self._scaled_wallpaper = ((self.wallpaper_path, round(image.width() / dpr),
+                                       round(image.height() / dpr), dpr), pm)
+        return True
+
+    def _on_screen_changed(self, screen):
+        # moved to another monitor: its own copy, decoded now if it was not plugged in before
+        if not self.wallpaper_path:
+            return
+        if self._use_wallpaper_variant(screen):
+            self.mdi.viewport().update()
+        else:
+            self._request_wallpaper(self.wallpaper_path)
+
     def _paint_background(self, event):
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            with startup_profiler.span('first wallpaper paint'):
+                self._paint_wallpaper(event)
+            startup_profiler.mark_ready()
+            return
+        self._paint_wallpaper(event)
+
+    def _wallpaper_key(self, path=None):
+        viewport = self.mdi.viewport()
+        return (self.wallpaper_path if path is None else path,
+                viewport.width(), viewport.height(), viewport.devicePixelRatioF())
+
+    def _current_wallpaper(self):
+        """The scaled wallpaper to paint, or None when there is no wallpaper."""
+        if self.wallpaper.isNull():
+            return None
+        key = self._wallpaper_key()
+        cached = self._scaled_wallpaper
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if cached is not None and cached[0][0] == key[0]:
+            # same picture, other size (resize, or the start-up copy scaled for
+            # the whole screen): keep showing it until the size settles
+            self._wallpaper_rescale.start()
+            return cached[1]
+        return self._rescale_wallpaper()
+
+    def _rescale_wallpaper(self):
+        key, image = _rescale_job(self.wallpaper, self._wallpaper_key())
+        return self._set_scaled_wallpaper(key, image)
+
+    def _set_scaled_wallpaper(self, key, image):
+        pm = QPixmap.fromImage(image)
+        pm.setDevicePixelRatio(key[3])
+        self._scaled_wallpaper = (key, pm)
+        return pm
+
+    def _on_wallpaper_rescale(self):
+        key = self._wallpaper_key()
+        if self.wallpaper.isNull() or key == self._rescale_pending:
+            return
+        self._rescale_pending = key
+        task = task_executor.submit(_rescale_job, self.wallpaper, key, owner=self, name="wallpaper rescale")
+        task.then(self._on_wallpaper_rescaled, self._on_wallpaper_rescale_failed)
+
+    def _on_wallpaper_rescale_failed(self, error):
+        print(f"[Wallpaper] rescaling failed: {error}")
+        self._rescale_pending = None
+
+    def _on_wallpaper_rescaled(self, result):
+        key, image = result
+        self._rescale_pending = None
+        # resized or changed again meanwhile: the next paint schedules another one
+        if key == self._wallpaper_key():
+            self._set_scaled_wallpaper(key, image)
+            self.mdi.viewport().update()
+
+    def _paint_wallpaper(self, event):
         try:
-            painter = QPainter(self.mdi.viewport())
-            screen_size = QApplication.primaryScreen().size()
-            rect = QRect(QPoint(0, 0), screen_size)
-
-            # CLEAR background using window palette
-            painter.fillRect(rect, self.palette().window())
-
-            if self.wallpaper and not self.wallpaper.isNull():
-                pm = self.wallpaper.scaled(rect.size(),
-                                           Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                           Qt.TransformationMode.SmoothTransformation)
-                x = (rect.width() - pm.width()) // 2
-                y = (rect.height() - pm.height()) // 2
-                painter.drawPixmap(x, y, pm)
+            viewport = self.mdi.viewport()
+            painter = QPainter(viewport)
+            # only the damaged part: dragging a window repaints a strip, not the screen
+            damaged = QRectF(event.rect())
+            pm = self._current_wallpaper()
+            if pm is None:
+                painter.fillRect(damaged, self.palette().window())
+                return
+
+            dpr = pm.devicePixelRatio()
+            width, height = round(pm.width() / dpr), round(pm.height() / dpr)
+            placed = QRectF((viewport.width() - width) // 2, (viewport.height() - height) // 2, width, height)
+            if not placed.contains(damaged):
+                painter.fillRect(damaged, self.palette().window())
+            part = damaged.intersected(placed)
+            if not part.isEmpty():
+                source = QRectF((part.left() - placed.left()) * dpr, (part.top() - placed.top()) * dpr,
+                                part.width() * dpr, part.height() * dpr)
+                painter.drawPixmap(part, pm, source)
         except Exception:
             traceback.print_exc()
 
+    def _wallpaper_bytes(self):
+        images = {id(image): image for image in (self.wallpaper, *self._wallpaper_variants.values())}
+        size = sum(memory_governor.pixmap_bytes(image) for image in images.values())
+        if self._scaled_wallpaper:
+            size += memory_governor.pixmap_bytes(self._scaled_wallpaper[1])
+        return size
+
+    def _shed_wallpaper(self, level):
+        # the copies for the other screens are decoded again if the window moves there
+        others = [name for name, image in self._wallpaper_variants.items() if image is not self.wallpaper]
+        freed = 0
+        for name in others:
+            freed += memory_governor.pixmap_bytes(self._wallpaper_variants.pop(name))
+        return freed
+
     def _apply_mdi_background(self):
         try:
             self.mdi.viewport().update()
@@ -5454,30 +6375,154 @@ class MainWindow(QMainWindow):
 
     def launch_app(self, app_name: str):
         if app_name in APP_MAPPING:
-            app_class = APP_MAPPING[app_name]
-            try:
-                app_widget = app_class() if callable(app_class) else app_class
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"I can't start it. '{app_name}': {e}")
+            self.launch_history.record(app_name)
+            app_widget = None
+            if self.app_pool.is_poolable(app_name):
+                app_widget = self.app_pool.acquire(app_name)
+            if app_widget is None and self.preloader is not None:
+                app_widget = self.preloader.take(app_name)
+            if app_widget is not None:
+                resume_widget(app_widget)
+            else:
+                app_widget = self._create_app_widget(app_name)
+            if app_widget is None:
                 return
-
-            sub = QMdiSubWindow()
-            sub.setWidget(app_widget)
-            sub.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-            sub.setWindowTitle(app_name)
-            self.mdi.addSubWindow(sub)
-            sub.show()
+            self._add_subwindow(app_name, app_widget)
+            if self.preloader is not None:
+                self.preloader.replan()
         else:
             QMessageBox.warning(self, "Error", f"App '{app_name}' does not exist!")
 
+    def _create_app_widget(self, app_name: str):
+        app_class = APP_MAPPING[app_name]
+        rss_before = process_rss()
+        try:
+            widget = app_class() if callable(app_class) else app_class
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"I can't start it. '{app_name}': {e}")
+            return None
+        grown = process_rss() - rss_before
+        if grown > 0:
+            self._app_sizes[app_name] = grown
+        return widget
+
+    # Warm app pool
+
+    def _make_app_pool(self):
+        # settings['app_pool'] = {'enabled': true, 'max_count': 4, 'memory_budget_mb': 256, 'exclude': [...]}
+        cfg = self.APP_STATE.get('settings', {}).get('app_pool', {}) or {}
+        return AppInstancePool(
+            max_count=cfg.get('max_count', 4) if cfg.get('enabled', False) else 0,
+            memory_budget_mb=cfg.get('memory_budget_mb', 256),
+            exclude=cfg.get('exclude', []),
+            on_evict=self._on_pool_evict,
+        )
+
+    def _pooled_bytes(self):
+        total = self.app_pool.estimated_bytes()
+        if self.preloader is not None:
+            total += self.preloader.pool.estimated_bytes()
+        return total
+
+    def _evict_pooled_apps(self, level):
+        # parked and preloaded instances are simply rebuilt on their next launch
+        self.app_pool.clear()
+        if self.preloader is not None:
+            self.preloader.pool.clear()
+
+    def _on_pool_evict(self, name, widget):
+        widget.deleteLater()
+        detector = leak_detector.get_detector()
+        if detector is not None:
+            detector.watch(name, widget)
+
+    # Predictive preloading
+
+    def _init_preloader(self):
+        # settings['preload'] = {'enabled': true, 'top_n': 3, 'memory_budget_mb': 192, 'idle_ms': 3000, 'exclude': [...]}
+        settings = self.APP_STATE.get('settings', {})
+        cfg = settings.get('preload', {}) or {}
+        # opt-in: constructing an app the user never opened runs its side effects (timers, network, file I/O)
+        if not cfg.get('enabled', False):
+            return
+        exclude = set(cfg.get('exclude', [])) | set((settings.get('app_pool', {}) or {}).get('exclude', []))
+        self.preloader = IdlePreloader(
+            APP_MAPPING, self.launch_history,
+            open_apps=self._open_app_names,
+            top_n=cfg.get('top_n', 3),
+            memory_budget_mb=cfg.get('memory_budget_mb', 192),
+            idle_ms=cfg.get('idle_ms', 3000),
+            exclude=exclude,
+            on_size=self._app_sizes.__setitem__,
+            parent=self,
+        )
+        self.preloader.start()
+
+    def _open_app_names(self):
+        return [sub.property('app_name') for sub in self.mdi.subWindowList() if sub.property('app_name')]
+
+    def _on_subwindow_closed(self, sub):
+        try:
+            widget = sub.widget()
+            name = sub.property('app_name')
+            if widget is None or not name:
+                return
+            if not isinstance(widget, SessionPlaceholder) and self.app_pool.is_poolable(name, widget):
+                # take the app out before WA_DeleteOnClose deletes the subwindow with it
+                sub.setWidget(None)
+                widget.hide()
+                suspend_widget(widget)
+                if self.app_pool.release(name, widget, self._app_sizes.get(name)):
+                    return
+                widget.deleteLater()
+            # anything not pooled should be gone shortly after its window closes
+            detector = leak_detector.get_detector()
+            if detector is not None:
+                detector.watch(name, widget)
+        except Exception:
+            traceback.print_exc()
+
+    def _add_subwindow(self, app_name: str, widget):
+        sub = AppSubWindow()
+        sub.setWidget(widget)
+        sub.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        sub.setWindowTitle(app_name)
+        sub.setProperty('app_name', app_name)
+        sub.windowStateChanged.connect(lambda old, new, s=sub: self._on_subwindow_state_changed(s, old, new))
+        sub.destroyed.connect(self._schedule_session_save)
+        sub.closed.connect(lambda s=sub: self._on_subwindow_closed(s))
+        self.suspender.attach(sub)
+        self.mdi.addSubWindow(sub)
+        # pooled/preloaded widgets were hidden when parked; showing them only now,
+        # inside the subwindow, keeps them from flashing up as top-level windows
+        widget.show()
+        sub.show()
+        self._schedule_session_save()
+        return sub
+
+    def handle_instance_command(self, command: dict):
+        # requests forwarded by a second `Luxxer_OS.py [--open App]` invocation
+        cmd = command.get('cmd')
+        if cmd not in ('open', 'activate'):
+            print(f"[single_instance] Unknown command: {command!r}")
+            return
+        if self.isMinimized() or not self.isVisible():
+            self.showFullScreen()
+        self.raise_()
+        self.activateWindow()
+        if cmd == 'open' and command.get('app'):
+            self.launch_app(str(command['app']))
+
     def open_app(self, app_class):
-        if app_class is DesktopSpacesApp:
+        if getattr(app_class, '__name__', '') == 'DesktopSpacesApp':
             app = app_class(self)
         else:
             app = app_class()
         app.show()
 
     def animate_window_show(self, sub):
+        if power_manager.is_low_power():
+            return  # e.g. opened with --open while idle: just show it
         sub.setMinimumSize(0, 0)
         geom = sub.geometry()
         start_geom = QRect(geom.center().x(), geom.center().y(), 0, 0)
@@ -5490,6 +6535,86 @@ class MainWindow(QMainWindow):
         anim.start()
         sub._anim = anim
 
+# Desktop pre-building
+
+class DesktopPrebuilder(QObject):
+    """Builds the MainWindow in small steps while the start screen is up.
+
+    The wallpaper is decoded and scaled on a background thread, the window is
+    then constructed one MainWindow.build_step() per timer tick so the start
+    screen countdown and animations keep painting in between.
+    """
+    STEP_INTERVAL_MS = 10
+    wallpaper_ready = pyqtSignal(object)
+
+    def __init__(self, apps_list, app_state, parent=None):
+        super().__init__(parent)
+        self.apps_list = list(apps_list)
+        self.app_state = app_state
+        self.window = None
+        self._wallpaper = None
+        self._decoding = False
+        self.wallpaper_ready.connect(self._on_wallpaper_ready)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.STEP_INTERVAL_MS)
+        self._timer.timeout.connect(self._step)
+
+    def start(self):
+        path = self.app_state.get('settings', {}).get('wallpaper', DEFAULT_WALLPAPER)
+        self._decoding = True
+        threading.Thread(target=self._decode_wallpaper, args=(path, screen_sizes()), daemon=True).start()
+        self._timer.start()
+
+    def _decode_wallpaper(self, path, sizes):
+        try:
+            variants, _scaled = load_wallpaper_variants(path, sizes)
+        except Exception:
+            traceback.print_exc()
+            variants = {}
+        try:
+            self.wallpaper_ready.emit(variants)
+        except RuntimeError:
+            pass  # prebuilder already gone
+
+    def _on_wallpaper_ready(self, variants):
+        self._decoding = False
+        self._wallpaper = variants
+
+    def _step(self):
+        try:
+            if self.window is None:
+                if self._decoding:
+                    return
+                self._create_window()
+                return
+            with startup_profiler.span('prebuild step', cat='prebuild'):
+                done = self.window.build_step()
+            if done:
+                self._timer.stop()
+        except Exception:
+            self._timer.stop()
+            traceback.print_exc()
+
+    def _create_window(self):
+        with startup_profiler.span('MainWindow.__init__ (staged)', cat='prebuild'):
+            self.window = MainWindow(self.apps_list, self.app_state, staged=True,
+                                     wallpaper_variants=self._wallpaper)
+
+    def finish(self):
+        """Return the desktop, building whatever the countdown did not get to."""
+        self._timer.stop()
+        if self.window is None:
+            self._create_window()
+        self.window.finish_build()
+        return self.window
+
+    def cancel(self):
+        self._timer.stop()
+        if self.window is not None:
+            self.window.deleteLater()
+            self.window = None
+
 # MAIN
 
 if __name__ == "__main__":
@@ -5497,19 +6622,91 @@ if __name__ == "__main__":
     APP_STATE = load_state() or {}
     APP_STATE.setdefault('settings', {})
 
-    app = QApplication(sys.argv)
-    apply_theme_global(APP_STATE['settings'].get('theme', 'transparent'))
+    with startup_profiler.span('QApplication'):
+        app = QApplication(sys.argv)
+    with startup_profiler.span('apply_theme_global'):
+        apply_theme_global(APP_STATE['settings'].get('theme', 'transparent'))
 
     install_global_handlers(restart_callback=lambda: launch_main(app))
 
+    instance_server = None
+    # a standby child loaded its state while warming up; the active child may have saved since
+    state_stale = os.environ.get(STANDBY_ENV) == "1"
+
     def launch_main(app_instance):
-        start = StartScreen(app_instance, APP_STATE)
-        if start.exec() == QDialog.DialogCode.Accepted:
-            main_win = MainWindow(APPS_LIST)
-            apply_theme_global(APP_STATE['settings'].get('theme', 'transparent'))
-            main_win.showFullScreen()
+        global instance_server, state_stale
+        if state_stale:
+            state_stale = False
+            APP_STATE.clear()
+            APP_STATE.update(load_state() or {})
+            APP_STATE.setdefault('settings', {})
+            with startup_profiler.span('apply_theme_global'):
+                apply_theme_global(APP_STATE['settings'].get('theme', 'transparent'))
+        # attribute threads/processes to the app that started them (Luxxer Apps monitor)
+        if APP_STATE['settings'].get('app_accounting', True):
+            app_accounting.install()
+        # give caches back before the OOM killer takes the shell
+        # settings['memory_governor'] = {'enabled': true, 'low_percent': 80, 'critical_percent': 90, 'pixmap_cache_mb': 32}
+        # drop animation ticks and polling while nobody is using the desktop
+        # settings['low_power'] = {'enabled': true, 'idle_s': 60, 'on_focus_loss': true}
+        power_cfg = APP_STATE['settings'].get('low_power', {}) or {}
+        if power_cfg.get('enabled', True):
+            power_manager.install(idle_ms=int(power_cfg.get('idle_s', 60) * 1000),
+                                  on_focus_loss=power_cfg.get('on_focus_loss', True))
+        memory_cfg = APP_STATE['settings'].get('memory_governor', {}) or {}
+        if memory_cfg.get('enabled', True):
+            memory_governor.install(low_percent=memory_cfg.get('low_percent', 80),
+                                    critical_percent=memory_cfg.get('critical_percent', 90),
+                                    pixmap_cache_mb=memory_cfg.get('pixmap_cache_mb', memory_governor.PIXMAP_CACHE_MB))
+        # only the supervised child that owns the desktop listens
+        if instance_server is None:
+            instance_server = single_instance.InstanceServer()
+            instance_server.listen()
+            for name in single_instance.parse_open_args(sys.argv[1:]):
+                instance_server.submit({'cmd': 'open', 'app': name})
+
+        prebuilder = DesktopPrebuilder(APPS_LIST, APP_STATE)
+        with startup_profiler.span('StartScreen.__init__'):
+            start = StartScreen(app_instance, APP_STATE)
+        # build the desktop while the user waits on the start screen
+        prebuilder.start()
+        # includes the countdown and waiting for the user to press Continue
+        with startup_profiler.span('StartScreen.exec', cat='interactive'):
+            accepted = start.exec() == QDialog.DialogCode.Accepted
+        if accepted:
+            with startup_profiler.span('DesktopPrebuilder.finish'):
+                main_win = prebuilder.finish()
+            with startup_profiler.span('apply_theme_global'):
+                apply_theme_global(APP_STATE['settings'].get('theme', 'transparent'))
+            with startup_profiler.span('MainWindow.showFullScreen'):
+                main_win.showFullScreen()
+            instance_server.set_handler(main_win.handle_instance_command)
+
+            # main-thread stall watchdog, see the StallMonitor app; opt-in, its heartbeat and
+            # watchdog thread wake the CPU ~150 times a second
+            # settings['stall_detector'] = {'enabled': true, 'threshold_ms': 50}
+            stall_cfg = APP_STATE['settings'].get('stall_detector', {}) or {}
+            if stall_cfg.get('enabled', False):
+                detector = stall_detector.install(APP_MAPPING, threshold_ms=stall_cfg.get('threshold_ms', 50))
+                # nothing to measure while idle; the heartbeat alone wakes the CPU 50 times a second
+                power_manager.register(detector.pause, detector.resume)
+
+            # report app widgets that outlive their closed window (leak_log.jsonl); opt-in,
+            # a survivor costs a gc.collect() and a referrer walk on the GUI thread
+            # settings['leak_detector'] = {'enabled': true, 'grace_ms': 5000}
+            leak_cfg = APP_STATE['settings'].get('leak_detector', {}) or {}
+            if leak_cfg.get('enabled', False):
+                leak_detector.install(grace_ms=leak_cfg.get('grace_ms', leak_detector.GRACE_MS))
+
+            # --record-input[=path]: save this session's input for `perf_bench.py replay`
+            record_path = input_replay.recording_path()
+            if record_path:
+                recorder = input_replay.InputRecorder(record_path, desktop=main_win, parent=main_win)
+                recorder.start()
+                app.aboutToQuit.connect(recorder.save)
             return app.exec()
         else:
+            prebuilder.cancel()
             sys.exit(0)
 
     exit_code = run_with_bsod(lambda: launch_main(app))
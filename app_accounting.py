@@ -0,0 +1,347 @@
+import os
+import sys
+import inspect
+import weakref
+import threading
+import traceback
+import subprocess
+import tracemalloc
+
+from PyQt6.QtCore import Qt, QObject, QThread, QTimer, QProcess
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, QPushButton,
+    QSplitter, QTableWidget, QTableWidgetItem
+)
+
+import task_executor
+from app_suspend import app_timers
+
+# Per-app resource accounting
+#
+# Every app runs in the shell's process, so OS tools can't tell them apart.
+# install() hooks thread and process creation (threading.Thread, QThread,
+# subprocess.Popen, QProcess) and task_executor pool tasks, and remembers which
+# app widget started them: a task's owner, or the QWidget `self` found by
+# walking the caller's frames. The "Luxxer Apps"
+# monitor combines that with per-window QObject/QWidget/QTimer counts and,
+# on request, tracemalloc heap attribution.
+
+TRACE_FRAMES = 8
+_installed = False
+_lock = threading.Lock()
+# spawned things: {'kind', 'obj' (weakref), 'owner' (weakref), 'label'}; held weakly so
+# finished threads and processes (and the apps owning them) can still be freed
+_records = []
+# id(thread or task) -> (weakref to it, weakref to the widget that started it)
+_thread_owners = {}
+
+
+def _ref(obj):
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
+def _find_owner(frame):
+    f = frame
+    while f is not None:
+        if f.f_globals.get('__name__') != __name__ and 'self' in f.f_code.co_varnames[:1]:
+            obj = f.f_locals.get('self')
+            if isinstance(obj, QWidget):
+                return obj
+        f = f.f_back
+    # started from a worker thread or pool task (e.g. CmdWorker.run): use whoever started it
+    for thread in (threading.current_thread(), QThread.currentThread(), task_executor.current_task()):
+        refs = _thread_owners.get(id(thread))
+        owner = refs[1]() if refs and refs[0]() is thread else None
+        if owner is not None:
+            return owner
+    return None
+
+
+def _record(kind, obj, label, owner=None):
+    if owner is None:
+        try:
+            owner = _find_owner(sys._getframe(2))
+        except Exception:
+            owner = None
+    with _lock:
+        # the monitor may never be opened: drop what has been freed meanwhile
+        _records[:] = [r for r in _records if r['obj']() is not None]
+        for key in [k for k, (thread, _owner) in _thread_owners.items() if thread() is None]:
+            del _thread_owners[key]
+        _records.append({'kind': kind, 'obj': weakref.ref(obj),
+                         'owner': _ref(owner) if owner is not None else None, 'label': label})
+        if kind in ('thread', 'task') and owner is not None:
+            _thread_owners[id(obj)] = (weakref.ref(obj), _ref(owner))
+
+
+def _alive(record):
+    obj = record['obj']()
+    if obj is None:
+        return False
+    try:
+        if record['kind'] == 'thread':
+            return obj.is_alive() if isinstance(obj, threading.Thread) else obj.isRunning()
+        if record['kind'] == 'task':
+            return not obj.done()
+        if isinstance(obj, subprocess.Popen):
+            return obj.poll() is None
+        return obj.state() != QProcess.ProcessState.NotRunning
+    except RuntimeError:
+        return False  # Qt object already deleted
+
+
+def live_records():
+    with _lock:
+        alive = [r for r in _records if _alive(r)]
+        _records[:] = alive
+        live_ids = {id(r['obj']()) for r in alive if r['kind'] in ('thread', 'task')}
+        for key in list(_thread_owners):
+            if key not in live_ids:
+                _thread_owners.pop(key, None)
+        return list(alive)
+
+
+def install():
+    """Hook thread/process creation so they can be attributed to apps."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    orig_thread_start = threading.Thread.start
+
+    def thread_start(self, *args, **kwargs):
+        _record('thread', self, self.name)
+        return orig_thread_start(self, *args, **kwargs)
+    threading.Thread.start = thread_start
+
+    orig_qthread_start = QThread.start
+
+    def qthread_start(self, *args, **kwargs):
+        _record('thread', self, type(self).__name__)
+        return orig_qthread_start(self, *args, **kwargs)
+    QThread.start = qthread_start
+
+    orig_popen_init = subprocess.Popen.__init__
+
+    def popen_init(self, *args, **kwargs):
+        orig_popen_init(self, *args, **kwargs)
+        # the child is running: accounting must not turn a valid call into an error
+        try:
+            cmd = args[0] if args else kwargs.get('args', '')
+            if isinstance(cmd, (str, bytes, os.PathLike)):
+                text = os.fsdecode(cmd)
+            else:
+                text = subprocess.list2cmdline(os.fsdecode(a) if isinstance(a, (bytes, os.PathLike)) else str(a)
+                                               for a in cmd)
+            _record('process', self, f"pid {self.pid}: {text}"[:120])
+        except Exception:
+            traceback.print_exc()
+    subprocess.Popen.__init__ = popen_init
+
+    orig_qprocess_start = QProcess.start
+
+    def qprocess_start(self, *args, **kwargs):
+        result = orig_qprocess_start(self, *args, **kwargs)
+        _record('process', self, f"QProcess: {self.program()} {' '.join(self.arguments())}"[:120])
+        return result
+    QProcess.start = qprocess_start
+
+    # pool tasks share QThreadPool threads, so the thread hooks never see them
+    # (long_running tasks get their own Thread, recorded by thread_start)
+    orig_submit = task_executor.TaskExecutor.submit
+
+    def submit(self, fn, *args, owner=None, long_running=False, **kwargs):
+        task = orig_submit(self, fn, *args, owner=owner, long_running=long_running, **kwargs)
+        if not long_running:
+            _record('task', task, f"task: {task.name}"[:120],
+                    owner=owner if isinstance(owner, QWidget) else None)
+        return task
+    task_executor.TaskExecutor.submit = submit
+
+
+# Heap attribution
+
+_class_ranges = {}
+
+
+def _source_range(cls):
+    if cls not in _class_ranges:
+        try:
+            lines, start = inspect.getsourcelines(cls)
+            _class_ranges[cls] = (os.path.normcase(os.path.abspath(inspect.getsourcefile(cls))),
+                                  start, start + len(lines))
+        except (OSError, TypeError):
+            _class_ranges[cls] = None
+    return _class_ranges[cls]
+
+
+def heap_by_app(snapshot, classes):
+    """Bytes allocated by code inside each class's source, keyed by class."""
+    ranges = [(cls, r) for cls, r in ((c, _source_range(c)) for c in classes) if r]
+    totals = {cls: 0 for cls, _r in ranges}
+    for stat in snapshot.statistics('traceback'):
+        for frame in reversed(stat.traceback):  # innermost first
+            filename = os.path.normcase(os.path.abspath(frame.filename))
+            owner = next((cls for cls, (fn, lo, hi) in ranges if fn == filename and lo <= frame.lineno < hi), None)
+            if owner is not None:
+                totals[owner] += stat.size
+                break
+    return totals
+
+
+def heap_by_module(snapshot, limit=15):
+    rows = []
+    for stat in snapshot.statistics('filename')[:limit]:
+        filename = stat.traceback[0].filename
+        rows.append((os.path.splitext(os.path.basename(filename))[0], stat.size, stat.count))
+    return rows
+
+
+def _find_mdi():
+    for w in QApplication.topLevelWidgets():
+        mdi = getattr(w, 'mdi', None)
+        if mdi is not None:
+            return mdi
+    return None
+
+
+def _kb(n):
+    return f"{n / 1024:.0f}"
+
+
+# Monitor app
+
+class LuxxerAppsMonitor(QWidget):
+    REFRESH_MS = 2000
+    COLUMNS = ["Window", "Heap KB", "QObjects", "QWidgets", "Timers", "Threads", "Processes"]
+
+    def __init__(self):
+        QWidget.__init__(self)
+        self.setWindowTitle("Luxxer Apps - resource use")
+        install()
+
+        layout = QVBoxLayout(self)
+        top = QHBoxLayout()
+        self.track_heap = QCheckBox("Track Python heap (tracemalloc, slows allocations)")
+        self.track_heap.setChecked(tracemalloc.is_tracing())
+        self.track_heap.toggled.connect(self._toggle_heap)
+        top.addWidget(self.track_heap)
+        top.addStretch(1)
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh)
+        top.addWidget(refresh_btn)
+        layout.addLayout(top)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.currentCellChanged.connect(lambda row, *_: self._show_details(row))
+        splitter.addWidget(self.table)
+
+        self.details = QTableWidget(0, 2)
+        self.details.setHorizontalHeaderLabels(["Kind", "Detail"])
+        self.details.horizontalHeader().setStretchLastSection(True)
+        splitter.addWidget(self.details)
+
+        self.modules = QTableWidget(0, 3)
+        self.modules.setHorizontalHeaderLabels(["Module", "Heap KB", "Blocks"])
+        self.modules.horizontalHeader().setStretchLastSection(True)
+        splitter.addWidget(self.modules)
+        layout.addWidget(splitter, 1)
+
+        self.status = QLabel()
+        layout.addWidget(self.status)
+
+        self._rows = []
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(self.REFRESH_MS)
+        QTimer.singleShot(0, self.refresh)
+
+    def _toggle_heap(self, on):
+        if on and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+        elif not on and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.refresh()
+
+    def refresh(self):
+        try:
+            self._refresh()
+        except Exception:
+            traceback.print_exc()
+
+    def _refresh(self):
+        mdi = _find_mdi()
+        subs = mdi.subWindowList() if mdi is not None else []
+        records = live_records()
+
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        heap = heap_by_app(snapshot, {type(s.widget()) for s in subs if s.widget() is not None}) if snapshot else {}
+
+        self._rows = []
+        unowned = [r for r in records if r['owner'] is None or r['owner']() is None]
+        for sub in subs:
+            widget = sub.widget()
+            if widget is None:
+                continue
+            mine = []
+            for r in records:
+                owner = r['owner']() if r['owner'] else None
+                if owner is not None and (owner is widget or widget.isAncestorOf(owner)):
+                    mine.append(r)
+            timers = [t for t in app_timers(widget) if t.isActive()]
+            self._rows.append({
+                'title': sub.windowTitle() or (sub.property('app_name') or '?'),
+                'heap': heap.get(type(widget)) if snapshot else None,
+                'qobjects': len(widget.findChildren(QObject)),
+                'qwidgets': len(widget.findChildren(QWidget)),
+                'timers': timers,
+                'threads': [r for r in mine if r['kind'] in ('thread', 'task')],
+                'processes': [r for r in mine if r['kind'] == 'process'],
+            })
+
+        self.table.setRowCount(len(self._rows))
+        for row, info in enumerate(self._rows):
+            timer_text = ", ".join(f"{t.interval()}ms" for t in info['timers']) or "0"
+            values = [
+                info['title'],
+                _kb(info['heap']) if info['heap'] is not None else "-",
+                info['qobjects'], info['qwidgets'],
+                f"{len(info['timers'])} ({timer_text})" if info['timers'] else "0",
+                len(info['threads']), len(info['processes']),
+            ]
+            for col, value in enumerate(values):
+                self.table.setItem(row, col, QTableWidgetItem(str(value)))
+
+        if snapshot:
+            mods = heap_by_module(snapshot)
+            self.modules.setRowCount(len(mods))
+            for row, (name, size, count) in enumerate(mods):
+                for col, value in enumerate((name, _kb(size), count)):
+                    self.modules.setItem(row, col, QTableWidgetItem(str(value)))
+        else:
+            self.modules.setRowCount(0)
+
+        self.status.setText(f"{len(self._rows)} app windows, {threading.active_count()} Python threads, "
+                            f"{len(unowned)} threads/processes not attributed to a window")
+        self._show_details(self.table.currentRow())
+
+    def _show_details(self, row):
+        self.details.setRowCount(0)
+        if not (0 <= row < len(self._rows)):
+            return
+        info = self._rows[row]
+        items = [("timer", f"{t.objectName() or type(t).__name__} every {t.interval()} ms"
+                  + (" (single shot)" if t.isSingleShot() else "")) for t in info['timers']]
+        items += [(r['kind'], r['label']) for r in info['threads']]
+        items += [("process", r['label']) for r in info['processes']]
+        self.details.setRowCount(len(items))
+        for i, (kind, text) in enumerate(items):
+            self.details.setItem(i, 0, QTableWidgetItem(kind))
+            self.details.setItem(i, 1, QTableWidgetItem(text))
@@ -0,0 +1,105 @@
+import traceback
+from collections import OrderedDict
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+
+# Warm app-instance pool
+#
+# Closed app widgets are parked here (hidden) instead of being deleted, so the
+# next launch of the same app reuses the instance. Eviction is LRU, bounded by
+# an entry count and an estimated memory budget. Qt-free: the caller supplies
+# the size estimate and what to do with evicted widgets.
+
+DEFAULT_MAX_COUNT = 4
+DEFAULT_MEMORY_BUDGET_MB = 256
+DEFAULT_ESTIMATE_BYTES = 16 * 1024 * 1024
+
+
+def process_rss():
+    """Resident memory of this process in bytes (0 without psutil); used to size app instances."""
+    try:
+        return psutil.Process().memory_info().rss if psutil else 0
+    except Exception:
+        return 0
+
+
+class AppInstancePool:
+    def __init__(self, max_count=DEFAULT_MAX_COUNT, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+                 exclude=None, on_evict=None):
+        self.max_count = max(0, int(max_count))
+        self.memory_budget = max(0, int(memory_budget_mb * 1024 * 1024))
+        # apps that must always start fresh
+        self.exclude = set(exclude or [])
+        self.on_evict = on_evict
+        # key -> (app_name, widget, estimated bytes); oldest first
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def is_poolable(self, name, widget=None):
+        if self.max_count <= 0 or name in self.exclude:
+            return False
+        # apps can opt out with a class attribute: POOLABLE = False
+        if widget is not None and getattr(widget, 'POOLABLE', True) is False:
+            return False
+        return True
+
+    def acquire(self, name):
+        """Most recently parked instance of `name`, or None (counted as a miss)."""
+        for key in reversed(self._entries):
+            if self._entries[key][0] == name:
+                widget = self._entries.pop(key)[1]
+                self.hits += 1
+                return widget
+        self.misses += 1
+        return None
+
+    def release(self, name, widget, size=None):
+        """Park a closed widget. Returns False if it was not taken (caller deletes it)."""
+        if widget is None or not self.is_poolable(name, widget):
+            return False
+        size = int(size) if size else DEFAULT_ESTIMATE_BYTES
+        if self.memory_budget and size > self.memory_budget:
+            return False
+        self._entries[id(widget)] = (name, widget, size)
+        self._trim()
+        return id(widget) in self._entries
+
+    def estimated_bytes(self):
+        return sum(entry[2] for entry in self._entries.values())
+
+    def clear(self):
+        while self._entries:
+            self._evict_oldest()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+            'evictions': self.evictions,
+            'pooled': [entry[0] for entry in self._entries.values()],
+            'estimated_bytes': self.estimated_bytes(),
+        }
+
+    def _trim(self):
+        while self._entries and (len(self._entries) > self.max_count or
+                                 (self.memory_budget and self.estimated_bytes() > self.memory_budget)):
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        _key, (name, widget, _size) = self._entries.popitem(last=False)
+        self.evictions += 1
+        if callable(self.on_evict):
+            try:
+                self.on_evict(name, widget)
+            except Exception:
+                traceback.print_exc()
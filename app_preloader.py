@@ -0,0 +1,206 @@
+import time
+import traceback
+
+from PyQt6.QtCore import QObject, QTimer, QEvent
+from PyQt6.QtWidgets import QApplication
+
+from app_pool import AppInstancePool, process_rss
+from app_suspend import suspend_widget
+import memory_governor
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+
+# Predictive preloading
+#
+# LaunchHistory keeps per-app launch counts (with recency and hour-of-day) in
+# APP_STATE['launch_history']. IdlePreloader uses it to import and pre-construct
+# the most likely apps while nobody is touching the desktop, one small step per
+# timer tick, and backs off as soon as there is user input.
+
+HALF_LIFE_DAYS = 7.0
+MIN_LAUNCHES = 2
+
+_INPUT_EVENTS = {
+    QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick,
+    QEvent.Type.MouseMove, QEvent.Type.Wheel, QEvent.Type.KeyPress, QEvent.Type.KeyRelease,
+    QEvent.Type.TouchBegin, QEvent.Type.TouchUpdate, QEvent.Type.TabletPress,
+}
+
+
+class LaunchHistory:
+    def __init__(self, data=None):
+        # name -> {'count': int, 'last': epoch seconds, 'hours': [24 ints]}
+        self.data = data if data is not None else {}
+
+    def record(self, name, now=None):
+        now = time.time() if now is None else now
+        entry = self.data.setdefault(name, {'count': 0, 'last': 0, 'hours': [0] * 24})
+        entry['count'] = int(entry.get('count', 0)) + 1
+        entry['last'] = now
+        hours = entry.get('hours') or [0] * 24
+        hours[time.localtime(now).tm_hour] += 1
+        entry['hours'] = hours
+
+    def score(self, name, now=None):
+        entry = self.data.get(name)
+        if not entry:
+            return 0.0
+        now = time.time() if now is None else now
+        count = int(entry.get('count', 0))
+        if count < MIN_LAUNCHES:
+            return 0.0
+        days = max(0.0, (now - float(entry.get('last', 0))) / 86400.0)
+        recency = 0.5 ** (days / HALF_LIFE_DAYS)
+        # apps opened around this time of day (e.g. Mail in the morning) rank higher
+        hours = entry.get('hours') or [0] * 24
+        h = time.localtime(now).tm_hour
+        around = hours[h] + 0.5 * (hours[(h - 1) % 24] + hours[(h + 1) % 24])
+        return count * recency * (1.0 + 2.0 * around / count)
+
+    def top(self, n, now=None, exclude=()):
+        scored = [(self.score(name, now), name) for name in self.data if name not in exclude]
+        scored = [item for item in scored if item[0] > 0]
+        scored.sort(reverse=True)
+        return [name for _score, name in scored[:n]]
+
+
+class IdlePreloader(QObject):
+    CHECK_INTERVAL_MS = 500
+
+    def __init__(self, registry, history, open_apps=None, top_n=3, memory_budget_mb=192,
+                 idle_ms=3000, max_cpu_percent=60, exclude=(), on_size=None, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.history = history
+        # callable() -> names already open on the desktop (not worth a spare)
+        self.open_apps = open_apps or (lambda: [])
+        self.top_n = int(top_n)
+        self.idle_ms = int(idle_ms)
+        self.max_cpu_percent = max_cpu_percent
+        self.exclude = set(exclude)
+        # callable(name, bytes): measured construction cost, shared with the app pool
+        self.on_size = on_size
+        self.pool = AppInstancePool(max_count=self.top_n, memory_budget_mb=memory_budget_mb,
+                                    exclude=self.exclude, on_evict=lambda name, w: w.deleteLater())
+        self.preloaded = 0
+        self._plan = []
+        self._last_input = time.monotonic()
+        self._cooldown_until = 0.0
+        self._filtering = False
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        self.replan()
+
+    def stop(self):
+        self._timer.stop()
+        self._plan = []
+        self._set_input_filter(False)
+
+    def take(self, name):
+        """Pre-constructed instance of `name`, or None."""
+        widget = self.pool.acquire(name)
+        if widget is not None:
+            self.replan()
+        return widget
+
+    def replan(self):
+        if self.top_n <= 0:
+            return
+        open_now = set(self.open_apps())
+        pooled = set(self.pool.stats()['pooled'])
+        plan = []
+        for name in self.history.top(self.top_n, exclude=self.exclude):
+            if name not in self.registry:
+                continue
+            if not self.registry.is_loaded(name):
+                plan.append(('import', name))
+            if name not in open_now and name not in pooled:
+                plan.append(('construct', name))
+        self._plan = plan
+        if plan:
+            self._set_input_filter(True)
+            self._timer.start()
+        else:
+            self.stop()
+
+    # Idle detection: only watch input while there is work queued
+
+    def _set_input_filter(self, on):
+        app = QApplication.instance()
+        if app is None or on == self._filtering:
+            return
+        if on:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+        self._filtering = on
+
+    def eventFilter(self, obj, ev):
+        if ev.type() in _INPUT_EVENTS:
+            self._last_input = time.monotonic()
+        return False
+
+    def _idle(self):
+        now = time.monotonic()
+        if now < self._cooldown_until:
+            return False
+        if (now - self._last_input) * 1000 < self.idle_ms:
+            return False
+        # spare instances are the first thing given back when memory is tight
+        governor = memory_governor.get_governor()
+        if governor is not None and governor.level != memory_governor.LEVEL_NORMAL:
+            return False
+        if psutil and self.max_cpu_percent:
+            try:
+                if psutil.cpu_percent(interval=None) > self.max_cpu_percent:
+                    return False
+            except Exception:
+                pass
+        return True
+
+    def _tick(self):
+        if not self._plan:
+            self.stop()
+            return
+        if not self._idle():
+            return
+        kind, name = self._plan.pop(0)
+        started = time.monotonic()
+        try:
+            if kind == 'import':
+                self.registry[name]
+            else:
+                self._construct(name)
+        except Exception:
+            traceback.print_exc()
+        # keep background work to roughly a tenth of wall time
+        self._cooldown_until = time.monotonic() + (time.monotonic() - started) * 9
+        if not self._plan:
+            self.stop()
+
+    def _construct(self, name):
+        factory = self.registry[name]
+        if not callable(factory) or getattr(factory, 'POOLABLE', True) is False:
+            return
+        rss_before = process_rss()
+        widget = factory()
+        size = process_rss() - rss_before
+        if not hasattr(widget, 'hide'):
+            return
+        widget.hide()
+        # parked until launched; launch_app resumes it
+        suspend_widget(widget)
+        if size > 0 and callable(self.on_size):
+            self.on_size(name, size)
+        if self.pool.release(name, widget, size if size > 0 else None):
+            self.preloaded += 1
+        else:
+            widget.deleteLater()
+
@@ -0,0 +1,104 @@
+import importlib
+import traceback
+from collections.abc import MutableMapping
+
+# Lazy app registry
+#
+# Entries are either "module:Class" descriptor strings or ready factories
+# (classes / lambdas, as ApplicationAdder registers them at runtime).
+# Descriptors are only imported the first time the entry is looked up, so the
+# shell can start without pulling in every app module and its optional deps.
+
+def parse_descriptor(descriptor: str):
+    module_name, _, attr = descriptor.partition(':')
+    if not module_name or not attr:
+        raise ValueError(f"Invalid app descriptor: {descriptor!r} (expected 'module:Class')")
+    return module_name, attr
+
+class AppRegistry(MutableMapping):
+    def __init__(self, entries=None, aliases=None, placeholder=None):
+        self._entries = {}
+        self._resolved = {}
+        # module name -> already-imported module object (used for the main script,
+        # which runs as __main__ and must not be imported a second time)
+        self._aliases = dict(aliases or {})
+        # callable(name) -> factory, used for unknown/broken apps
+        self._placeholder = placeholder
+        if entries:
+            for name, target in dict(entries).items():
+                self[name] = target
+
+    # mapping protocol
+
+    def __getitem__(self, name):
+        if name in self._resolved:
+            return self._resolved[name]
+        target = self._entries[name]
+        factory = self._resolve(name, target)
+        self._resolved[name] = factory
+        return factory
+
+    def __setitem__(self, name, target):
+        self._entries[name] = target
+        self._resolved.pop(name, None)
+
+    def __delitem__(self, name):
+        del self._entries[name]
+        self._resolved.pop(name, None)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    # registry helpers
+
+    def register_placeholder(self, name):
+        self._entries[name] = None
+        self._resolved.pop(name, None)
+
+    def descriptor(self, name):
+        target = self._entries.get(name)
+        return target if isinstance(target, str) else None
+
+    def module_of(self, name):
+        desc = self.descriptor(name)
+        if desc is None:
+            return None
+        return parse_descriptor(desc)[0]
+
+    def is_loaded(self, name):
+        return name in self._resolved
+
+    def loaded_names(self):
+        return list(self._resolved.keys())
+
+    def _import(self, module_name):
+        if module_name in self._aliases:
+            return self._aliases[module_name]
+        return importlib.import_module(module_name)
+
+    def _resolve(self, name, target):
+        if target is None:
+            return self._make_placeholder(name)
+        if not isinstance(target, str):
+            return target
+        try:
+            module_name, attr = parse_descriptor(target)
+            obj = self._import(module_name)
+            for part in attr.split('.'):
+                obj = getattr(obj, part)
+            return obj
+        except Exception as e:
+            print(f"[AppRegistry] Failed to load '{name}' from {target}: {e}")
+            traceback.print_exc()
+            return self._make_placeholder(name)
+
+    def _make_placeholder(self, name):
+        if callable(self._placeholder):
+            return self._placeholder(name)
+        return None
@@ -0,0 +1,159 @@
+import time
+import traceback
+
+from PyQt6.QtCore import QObject, QTimer, QEvent
+from PyQt6.QtGui import QRegion
+from PyQt6.QtWidgets import QMdiArea
+
+# App suspension
+#
+# Apps in minimised, fully covered or parked (pooled) windows are suspended.
+# An app can implement the protocol itself:
+#
+#     def on_suspend(self): ...   # stop timers / polling
+#     def on_resume(self): ...    # restart them and catch up
+#
+# Apps that don't get their active QTimers (children, or QTimer attributes
+# without a parent) stopped and restarted automatically. A timer whose
+# next timeout fell inside the suspended period fires once right away.
+
+_SUSPENDED_ATTR = '_lux_suspended'
+
+
+def is_suspended(widget):
+    return getattr(widget, _SUSPENDED_ATTR, None) is not None
+
+
+def app_timers(widget):
+    timers = {id(t): t for t in widget.findChildren(QTimer)}
+    # several apps keep parentless timers as attributes (self.timer = QTimer())
+    for value in list(vars(widget).values()):
+        if isinstance(value, QTimer):
+            timers[id(value)] = value
+    return list(timers.values())
+
+
+def suspend_widget(widget):
+    if widget is None or is_suspended(widget):
+        return
+    paused = []
+    try:
+        if callable(getattr(widget, 'on_suspend', None)):
+            widget.on_suspend()
+        else:
+            now = time.monotonic()
+            for timer in app_timers(widget):
+                if timer.isActive():
+                    paused.append((timer, timer.interval(), max(0, timer.remainingTime()), now))
+                    timer.stop()
+    except Exception:
+        traceback.print_exc()
+    setattr(widget, _SUSPENDED_ATTR, paused)
+
+
+def resume_widget(widget):
+    if widget is None or not is_suspended(widget):
+        return
+    paused = getattr(widget, _SUSPENDED_ATTR)
+    setattr(widget, _SUSPENDED_ATTR, None)
+    try:
+        if callable(getattr(widget, 'on_resume', None)):
+            widget.on_resume()
+            return
+        now = time.monotonic()
+        for timer, interval, remaining, since in paused:
+            try:
+                elapsed = int((now - since) * 1000)
+                _restart_timer(timer, interval, max(0, remaining - elapsed))
+            except RuntimeError:
+                pass  # timer deleted while suspended
+    except Exception:
+        traceback.print_exc()
+
+
+def _restart_timer(timer, interval, first_ms):
+    if first_ms == interval:
+        timer.start(interval)
+        return
+
+    # fire after first_ms (0 = catch up now), then go back to the normal interval
+    def restore():
+        try:
+            timer.timeout.disconnect(restore)
+        except Exception:
+            pass
+        # runs after the app's own slot: keep whatever it did with the timer
+        if timer.interval() != first_ms:
+            return  # restarted with a new interval
+        if not timer.isActive():
+            timer.setInterval(interval)  # stopped (or single shot): next start() uses the old interval
+        elif not timer.isSingleShot():
+            timer.start(interval)
+
+    timer.timeout.connect(restore)
+    timer.start(first_ms)
+
+
+class SuspendManager(QObject):
+    """Suspends apps in MDI subwindows that are minimised, fully covered by other
+    windows, scrolled out of the desktop, or whose desktop is minimised."""
+    UPDATE_DELAY_MS = 150
+
+    _WATCHED = {QEvent.Type.Move, QEvent.Type.Resize, QEvent.Type.Show, QEvent.Type.Hide,
+                QEvent.Type.WindowStateChange}
+
+    def __init__(self, mdi, desktop=None, parent=None):
+        super().__init__(parent)
+        self.mdi = mdi
+        self.desktop = desktop
+        self.enabled = True
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.UPDATE_DELAY_MS)
+        self._timer.timeout.connect(self.update)
+        self.mdi.subWindowActivated.connect(lambda _sub: self.schedule())
+
+    def attach(self, sub):
+        sub.installEventFilter(self)
+        sub.destroyed.connect(lambda _obj=None: self.schedule())
+        self.schedule()
+
+    def schedule(self):
+        try:
+            self._timer.start()
+        except RuntimeError:
+            pass
+
+    def eventFilter(self, obj, ev):
+        if ev.type() in self._WATCHED:
+            self.schedule()
+        return False
+
+    def suspended_count(self):
+        return sum(1 for sub in self.mdi.subWindowList() if is_suspended(sub.widget()))
+
+    def update(self):
+        try:
+            desktop_hidden = self.desktop is not None and (
+                not self.desktop.isVisible() or self.desktop.isMinimized())
+            covered = QRegion()
+            area = QRegion(self.mdi.viewport().rect())
+            # top-most first
+            for sub in reversed(self.mdi.subWindowList(QMdiArea.WindowOrder.StackingOrder)):
+                widget = sub.widget()
+                if widget is None:
+                    continue
+                shown = sub.isVisible() and not sub.isMinimized()
+                visible_part = QRegion(sub.geometry()).intersected(area).subtracted(covered)
+                if shown:
+                    covered = covered.united(QRegion(sub.geometry()))
+                if not self.enabled:
+                    resume_widget(widget)
+                elif desktop_hidden or not shown or visible_part.isEmpty():
+                    suspend_widget(widget)
+                else:
+                    resume_widget(widget)
+        except RuntimeError:
+            pass  # desktop being torn down
+        except Exception:
+            traceback.print_exc()
@@ -183,8 +183,12 @@ def register_app_globally(entry: dict):
             try:
                 dock = getattr(main_win, 'dock', None)
                 if dock:
+                    # the Luxxer dock paints its entries itself
+                    if hasattr(dock, 'add_app'):
+                        dock.add_app(name, icon=entry.get('icon'), on_click=_on_click)
+                        success = True
                     # if dock has layout addWidget, do it
-                    if hasattr(dock, 'layout') and callable(getattr(dock, 'layout')):
+                    elif hasattr(dock, 'layout') and callable(getattr(dock, 'layout')):
                         l = dock.layout()
                         if l:
                             l.addWidget(btn)
@@ -236,7 +240,9 @@ def unregister_app_globally(name: str):
             main_win = getattr(Luxxer_OS, 'main_win', None)
             if main_win:
                 dock = getattr(main_win, 'dock', None)
-                if dock and hasattr(dock, 'layout'):
+                if dock and hasattr(dock, 'remove_app'):
+                    dock.remove_app(name)
+                elif dock and hasattr(dock, 'layout'):
                     # remove QPushButton with text==name
                     try:
                         layout = dock.layout()
@@ -7,7 +7,6 @@ import sqlite3
 import time
 import math
 import tempfile
-import urllib.request
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
@@ -21,7 +20,12 @@ from PyQt6.QtWidgets import (
     QPlainTextEdit
 )
 from PyQt6.QtCore import Qt, QUrl, QTimer, QSize
-from PyQt6.QtGui import QPixmap, QImage, QIcon, QClipboard, QFont, QColor, QGuiApplication
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QIcon, QClipboard, QFont, QColor, QGuiApplication
+
+import async_loop
+import engines
+import task_executor
+from task_executor import run_in_main
 
 try:
     from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -371,8 +375,12 @@ class RSSFeedReaderApp(QMainWindow):
         url = self.feed_url.text().strip()
         if not url:
             return
+        async_loop.run(self._load_feed(url), owner=self)
+
+    async def _load_feed(self, url):
         try:
-            data = urllib.request.urlopen(url, timeout=10).read()
+            response = (await async_loop.fetch(url, timeout=10)).raise_for_status()
+            data = await response.body()
             root = ET.fromstring(data)
             items = []
             # handle typical RSS structure
@@ -387,7 +395,7 @@ class RSSFeedReaderApp(QMainWindow):
                 it.setData(Qt.ItemDataRole.UserRole, (t, d, l))
                 self.list.addItem(it)
         except Exception as e:
-            QMessageBox.warning(self, "Feed error", str(e))
+            run_in_main(QMessageBox.warning, self, "Feed error", str(e), owner=self)
 
     def show_item(self, item: QListWidgetItem):
         t, d, l = item.data(Qt.ItemDataRole.UserRole)
@@ -608,11 +616,20 @@ class ImageGalleryApp(QMainWindow):
 
     def _show(self, item):
         path = Path(item.data(Qt.ItemDataRole.UserRole))
-        pix = QPixmap(str(path))
-        if pix.isNull():
-            self.preview.setText("Cannot load")
-            return
-        scaled = pix.scaled(self.preview.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # scaled previews live in QPixmapCache, whose limit the memory governor owns
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = f"gallery:{path}:{mtime}:{self.preview.width()}x{self.preview.height()}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None or scaled.isNull():
+            pix = QPixmap(str(path))
+            if pix.isNull():
+                self.preview.setText("Cannot load")
+                return
+            scaled = pix.scaled(self.preview.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            QPixmapCache.insert(key, scaled)
         self.preview.setPixmap(scaled)
 
 # BatchImageResizerApp - batch-resize images using QPixmap scaling (no external libs)
@@ -652,18 +669,31 @@ class BatchImageResizerApp(QMainWindow):
             QMessageBox.warning(self, "Error", "Folder not found")
             return
         w = int(self.width.text()); h = int(self.height.text())
-        imgs = [f for f in p.iterdir() if f.suffix.lower() in (".png", ".jpg", ".jpeg", ".bmp", ".webp")]
-        self.progress.setMaximum(len(imgs))
-        for idx, f in enumerate(imgs, 1):
-            pix = QPixmap(str(f))
-            if pix.isNull():
-                continue
-            scaled = pix.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            out = f.with_suffix(f".resized{f.suffix}")
-            scaled.save(str(out))
-            self.progress.setValue(idx)
+        # same engine as `python -m luxxer resize`, off the GUI thread
+        self.progress.setMaximum(100)
+        self.progress.setValue(0)
+        self.btn_run.setEnabled(False)
+        task = task_executor.submit(engines.resize_images, str(p), w, h, progress=self._report, owner=self)
+        task.progress.connect(self._on_progress)
+        task.then(self._on_done, self._on_failed)
+
+    @staticmethod
+    def _report(done, total, _item):
+        task_executor.check_cancelled()
+        task_executor.report_progress(done * 100 // max(1, total))
+
+    def _on_progress(self, value, _message):
+        self.progress.setValue(value)
+
+    def _on_done(self, _results):
+        self.btn_run.setEnabled(True)
+        self.progress.setValue(100)
         QMessageBox.information(self, "Done", "Batch resized")
 
+    def _on_failed(self, e):
+        self.btn_run.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Resize failed: {e}")
+
 # AudioPlayerProApp - basic audio player using QtMultimedia
 class AudioPlayerProApp(QMainWindow):
     def __init__(self):
@@ -930,15 +960,18 @@ class APIRequesterApp(QMainWindow):
         data = None
         if method == "POST":
             data = self.request_body.toPlainText().encode("utf-8")
-        req = urllib.request.Request(url, data=data, method=method)
-        req.add_header("User-Agent", "Luxxer-App/1.0")
+        self.btn_send.setEnabled(False)
+        async_loop.run(self._send_async(url, method, data), owner=self)
+
+    async def _send_async(self, url, method, data):
         try:
-            with urllib.request.urlopen(req, timeout=12) as r:
-                body = r.read().decode(errors="replace")
-                headers = dict(r.getheaders())
-                self.response.setPlainText(json.dumps({"headers": headers, "body": body[:20000]}, indent=2))
+            r = (await async_loop.fetch(url, method=method, data=data, timeout=12)).raise_for_status()
+            body = (await r.body()).decode(errors="replace")
+            self.response.setPlainText(json.dumps({"headers": r.headers, "body": body[:20000]}, indent=2))
         except Exception as e:
             self.response.setPlainText(str(e))
+        finally:
+            self.btn_send.setEnabled(True)
 
 # AutomationScriptApp - safe file automation tasks (copy/move/rename) with simple script JSON format
 class AutomationScriptApp(QMainWindow):
@@ -1097,14 +1130,21 @@ class PodcastManagerApp(RSSFeedReaderApp):
         self._download_url(l, t)
 
     def _download_url(self, url, title):
+        async_loop.run(self._download_async(url, title), owner=self)
+
+    async def _download_async(self, url, title):
         try:
-            data = urllib.request.urlopen(url, timeout=30)
+            r = (await async_loop.fetch(url, timeout=30)).raise_for_status()
             outp = self.POD_DIR / (title[:80].replace("/", "_") + ".mp3")
             with open(outp, "wb") as fh:
-                fh.write(data.read())
-            QMessageBox.information(self, "Downloaded", f"Saved to {outp}")
+                while True:
+                    chunk = await r.read()
+                    if not chunk:
+                        break
+                    fh.write(chunk)
+            run_in_main(QMessageBox.information, self, "Downloaded", f"Saved to {outp}", owner=self)
         except Exception as e:
-            QMessageBox.warning(self, "Download failed", str(e))
+            run_in_main(QMessageBox.warning, self, "Download failed", str(e), owner=self)
 
 # EpubReaderApp - simplistic epub reader (unzip and render first html using WebEngine or plain)
 class EpubReaderApp(QMainWindow):
@@ -1427,22 +1467,31 @@ class NetworkSpeedTesterApp(QMainWindow):
         url = self.url.text().strip()
         if not url:
             return
+        self.btn_start.setEnabled(False)
+        async_loop.run(self._run_test(url), owner=self)
+
+    async def _run_test(self, url):
         try:
             start = time.time()
-            with urllib.request.urlopen(url, timeout=20) as r:
-                total = 0
-                CH = 64*1024
-                while True:
-                    chunk = r.read(CH)
-                    if not chunk:
-                        break
-                    total += len(chunk)
+            r = (await async_loop.fetch(url, timeout=20)).raise_for_status()
+            total = 0
+            CH = 64*1024
+            while True:
+                chunk = await r.read(CH)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if r.length:
+                    self.progress.setValue(min(100, int(total * 100 / r.length)))
+                else:
                     self.progress.setValue(min(100, int(total / (1024*1024) * 100 / 10)))  # rough
             elapsed = time.time() - start
             mb = total / (1024*1024)
             self.result.setText(f"Downloaded {mb:.2f} MB in {elapsed:.2f}s => {mb/elapsed:.2f} MB/s")
         except Exception as e:
-            QMessageBox.warning(self, "Download failed", str(e))
+            run_in_main(QMessageBox.warning, self, "Download failed", str(e), owner=self)
+        finally:
+            self.btn_start.setEnabled(True)
 
 # FocusTimerApp - simple customizable timers (multi timers)
 class FocusTimerApp(QMainWindow):
@@ -0,0 +1,408 @@
+import ssl
+import asyncio
+import weakref
+import selectors
+import threading
+import traceback
+import urllib.error
+import urllib.parse
+import urllib.request
+from asyncio import events
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QTimer, QSocketNotifier, QCoreApplication
+
+# asyncio on the Qt event loop
+#
+# One asyncio loop shares the GUI thread with Qt: instead of blocking in
+# select() it registers a QSocketNotifier for every file descriptor asyncio
+# waits on and a single-shot QTimer for its next scheduled callback, and runs
+# one asyncio iteration whenever one of them fires. Coroutines can therefore
+# touch widgets between awaits, and thousands of sockets cost no threads.
+#
+#     async def load(self, url):
+#         response = await async_loop.fetch(url)
+#         self.view.setPlainText(await response.text())
+#
+#     async_loop.run(self.load(url), owner=self)   # cancelled when the window goes away
+#
+# Blocking libraries (imaplib, smtplib, requests) go through
+# `await async_loop.to_thread(fn, *args)`. Don't open modal dialogs (exec())
+# from a coroutine: asyncio does not run while the nested Qt loop is up.
+#
+# Only public PyQt API is used, but asyncio's loop is stepped through
+# BaseEventLoop._run_once(), which is private (stable from 3.7 through 3.13).
+
+MAX_REDIRECTS = 5
+DEFAULT_TIMEOUT = 30.0
+USER_AGENT = "Luxxer-App/1.0"
+
+
+class _QtSelector(selectors.DefaultSelector):
+    """Never blocks; keeps one read and one write QSocketNotifier per registered fd."""
+
+    def __init__(self, wake):
+        super().__init__()
+        self._wake = wake
+        self._notifiers = {}
+
+    def _sync(self, fd, events_mask):
+        for kind, flag in ((QSocketNotifier.Type.Read, selectors.EVENT_READ),
+                           (QSocketNotifier.Type.Write, selectors.EVENT_WRITE)):
+            key = (fd, kind)
+            notifier = self._notifiers.get(key)
+            if events_mask & flag:
+                if notifier is None:
+                    notifier = QSocketNotifier(fd, kind)
+                    notifier.activated.connect(self._wake)
+                    self._notifiers[key] = notifier
+                notifier.setEnabled(True)
+            elif notifier is not None:
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+                del self._notifiers[key]
+
+    def register(self, fileobj, events_mask, data=None):
+        key = super().register(fileobj, events_mask, data)
+        self._sync(key.fd, events_mask)
+        return key
+
+    def modify(self, fileobj, events_mask, data=None):
+        key = super().modify(fileobj, events_mask, data)
+        self._sync(key.fd, events_mask)
+        return key
+
+    def unregister(self, fileobj):
+        key = super().unregister(fileobj)
+        self._sync(key.fd, 0)
+        return key
+
+    def close(self):
+        for notifier in self._notifiers.values():
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        self._notifiers.clear()
+        super().close()
+
+    def select(self, timeout=None):
+        # Qt does the waiting; asyncio only collects what is ready right now
+        return super().select(0)
+
+
+class QtEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        self._driver = _LoopDriver(self)
+        super().__init__(_QtSelector(self._driver.wake))
+        # counts as running on the GUI thread from now on; run_until_complete()
+        # would block Qt, so asyncio refuses it
+        self._thread_id = threading.get_ident()
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self._driver.wake()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self._driver.wake()
+        return handle
+
+
+class _LoopDriver(QObject):
+    def __init__(self, loop):
+        super().__init__()
+        self.loop = loop
+        self._stepping = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._step)
+
+    def wake(self, *_args):
+        if threading.get_ident() != self.loop._thread_id:
+            return  # call_soon_threadsafe() writes to the self-pipe, whose notifier wakes us
+        if not self._stepping:
+            self._timer.start(0)
+
+    def _step(self):
+        loop = self.loop
+        if self._stepping or loop.is_closed():
+            return
+        self._stepping = True
+        events._set_running_loop(loop)
+        try:
+            loop._run_once()
+        except Exception:
+            traceback.print_exc()
+        finally:
+            events._set_running_loop(None)
+            self._stepping = False
+        self._reschedule()
+
+    def _reschedule(self):
+        loop = self.loop
+        if loop._ready:
+            self._timer.start(0)
+        elif loop._scheduled:
+            delay = max(0.0, loop._scheduled[0]._when - loop.time())
+            self._timer.start(int(delay * 1000) + 1)
+        else:
+            self._timer.stop()
+
+
+# Process-wide loop
+
+_loop = None
+
+
+def get_loop():
+    """The asyncio loop running on the Qt event loop (created on first use, GUI thread only)."""
+    global _loop
+    if _loop is None:
+        _loop = QtEventLoop()
+        asyncio.set_event_loop(_loop)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_shutdown)
+    return _loop
+
+
+def _shutdown():
+    if _loop is None or _loop.is_closed():
+        return
+    for task in asyncio.all_tasks(_loop):
+        task.cancel()
+    _loop._driver._timer.stop()
+
+
+def run(coro, owner=None):
+    """Schedule `coro` on the shared loop; with owner=<QObject> it is cancelled when the owner is destroyed."""
+    loop = get_loop()
+    task = loop.create_task(coro)
+    task.add_done_callback(_report_failure)
+    if owner is not None:
+        connection = owner.destroyed.connect(lambda _obj=None: task.cancel())
+        owner_ref = weakref.ref(owner)
+
+        def disconnect(_task):
+            obj = owner_ref()
+            if obj is not None and not sip.isdeleted(obj):
+                try:
+                    obj.destroyed.disconnect(connection)
+                except (TypeError, RuntimeError):
+                    pass
+        task.add_done_callback(disconnect)
+    return task
+
+
+def _report_failure(task):
+    if not task.cancelled() and task.exception() is not None:
+        exc = task.exception()
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+
+async def to_thread(fn, *args):
+    """Run a blocking call on the default executor without blocking the loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
+# Minimal HTTP/1.1 client (http and https, Content-Length / chunked / close-delimited bodies).
+# Requests that need a proxy from the environment (http_proxy, https_proxy,
+# no_proxy, system settings) go through urllib on a worker thread instead.
+
+class HTTPError(Exception):
+    pass
+
+
+class Response:
+    def __init__(self, url, status, reason, headers, reader, writer, timeout=None):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers  # lower-case names
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._remaining = None
+        self._chunked = headers.get('transfer-encoding', '').lower() == 'chunked'
+        if not self._chunked and 'content-length' in headers:
+            self._remaining = int(headers['content-length'])
+        self._chunk_left = 0
+        self._eof = status in (204, 304)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            self.close()
+            raise HTTPError(f"HTTP Error {self.status}: {self.reason}")
+        return self
+
+    @property
+    def length(self):
+        """Body size from Content-Length, or None."""
+        value = self.headers.get('content-length')
+        return int(value) if value and value.isdigit() else None
+
+    async def read(self, n=64 * 1024):
+        """Up to n body bytes; b'' at the end."""
+        if self._eof:
+            self.close()
+            return b''
+        if self._chunked:
+            data = await self._read_chunked(n)
+        elif self._remaining is not None:
+            data = await self._io(self._reader.read(min(n, self._remaining))) if self._remaining else b''
+            self._remaining -= len(data)
+            if not data and self._remaining:
+                raise HTTPError("connection closed before the end of the body")
+        else:
+            data = await self._io(self._reader.read(n))
+        if not data:
+            self.close()
+        return data
+
+    async def _io(self, awaitable):
+        # a server stalling mid-body must not hang the task forever
+        return await asyncio.wait_for(awaitable, self._timeout)
+
+    async def _read_chunked(self, n):
+        if self._chunk_left == 0:
+            line = await self._io(self._reader.readline())
+            size = int(line.split(b';', 1)[0].strip() or b'0', 16)
+            if size == 0:
+                # trailers until the blank line
+                while (await self._io(self._reader.readline())).strip():
+                    pass
+                return b''
+            self._chunk_left = size
+        data = await self._io(self._reader.read(min(n, self._chunk_left)))
+        if not data:
+            raise HTTPError("connection closed inside a chunk")
+        self._chunk_left -= len(data)
+        if self._chunk_left == 0:
+            await self._io(self._reader.readline())
+        return data
+
+    async def body(self):
+        parts = []
+        while True:
+            data = await self.read()
+            if not data:
+                return b''.join(parts)
+            parts.append(data)
+
+    async def text(self, encoding=None):
+        charset = encoding
+        if charset is None:
+            ctype = self.headers.get('content-type', '')
+            charset = ctype.split('charset=', 1)[1].split(';')[0].strip() if 'charset=' in ctype else 'utf-8'
+        return (await self.body()).decode(charset, errors='replace')
+
+    def close(self):
+        self._eof = True
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class _ProxiedResponse(Response):
+    """A urllib response read on the default executor (the socket timeout bounds every read)."""
+
+    def __init__(self, raw):
+        headers = {name.lower(): value for name, value in raw.headers.items()}
+        super().__init__(raw.geturl(), raw.getcode(), raw.reason, headers, None, None)
+        self._raw = raw
+
+    async def read(self, n=64 * 1024):
+        if self._eof or self._raw is None:
+            self.close()
+            return b''
+        data = await to_thread(self._raw.read, n)
+        if not data:
+            self.close()
+        return data
+
+    def close(self):
+        super().close()
+        if self._raw is not None:
+            self._raw.close()
+            self._raw = None
+
+
+def _proxy_for(parts):
+    """The proxy urllib would use for this URL, or None."""
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ''):
+        return None
+    return proxy
+
+
+def _urlopen(url, method, data, headers, timeout):
+    request = urllib.request.Request(url, data=data, method=method,
+                                     headers={'User-Agent': USER_AGENT, **(headers or {})})
+    try:
+        return urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        return e  # a response as well; callers decide with raise_for_status()
+
+
+async def _request_once(url, method, data, headers, timeout):
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        raise HTTPError(f"unsupported URL scheme: {parts.scheme!r}")
+    https = parts.scheme == 'https'
+    host = parts.hostname
+    port = parts.port or (443 if https else 80)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(host, port, ssl=ssl.create_default_context() if https else None),
+        timeout)
+    host_header = f"[{host}]" if ':' in host else host
+    if parts.port is not None:
+        host_header += f":{parts.port}"
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {host_header}", f"User-Agent: {USER_AGENT}",
+             "Accept: */*", "Connection: close"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    if data is not None:
+        lines.append(f"Content-Length: {len(data)}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+    if data is not None:
+        writer.write(data)
+    await asyncio.wait_for(writer.drain(), timeout)
+
+    status_line = await asyncio.wait_for(reader.readline(), timeout)
+    try:
+        _version, status, *reason = status_line.decode('latin-1').split(' ', 2)
+        status = int(status)
+    except ValueError:
+        writer.close()
+        raise HTTPError(f"bad status line: {status_line[:80]!r}")
+    response_headers = {}
+    while True:
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+    return Response(url, status, (reason[0].strip() if reason else ''), response_headers, reader, writer, timeout)
+
+
+async def fetch(url, method="GET", data=None, headers=None, timeout=DEFAULT_TIMEOUT):
+    """Send a request and return the Response once its headers arrived (redirects followed)."""
+    for _ in range(MAX_REDIRECTS + 1):
+        if _proxy_for(urllib.parse.urlsplit(url)):
+            # urllib follows the remaining redirects itself
+            return _ProxiedResponse(await to_thread(_urlopen, url, method, data, headers, timeout))
+        response = await _request_once(url, method, data, headers, timeout)
+        location = response.headers.get('location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            response.close()
+            url = urllib.parse.urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, data = "GET", None
+            continue
+        return response
+    raise HTTPError(f"too many redirects ({MAX_REDIRECTS})")
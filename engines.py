@@ -0,0 +1,199 @@
+import os
+import socket
+import shutil
+import hashlib
+import tarfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Headless app engines
+#
+# The work behind a few apps, free of widgets so it runs both from the app
+# (on a task_executor thread) and from `python -m luxxer <tool>`. Long
+# operations take progress(done, total, item); it may raise to abort, e.g.
+# task_executor.check_cancelled().
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+HASH_CHUNK = 1024 * 1024
+AV_SIGNATURES = ('BAD_SIGNATURE', 'MALWARE', 'EICAR')
+PORT_TIMEOUT = 0.5
+PORT_WORKERS = 64
+
+
+def _report(progress, done, total, item):
+    if progress is not None:
+        progress(done, total, item)
+
+
+# BatchImageResizer
+
+def resize_images(folder, width, height, progress=None):
+    """Write <name>.resized<ext> next to every image in `folder`; returns [(source, output or None)]."""
+    # QImage needs no QApplication (QPixmap does), so this also runs without a display
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QImage
+
+    images = [f for f in Path(folder).iterdir() if f.suffix.lower() in IMAGE_SUFFIXES]
+    results = []
+    for idx, f in enumerate(images, 1):
+        image = QImage(str(f))
+        out = None
+        if not image.isNull():
+            scaled = image.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio,
+                                  Qt.TransformationMode.SmoothTransformation)
+            out = f.with_suffix(f".resized{f.suffix}")
+            if not scaled.save(str(out)):
+                out = None
+        results.append((str(f), str(out) if out else None))
+        _report(progress, idx, len(images), str(f))
+    return results
+
+
+# CyberTools hashing
+
+def hash_file(path, algo="sha256"):
+    h = hashlib.new(algo.lower())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hash_files(paths, algo="sha256", progress=None):
+    """[(path, hexdigest or None, error or None)] for each file; directories are walked."""
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, names in os.walk(p):
+                files.extend(os.path.join(root, n) for n in sorted(names))
+        else:
+            files.append(p)
+    results = []
+    for idx, path in enumerate(files, 1):
+        try:
+            results.append((path, hash_file(path, algo), None))
+        except OSError as e:
+            results.append((path, None, str(e)))
+        _report(progress, idx, len(files), path)
+    return results
+
+
+# BackupRestore
+
+def create_backup(src_dir, dest, progress=None):
+    """tar.gz `src_dir` (as its base name) into `dest`; returns the number of entries archived."""
+    total = sum(len(dirs) + len(files) for _root, dirs, files in os.walk(src_dir)) + 1
+    done = [0]
+
+    def count(info):
+        done[0] += 1
+        _report(progress, done[0], total, info.name)
+        return info
+
+    with tarfile.open(dest, "w:gz") as tar:
+        tar.add(src_dir, arcname=os.path.basename(src_dir), filter=count)
+    return done[0]
+
+
+def restore_backup(archive, dest_dir, progress=None):
+    """Extract a backup made by create_backup into `dest_dir`; returns the number of entries."""
+    with tarfile.open(archive, "r:gz") as tar:
+        members = tar.getmembers()
+        for idx, member in enumerate(members, 1):
+            # 'data' rejects absolute paths and links leaving dest_dir (Python 3.12+ / backports)
+            if hasattr(tarfile, 'data_filter'):
+                tar.extract(member, path=dest_dir, filter='data')
+            else:
+                tar.extract(member, path=dest_dir)
+            _report(progress, idx, len(members), member.name)
+    return len(members)
+
+
+# WinRAR
+
+def create_zip(src, dest):
+    """Zip a file or folder as <dest without extension>.zip; returns the archive path."""
+    src = os.path.abspath(src)
+    base = os.path.splitext(dest)[0]
+    return shutil.make_archive(base, 'zip', os.path.dirname(src), os.path.basename(src))
+
+
+# PortScanner
+
+def _port_open(host, port, timeout):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((host, port)) == 0
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def scan_ports(host, ports=range(1, 1025), timeout=PORT_TIMEOUT, workers=PORT_WORKERS, progress=None, on_open=None):
+    """Sorted list of open TCP ports; on_open(port) is called as each one is found."""
+    ports = list(ports)
+    open_ports = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [(port, pool.submit(_port_open, host, port, timeout)) for port in ports]
+        try:
+            for idx, (port, future) in enumerate(futures, 1):
+                if future.result():
+                    open_ports.append(port)
+                    if on_open is not None:
+                        on_open(port)
+                _report(progress, idx, len(ports), port)
+        except BaseException:
+            for _port, future in futures:
+                future.cancel()
+            raise
+    return sorted(open_ports)
+
+
+# GuardianAV
+
+def vfs_entries(node, path=''):
+    """(path, content) for every file in a virtual FS dict (APP_STATE['files'])."""
+    entries = []
+    for k, v in node.items():
+        if isinstance(v, dict):
+            entries.extend(vfs_entries(v, f'{path}/{k}'))
+        else:
+            entries.append((f'{path}/{k}', v))
+    return entries
+
+
+class _FileText:
+    # read only when av_scan gets to it, so a big tree is never held in memory
+    def __init__(self, path):
+        self.path = path
+
+    def __str__(self):
+        try:
+            with open(self.path, "rb") as f:
+                return f.read().decode("latin-1")
+        except OSError:
+            return ""
+
+
+def file_entries(folder):
+    """(path, content) for every file under a real directory; content is read lazily."""
+    entries = []
+    for root, _dirs, names in os.walk(folder):
+        entries.extend((os.path.join(root, n), _FileText(os.path.join(root, n))) for n in sorted(names))
+    return entries
+
+
+def av_scan(entries, signatures=AV_SIGNATURES, progress=None, on_found=None):
+    """[(path, signature)] for every signature found in the (path, content) entries."""
+    found = []
+    for idx, (p, content) in enumerate(entries, 1):
+        _report(progress, idx, len(entries), p)
+        text = str(content)
+        for sig in signatures:
+            if sig in text:
+                found.append((p, sig))
+                if on_found is not None:
+                    on_found(p, sig)
+    return found
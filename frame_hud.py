@@ -0,0 +1,300 @@
+import time
+import collections
+import traceback
+
+from PyQt6.QtCore import Qt, QObject, QTimer, QEvent, QRect
+from PyQt6.QtGui import QColor, QFont, QPainter
+from PyQt6.QtWidgets import QApplication, QWidget
+
+import stall_detector
+
+# Frame-time HUD
+#
+# A toggleable overlay in the corner of the desktop (Ctrl+Shift+H, or the
+# desktop context menu) that answers "why does it feel sluggish?":
+#
+#     window    frame time of the whole desktop window (layout, paint, flush)
+#     desktop   paint time of the MDI viewport (wallpaper)
+#     dock      paint time of the dock strip
+#     loop      event-loop latency: how late a 20 ms heartbeat fires
+#     timers    QTimers that fired in the last second, busiest owners first
+#     paints/s  paint events per widget class
+#
+# plus a histogram of window frame times over the last HISTORY_S seconds and
+# the last stall the stall detector recorded. Nothing is installed while the
+# HUD is hidden: the application-wide event filter, the heartbeat and the
+# refresh timer only exist while it is on screen.
+
+HISTORY_S = 5.0
+HEARTBEAT_MS = 20
+REFRESH_MS = 250
+TOP_N = 4
+# histogram buckets (ms): the 60 and 30 fps budgets stand out
+BUCKETS = (4, 8, 12, 16.7, 25, 33.3, 50, 100)
+
+
+def _stats(values):
+    """(avg, p95, max) of a list of ms values, or None."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return sum(ordered) / len(ordered), p95, ordered[-1]
+
+
+class FrameProbe(QObject):
+    """Application-wide event filter that times frames and paints and counts timer ticks."""
+
+    def __init__(self, desktop, parent=None):
+        super().__init__(parent)
+        self.desktop = desktop
+        # (timestamp, ms) per probe, pruned to HISTORY_S
+        self.samples = {'window': collections.deque(), 'desktop': collections.deque(),
+                        'dock': collections.deque(), 'loop': collections.deque()}
+        # (timestamp, class name) of every paint / (timestamp, owner name, timer id) of every tick
+        self.paints = collections.deque()
+        self.ticks = collections.deque()
+        self._targets = {}
+        self._resending = set()
+        self._beat = None
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+        self._heartbeat.setInterval(HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._on_heartbeat)
+
+    def start(self):
+        for queue in (*self.samples.values(), self.paints, self.ticks):
+            queue.clear()
+        # timed objects: the desktop window (Qt delivers UpdateRequest to the top-level
+        # widget, not its QWindow) and the two widgets users complain about
+        self._targets = {id(self.desktop): ('window', self.desktop)}
+        mdi = getattr(self.desktop, 'mdi', None)
+        if mdi is not None:
+            self._targets[id(mdi.viewport())] = ('desktop', mdi.viewport())
+        dock = getattr(self.desktop, 'dock', None)
+        strip = getattr(dock, 'strip', None)
+        if strip is not None:
+            self._targets[id(strip)] = ('dock', strip)
+        QApplication.instance().installEventFilter(self)
+        self._beat = time.perf_counter()
+        self._heartbeat.start()
+
+    def stop(self):
+        self._heartbeat.stop()
+        app = QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
+        self._targets = {}
+
+    def eventFilter(self, obj, ev):
+        kind = ev.type()
+        if kind == QEvent.Type.Timer:
+            parent = obj.parent()
+            if parent is self or parent is self.parent():
+                return False  # the HUD's own heartbeat and refresh
+            owner = type(parent).__name__ if parent is not None else type(obj).__name__
+            self.ticks.append((time.perf_counter(), owner, id(obj)))
+            return False
+        if kind != QEvent.Type.Paint and kind != QEvent.Type.UpdateRequest:
+            return False
+        key = id(obj)
+        if key in self._resending:
+            return False
+        if kind == QEvent.Type.Paint and obj is not self.parent():
+            self.paints.append((time.perf_counter(), type(obj).__name__))
+        target = self._targets.get(key)
+        if target is None or target[1] is not obj:
+            return False
+        if target[0] == 'window' and kind != QEvent.Type.UpdateRequest:
+            return False  # a frame is the whole UpdateRequest, its own paint is part of it
+        # deliver it ourselves (through the remaining filters) to time it
+        self._resending.add(key)
+        t0 = time.perf_counter()
+        try:
+            QApplication.sendEvent(obj, ev)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            self._resending.discard(key)
+        now = time.perf_counter()
+        self.samples[target[0]].append((now, (now - t0) * 1000.0))
+        return True
+
+    def _on_heartbeat(self):
+        now = time.perf_counter()
+        self.samples['loop'].append((now, max(0.0, (now - self._beat) * 1000.0 - HEARTBEAT_MS)))
+        self._beat = now
+
+    def prune(self):
+        cutoff = time.perf_counter() - HISTORY_S
+        for queue in (*self.samples.values(), self.paints, self.ticks):
+            while queue and queue[0][0] < cutoff:
+                queue.popleft()
+
+    def snapshot(self):
+        """Everything the HUD shows, computed from the last HISTORY_S seconds."""
+        self.prune()
+        now = time.perf_counter()
+        span = min(HISTORY_S, max(0.001, now - self.samples['loop'][0][0])) if self.samples['loop'] else HISTORY_S
+        probes = {name: _stats([ms for _t, ms in queue]) for name, queue in self.samples.items()}
+        rates = {name: len(queue) / span for name, queue in self.samples.items()}
+
+        paints = collections.Counter(name for _t, name in self.paints)
+        recent = [(owner, timer) for t, owner, timer in self.ticks if t >= now - 1.0]
+        owners = collections.Counter(owner for owner, _timer in recent)
+
+        histogram = [0] * (len(BUCKETS) + 1)
+        for _t, ms in self.samples['window']:
+            index = next((i for i, edge in enumerate(BUCKETS) if ms < edge), len(BUCKETS))
+            histogram[index] += 1
+
+        return {
+            'span_s': span,
+            'probes': probes,
+            'rates': rates,
+            'paints_per_s': [(name, count / span) for name, count in paints.most_common(TOP_N)],
+            'active_timers': len({timer for _owner, timer in recent}),
+            'timer_ticks_per_s': len(recent),
+            'timer_owners': owners.most_common(TOP_N),
+            'histogram': histogram,
+        }
+
+
+class FrameHUD(QWidget):
+    """The overlay; paints its own text and histogram, ignores the mouse."""
+
+    def __init__(self, desktop):
+        super().__init__(desktop)
+        self.desktop = desktop
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setFixedSize(380, 300)
+        self.probe = FrameProbe(desktop, self)
+        self._snapshot = None
+
+        self._refresh = QTimer(self)
+        self._refresh.setInterval(REFRESH_MS)
+        self._refresh.timeout.connect(self._on_refresh)
+        self.hide()
+
+    def toggle(self):
+        self.set_shown(not self.isVisible())
+
+    def set_shown(self, shown):
+        if shown:
+            self.probe.start()
+            self.desktop.installEventFilter(self)
+            self._place()
+            self.show()
+            self.raise_()
+            self._refresh.start()
+        else:
+            self._refresh.stop()
+            self.desktop.removeEventFilter(self)
+            self.probe.stop()
+            self.hide()
+
+    def eventFilter(self, obj, ev):
+        if obj is self.desktop and ev.type() == QEvent.Type.Resize:
+            self._place()
+        return False
+
+    def _place(self):
+        self.move(self.desktop.width() - self.width() - 12, 12)
+
+    def _on_refresh(self):
+        try:
+            self._snapshot = self.probe.snapshot()
+        except Exception:
+            traceback.print_exc()
+            self._snapshot = None
+        self.raise_()
+        self.update()
+
+    # Painting
+
+    def _lines(self, snap):
+        lines = []
+        for name, label in (('window', "window"), ('desktop', "desktop"), ('dock', "dock"), ('loop', "loop lag")):
+            stats = snap['probes'][name]
+            if stats is None:
+                lines.append((f"{label:<9} -", None))
+                continue
+            avg, p95, worst = stats
+            rate = "" if name == 'loop' else f"  {snap['rates'][name]:.0f}/s"
+            lines.append((f"{label:<9} avg {avg:5.1f}  p95 {p95:5.1f}  max {worst:6.1f} ms{rate}", p95))
+        owners = ", ".join(f"{owner} {count}" for owner, count in snap['timer_owners'])
+        lines.append((f"timers    {snap['active_timers']} active, {snap['timer_ticks_per_s']}/s", None))
+        if owners:
+            lines.append((f"  {owners}", None))
+        paints = ", ".join(f"{name} {rate:.0f}" for name, rate in snap['paints_per_s'])
+        lines.append((f"paints/s  {paints or '-'}", None))
+        detector = stall_detector.get_detector()
+        if detector is not None and detector.stalls:
+            stall = detector.stalls[-1]
+            lines.append((f"last stall {stall['duration_ms']:.0f} ms in {stall['app']} ({stall['time'][-8:]})", None))
+        return lines
+
+    @staticmethod
+    def _color(ms):
+        if ms is None or ms < 16.7:
+            return QColor(170, 255, 170)
+        return QColor(255, 220, 120) if ms < 33.3 else QColor(255, 130, 130)
+
+    def paintEvent(self, ev):
+        p = QPainter(self)
+        p.fillRect(self.rect(), QColor(0, 0, 0, 190))
+        font = QFont("monospace")
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setPixelSize(11)
+        p.setFont(font)
+        p.setPen(QColor('white'))
+        p.drawText(8, 16, "Frame HUD  (Ctrl+Shift+H)")
+        snap = self._snapshot
+        if snap is None:
+            p.drawText(8, 34, "collecting...")
+            p.end()
+            return
+
+        y = 34
+        for text, worst in self._lines(snap):
+            p.setPen(self._color(worst))
+            p.drawText(8, y, text)
+            y += 15
+
+        # frame-time histogram of the last HISTORY_S seconds
+        chart = QRect(8, y + 4, self.width() - 16, self.height() - y - 26)
+        counts = snap['histogram']
+        top = max(counts) or 1
+        width = chart.width() // len(counts)
+        labels = [f"<{edge:g}" for edge in BUCKETS] + [f"{BUCKETS[-1]:g}+"]
+        for i, count in enumerate(counts):
+            height = int(chart.height() * count / top)
+            edge = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1] + 1
+            bar = QRect(chart.left() + i * width + 2, chart.bottom() - height, width - 4, height)
+            p.fillRect(bar, self._color(edge - 0.01))
+            p.setPen(QColor(200, 200, 200))
+            p.drawText(QRect(chart.left() + i * width, chart.bottom() + 2, width, 14),
+                       Qt.AlignmentFlag.AlignHCenter, labels[i])
+            if count:
+                p.drawText(QRect(bar.left(), bar.top() - 14, bar.width(), 14), Qt.AlignmentFlag.AlignHCenter, str(count))
+        p.end()
+
+
+# One HUD per desktop
+
+_hud = None
+
+
+def toggle(desktop):
+    """Show or hide the HUD over `desktop` (created on first use)."""
+    global _hud
+    if _hud is None or _hud.desktop is not desktop:
+        _hud = FrameHUD(desktop)
+    _hud.toggle()
+    return _hud
+
+
+def get_hud():
+    return _hud
@@ -139,6 +139,12 @@ class IconAdderArea(QWidget):
         self.icons.clear()
         self.update()
 
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        # icons may be restored before the desktop has its final size
+        if ev.oldSize().width() != ev.size().width():
+            self._relayout_icons()
+
     def _relayout_icons(self):
         if not self.icons:
             return
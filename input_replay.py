@@ -0,0 +1,322 @@
+import os
+import sys
+import json
+import time
+import traceback
+
+from PyQt6.QtCore import Qt, QObject, QTimer, QEvent, QEventLoop, QPoint, QPointF, pyqtSignal
+from PyQt6.QtGui import QCursor, QKeyEvent, QMouseEvent, QWheelEvent, QWindow
+from PyQt6.QtWidgets import QApplication, QLineEdit
+
+from app_pool import process_rss
+from stall_detector import StallDetector
+
+# Input record / replay
+#
+# Record a real session with `python Luxxer_OS.py --record-input[=path]` (or
+# LUX_RECORD_INPUT=path): mouse, wheel and key events are captured where they
+# enter a top-level window, with the time since recording started and the
+# position relative to that window, and written as JSON when the shell quits.
+# Characters typed into password fields are recorded as 'x'.
+#
+# `python perf_bench.py replay <file> [--speed 4]` plays the file back against
+# an offscreen desktop of the same size and reports frame times, main-thread
+# stalls and peak memory. Events go through the same window -> widget dispatch
+# as real input, so dock magnification, marquee selection, window drags and
+# MDI animations all run.
+
+ENV_VAR = "LUX_RECORD_INPUT"
+CLI_FLAG = "--record-input"
+DEFAULT_FILE = "input_session.json"
+FORMAT_VERSION = 1
+SETTLE_MS = 1000
+RSS_SAMPLE_MS = 50
+
+_MOUSE_EVENTS = {QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                 QEvent.Type.MouseButtonDblClick, QEvent.Type.MouseMove}
+_KEY_EVENTS = {QEvent.Type.KeyPress, QEvent.Type.KeyRelease}
+_RECORDED = _MOUSE_EVENTS | _KEY_EVENTS | {QEvent.Type.Wheel}
+
+
+def recording_path():
+    """Where to record this session's input, or None when not requested."""
+    value = os.environ.get(ENV_VAR, "")
+    for arg in sys.argv[1:]:
+        if arg == CLI_FLAG:
+            value = value or "1"
+        elif arg.startswith(CLI_FLAG + "="):
+            value = arg.split("=", 1)[1] or "1"
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return DEFAULT_FILE
+    return value
+
+
+def _widget_for_window(window):
+    for widget in QApplication.topLevelWidgets():
+        if widget.windowHandle() is window:
+            return widget
+    return None
+
+
+def _window_key(widget):
+    return {'class': type(widget).__name__, 'title': widget.windowTitle(), 'name': widget.objectName()}
+
+
+def _find_window(key):
+    visible = [w for w in QApplication.topLevelWidgets() if w.isVisible()]
+    for match in (lambda w: _window_key(w) == key,
+                  lambda w: type(w).__name__ == key.get('class') and w.windowTitle() == key.get('title'),
+                  lambda w: type(w).__name__ == key.get('class')):
+        found = [w for w in visible if match(w)]
+        if found:
+            return found[-1]
+    return None
+
+
+def _xy(point):
+    return [round(point.x(), 1), round(point.y(), 1)]
+
+
+def _typing_secret():
+    # password fields (SSH, Mail, SecureVault...) echo as dots or nothing
+    focus = QApplication.focusWidget()
+    return isinstance(focus, QLineEdit) and focus.echoMode() != QLineEdit.EchoMode.Normal
+
+
+def _key_fields(ev):
+    key, text = ev.key(), ev.text()
+    if text and text.isprintable() and _typing_secret():
+        # never write what was typed; an 'x' keeps the same work for the replay
+        key, text = Qt.Key.Key_X.value, 'x'
+    return {'key': key, 'text': text, 'repeat': ev.isAutoRepeat()}
+
+
+# Recording
+
+class InputRecorder(QObject):
+    def __init__(self, path=DEFAULT_FILE, desktop=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.desktop = desktop
+        self.events = []
+        self._t0 = None
+
+    def start(self):
+        self._t0 = time.monotonic()
+        QApplication.instance().installEventFilter(self)
+        print(f"[InputRecorder] Recording input to {os.path.abspath(self.path)}")
+
+    def stop(self):
+        app = QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
+
+    def eventFilter(self, obj, ev):
+        # every input event passes through its QWindow exactly once, before
+        # it is dispatched (and possibly propagated) to the widgets
+        if ev.type() in _RECORDED and isinstance(obj, QWindow):
+            try:
+                self._record(obj, ev)
+            except Exception:
+                traceback.print_exc()
+        return False
+
+    def _record(self, window, ev):
+        widget = _widget_for_window(window)
+        if widget is None:
+            return
+        kind = ev.type()
+        entry = {'t': round((time.monotonic() - self._t0) * 1000.0, 2), 'type': kind.name,
+                 'window': _window_key(widget), 'mods': ev.modifiers().value}
+        if kind in _KEY_EVENTS:
+            entry.update(_key_fields(ev))
+        else:
+            entry.update(pos=_xy(ev.position()), buttons=ev.buttons().value)
+            if kind == QEvent.Type.Wheel:
+                entry.update(angle=_xy(ev.angleDelta()), pixel=_xy(ev.pixelDelta()))
+            else:
+                entry['button'] = ev.button().value
+        self.events.append(entry)
+
+    def save(self, path=None):
+        path = path or self.path
+        size = self.desktop.size() if self.desktop is not None else None
+        data = {
+            'version': FORMAT_VERSION,
+            'recorded': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'desktop_size': [size.width(), size.height()] if size is not None else None,
+            'events': self.events,
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            print(f"[InputRecorder] Wrote {len(self.events)} events to {os.path.abspath(path)}")
+        except Exception:
+            traceback.print_exc()
+        return path
+
+
+def load_session(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported input recording version {data.get('version')!r}")
+    return data
+
+
+# Replay
+
+class InputPlayer(QObject):
+    """Posts recorded events at their recorded times divided by `speed` (0 = as fast as possible)."""
+    finished = pyqtSignal()
+
+    def __init__(self, events, speed=1.0, parent=None):
+        super().__init__(parent)
+        self.events = list(events)
+        self.speed = float(speed)
+        self.delivered = 0
+        self.missed = 0
+        self._index = 0
+        self._t0 = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._play_due)
+
+    def start(self):
+        self._t0 = time.monotonic()
+        self._index = 0
+        self._timer.start(0)
+
+    def _due_ms(self, entry):
+        return entry['t'] / self.speed if self.speed > 0 else 0.0
+
+    def _play_due(self):
+        elapsed = (time.monotonic() - self._t0) * 1000.0
+        while self._index < len(self.events):
+            entry = self.events[self._index]
+            if self._due_ms(entry) > elapsed:
+                self._timer.start(max(0, int(self._due_ms(entry) - elapsed)))
+                return
+            self._index += 1
+            try:
+                self._deliver(entry)
+            except Exception:
+                self.missed += 1
+                traceback.print_exc()
+            if self.speed <= 0:
+                # still let timers, animations and paints run between events
+                self._timer.start(0)
+                return
+        self.finished.emit()
+
+    def _deliver(self, entry):
+        window = _find_window(entry['window'])
+        handle = window.windowHandle() if window is not None else None
+        if handle is None:
+            self.missed += 1
+            return
+        kind = QEvent.Type[entry['type']]
+        mods = Qt.KeyboardModifier(entry.get('mods', 0))
+        if kind in _KEY_EVENTS:
+            ev = QKeyEvent(kind, entry['key'], mods, entry.get('text', ''), entry.get('repeat', False))
+        else:
+            pos = QPointF(*entry['pos'])
+            global_pos = QPointF(window.mapToGlobal(pos.toPoint()))
+            # the dock reads QCursor.pos() rather than event positions
+            QCursor.setPos(global_pos.toPoint())
+            buttons = Qt.MouseButton(entry.get('buttons', 0))
+            if kind == QEvent.Type.Wheel:
+                ev = QWheelEvent(pos, global_pos, QPoint(*map(int, entry.get('pixel', (0, 0)))),
+                                 QPoint(*map(int, entry.get('angle', (0, 0)))), buttons, mods,
+                                 Qt.ScrollPhase.NoScrollPhase, False)
+            else:
+                ev = QMouseEvent(kind, pos, global_pos, Qt.MouseButton(entry.get('button', 0)), buttons, mods)
+        QApplication.sendEvent(handle, ev)
+        self.delivered += 1
+
+
+class FrameTimer(QObject):
+    """Times every frame (UpdateRequest: layout, paint and flush of a top-level window)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frames = []
+        self._inside = False
+
+    def start(self):
+        QApplication.instance().installEventFilter(self)
+
+    def stop(self):
+        app = QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
+
+    def eventFilter(self, obj, ev):
+        if ev.type() != QEvent.Type.UpdateRequest or self._inside:
+            return False
+        if not (isinstance(obj, QWindow) or (obj.isWidgetType() and obj.isWindow())):
+            return False
+        self._inside = True
+        t0 = time.perf_counter()
+        try:
+            obj.event(ev)
+        finally:
+            self._inside = False
+        self.frames.append((time.perf_counter() - t0) * 1000.0)
+        return True
+
+
+def _peak_rss_fallback():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except Exception:
+        return 0
+
+
+def replay(session, desktop, speed=1.0, settle_ms=SETTLE_MS, registry=None):
+    """Play `session` (see load_session) against `desktop` and return a report dict."""
+    size = session.get('desktop_size')
+    if size:
+        desktop.resize(*size)
+    desktop.show()
+    QApplication.processEvents()
+
+    frames = FrameTimer()
+    stalls = StallDetector(registry, threshold_ms=50, log_file=None)
+    player = InputPlayer(session.get('events', []), speed=speed)
+    peak = [process_rss()]
+    sampler = QTimer()
+    sampler.setInterval(RSS_SAMPLE_MS)
+    sampler.timeout.connect(lambda: peak.__setitem__(0, max(peak[0], process_rss())))
+
+    loop = QEventLoop()
+    # let animations and deferred work started by the last events finish
+    player.finished.connect(lambda: QTimer.singleShot(settle_ms, loop.quit))
+
+    frames.start()
+    stalls.start()
+    sampler.start()
+    t0 = time.monotonic()
+    player.start()
+    loop.exec()
+    duration = (time.monotonic() - t0) * 1000.0
+    sampler.stop()
+    stalls.stop()
+    frames.stop()
+
+    return {
+        'events': len(player.events),
+        'delivered': player.delivered,
+        'missed': player.missed,
+        'speed': speed,
+        'duration_ms': round(duration, 1),
+        'frames_ms': frames.frames,
+        'stalls': list(stalls.stalls),
+        'max_latency_ms': round(stalls.max_latency_ms, 1),
+        'peak_rss_bytes': peak[0] or _peak_rss_fallback(),
+    }
@@ -0,0 +1,203 @@
+import gc
+import os
+import sys
+import json
+import time
+import types
+import weakref
+import traceback
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QTimer
+
+# Leak detector for closed app windows
+#
+# watch() keeps a weakref to a closed app widget. After a grace period (and one
+# gc.collect() for the whole batch, if anything survived) anything still alive
+# is reported, with a few referrer chains showing what holds it: a lambda, a
+# bound method, an attribute of another object, a module global... A lambda
+# with no Python referrers is usually held by a Qt signal connection.
+
+LOG_FILE = "leak_log.jsonl"
+GRACE_MS = 5000
+MAX_DEPTH = 5
+MAX_CHAINS = 4
+
+
+class LeakDetector(QObject):
+    def __init__(self, grace_ms=GRACE_MS, log_file=LOG_FILE, parent=None):
+        super().__init__(parent)
+        self.grace_ms = grace_ms
+        self.log_file = log_file
+        self.watched = 0
+        self.collected = 0
+        self.leaked = 0
+        self.reports = []
+        self._pending = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.check)
+
+    def watch(self, name, widget):
+        try:
+            ref = weakref.ref(widget)
+        except TypeError:
+            return
+        self.watched += 1
+        self._pending.append((name, ref, type(widget).__name__, time.monotonic()))
+        if not self._timer.isActive():
+            self._timer.start(self.grace_ms)
+
+    def stats(self):
+        return {'watched': self.watched, 'collected': self.collected, 'leaked': self.leaked,
+                'pending': len(self._pending)}
+
+    def check(self):
+        """Collect and report everything whose grace period is over."""
+        if not self._pending:
+            return
+        now = time.monotonic()
+        due = [p for p in self._pending if (now - p[3]) * 1000 >= self.grace_ms]
+        self._pending = [p for p in self._pending if p not in due]
+        if self._pending:
+            self._timer.start(self.grace_ms)
+        if not due:
+            return
+        # most windows are freed by reference counting: only pay for a full collection
+        # (it stalls the GUI thread on a large heap) when something is still alive
+        if any(ref() is not None for _name, ref, _cls, _closed_at in due):
+            gc.collect()
+        for name, ref, cls_name, _closed_at in due:
+            obj = ref()
+            if obj is None:
+                self.collected += 1
+                continue
+            self.leaked += 1
+            report = {
+                'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'app': name,
+                'class': cls_name,
+                'qt_deleted': sip.isdeleted(obj),
+                'referrers': referrer_chains(obj),
+            }
+            del obj
+            self.reports.append(report)
+            self._log(report)
+
+    def _log(self, report):
+        print(f"[LeakDetector] '{report['app']}' ({report['class']}) still alive "
+              f"{self.grace_ms} ms after close (Qt object deleted: {report['qt_deleted']})")
+        for chain in report['referrers']:
+            print("    " + " <- ".join(chain))
+        if not self.log_file:
+            return
+        try:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report) + "\n")
+        except Exception:
+            traceback.print_exc()
+
+
+# Referrer chains
+
+def _where(code):
+    return f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}"
+
+
+def _key_of(d, child):
+    # plain loop: a generator expression would put `child` in a closure cell,
+    # which then shows up as a referrer itself
+    for k, v in d.items():
+        if v is child:
+            return k
+    return None
+
+
+def _describe(ref, child):
+    if isinstance(ref, types.FunctionType):
+        return f"function {ref.__qualname__} ({_where(ref.__code__)})"
+    if isinstance(ref, types.MethodType):
+        return f"bound method {ref.__qualname__}"
+    if isinstance(ref, types.CellType):
+        return "closure cell"
+    if isinstance(ref, types.ModuleType):
+        return f"module {ref.__name__}"
+    if isinstance(ref, dict):
+        key = _key_of(ref, child)
+        if '__name__' in ref and '__builtins__' in ref:
+            return f"global {key!r} in module {ref['__name__']}"
+        return f"dict[{key!r}]" if key is not None else "dict value"
+    if isinstance(ref, (list, tuple, set, frozenset)):
+        return f"{type(ref).__name__} of {len(ref)}"
+    attrs = getattr(ref, '__dict__', None)
+    key = _key_of(attrs, child) if isinstance(attrs, dict) else None
+    if key is not None:
+        return f"attribute {key!r} of {type(ref).__qualname__}"
+    return f"{type(ref).__module__}.{type(ref).__qualname__} object"
+
+
+def _is_root(ref):
+    return isinstance(ref, (types.ModuleType, type)) or (
+        isinstance(ref, dict) and '__name__' in ref and '__builtins__' in ref)
+
+
+def _instance_dicts(d):
+    # an object's __dict__: report it as "attribute x of Owner" instead of a bare dict
+    for owner in gc.get_referrers(d):
+        if getattr(owner, '__dict__', None) is d:
+            return owner
+    return None
+
+
+def referrer_chains(obj, max_depth=MAX_DEPTH, max_chains=MAX_CHAINS):
+    chains = []
+    this_frame = sys._getframe()
+    ignore = {id(this_frame), id(chains)}
+
+    def walk(node, path, depth, seen):
+        if len(chains) >= max_chains:
+            return
+        refs = [r for r in gc.get_referrers(node)
+                if id(r) not in ignore and id(r) not in seen and not isinstance(r, types.FrameType)]
+        ignore.add(id(refs))
+        if not refs:
+            hint = " (no Python referrers: held from C++, e.g. a signal connection)" \
+                if isinstance(node, types.FunctionType) else " (no Python referrers)"
+            chains.append(path[:-1] + [path[-1] + hint] if path else ["<unknown>" + hint])
+            return
+        for ref in refs:
+            if len(chains) >= max_chains:
+                return
+            label = _describe(ref, node)
+            owner = _instance_dicts(ref) if isinstance(ref, dict) and not _is_root(ref) else None
+            nxt = ref
+            if owner is not None:
+                label = f"attribute {_key_of(ref, node)!r} of {type(owner).__qualname__}"
+                nxt = owner
+            step = path + [label]
+            if _is_root(ref) or depth + 1 >= max_depth:
+                chains.append(step)
+            else:
+                walk(nxt, step, depth + 1, seen | {id(ref), id(nxt)})
+
+    try:
+        walk(obj, [], 0, {id(obj)})
+    except Exception:
+        traceback.print_exc()
+    return chains
+
+
+# Process-wide detector
+
+_detector = None
+
+
+def install(grace_ms=GRACE_MS, log_file=LOG_FILE):
+    global _detector
+    if _detector is None:
+        _detector = LeakDetector(grace_ms=grace_ms, log_file=log_file)
+    return _detector
+
+
+def get_detector():
+    return _detector
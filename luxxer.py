@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+
+import engines
+
+# Headless command line for the heavy app engines
+#
+#     python -m luxxer resize  <folder> --width 800 --height 600
+#     python -m luxxer hash    <file or folder>... [--algo sha256]
+#     python -m luxxer backup  <folder> <archive.tar.gz>
+#     python -m luxxer restore <archive.tar.gz> <folder>
+#     python -m luxxer zip     <file or folder> <archive.zip>
+#     python -m luxxer portscan <host> [--ports 1-1024] [--timeout 0.5] [--workers 64]
+#     python -m luxxer avscan  [--state app_state.json | --path <folder>]
+#
+# No widgets and no QApplication are created (resize only uses QImage). Every
+# line on stdout is one JSON object:
+#
+#     {"tool": "hash", "event": "progress", "done": 3, "total": 10, "item": "..."}
+#     {"tool": "hash", "event": "result", ...}
+#     {"tool": "hash", "event": "done", "ok": true, "elapsed_s": 1.2, ...}
+#
+# or {"event": "error", "message": ...} with exit status 1. --no-progress
+# drops the progress lines.
+
+PROGRESS_MIN_INTERVAL = 0.2
+
+
+class Reporter:
+    def __init__(self, tool, progress=True, out=None):
+        self.tool = tool
+        self.progress_enabled = progress
+        self.out = out or sys.stdout
+        self.started = time.monotonic()
+        self._last_progress = 0.0
+
+    def emit(self, event, **fields):
+        self.out.write(json.dumps({'tool': self.tool, 'event': event, **fields}) + "\n")
+        self.out.flush()
+
+    def progress(self, done, total, item):
+        if not self.progress_enabled:
+            return
+        # at most every PROGRESS_MIN_INTERVAL, but always the last one
+        now = time.monotonic()
+        if done < total and now - self._last_progress < PROGRESS_MIN_INTERVAL:
+            return
+        self._last_progress = now
+        self.emit('progress', done=done, total=total, item=str(item))
+
+    def done(self, **fields):
+        self.emit('done', ok=True, elapsed_s=round(time.monotonic() - self.started, 3), **fields)
+
+
+def _parse_ports(spec):
+    ports = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            ports.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            ports.append(int(part))
+    if not ports or min(ports) < 1 or max(ports) > 65535:
+        raise argparse.ArgumentTypeError(f"invalid port list: {spec!r}")
+    return ports
+
+
+# Tools
+
+def cmd_resize(args, rep):
+    results = engines.resize_images(args.folder, args.width, args.height, progress=rep.progress)
+    for source, output in results:
+        rep.emit('result', source=source, output=output, ok=output is not None)
+    rep.done(images=len(results), resized=sum(1 for _s, o in results if o))
+
+
+def cmd_hash(args, rep):
+    results = engines.hash_files(args.paths, args.algo, progress=rep.progress)
+    for path, digest, error in results:
+        if error:
+            rep.emit('result', path=path, ok=False, error=error)
+        else:
+            rep.emit('result', path=path, ok=True, algo=args.algo, digest=digest)
+    rep.done(files=len(results), failed=sum(1 for r in results if r[2]))
+
+
+def cmd_backup(args, rep):
+    count = engines.create_backup(args.folder, args.archive, progress=rep.progress)
+    rep.done(archive=os.path.abspath(args.archive), entries=count, bytes=os.path.getsize(args.archive))
+
+
+def cmd_restore(args, rep):
+    count = engines.restore_backup(args.archive, args.folder, progress=rep.progress)
+    rep.done(folder=os.path.abspath(args.folder), entries=count)
+
+
+def cmd_zip(args, rep):
+    archive = engines.create_zip(args.source, args.archive)
+    rep.done(archive=archive, bytes=os.path.getsize(archive))
+
+
+def cmd_portscan(args, rep):
+    open_ports = engines.scan_ports(args.host, args.ports, timeout=args.timeout, workers=args.workers,
+                                    progress=rep.progress,
+                                    on_open=lambda port: rep.emit('result', host=args.host, port=port, open=True))
+    rep.done(host=args.host, scanned=len(args.ports), open_ports=open_ports)
+
+
+def cmd_avscan(args, rep):
+    if args.path:
+        entries = engines.file_entries(args.path)
+    else:
+        with open(args.state, "r", encoding="utf-8") as f:
+            entries = engines.vfs_entries(json.load(f).get('files', {}))
+    found = engines.av_scan(entries, args.signature or engines.AV_SIGNATURES, progress=rep.progress,
+                            on_found=lambda p, sig: rep.emit('result', path=p, signature=sig))
+    rep.done(scanned=len(entries), threats=len(found))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m luxxer", description="Run Luxxer app engines headless.")
+    parser.add_argument("--no-progress", action="store_true", help="only print results and the summary")
+    sub = parser.add_subparsers(dest="tool", required=True)
+
+    p = sub.add_parser("resize", help="batch-resize images (Image Batch Resizer)")
+    p.add_argument("folder")
+    p.add_argument("--width", type=int, default=800)
+    p.add_argument("--height", type=int, default=600)
+    p.set_defaults(func=cmd_resize)
+
+    p = sub.add_parser("hash", help="hash files (Cyber Tools)")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--algo", default="sha256")
+    p.set_defaults(func=cmd_hash)
+
+    p = sub.add_parser("backup", help="create a .tar.gz backup (BackupRestore)")
+    p.add_argument("folder")
+    p.add_argument("archive")
+    p.set_defaults(func=cmd_backup)
+
+    p = sub.add_parser("restore", help="restore a .tar.gz backup (BackupRestore)")
+    p.add_argument("archive")
+    p.add_argument("folder")
+    p.set_defaults(func=cmd_restore)
+
+    p = sub.add_parser("zip", help="create a zip archive (WinRAR)")
+    p.add_argument("source")
+    p.add_argument("archive")
+    p.set_defaults(func=cmd_zip)
+
+    p = sub.add_parser("portscan", help="scan TCP ports (PortScanner)")
+    p.add_argument("host")
+    p.add_argument("--ports", type=_parse_ports, default=list(range(1, 1025)), help="e.g. 1-1024,8080")
+    p.add_argument("--timeout", type=float, default=engines.PORT_TIMEOUT)
+    p.add_argument("--workers", type=int, default=engines.PORT_WORKERS)
+    p.set_defaults(func=cmd_portscan)
+
+    p = sub.add_parser("avscan", help="signature scan (GuardianAV)")
+    src = p.add_mutually_exclusive_group()
+    src.add_argument("--state", default="app_state.json", help="scan the virtual FS in this state file")
+    src.add_argument("--path", help="scan the files under a real folder instead")
+    p.add_argument("--signature", action="append", help="signature to look for (repeatable)")
+    p.set_defaults(func=cmd_avscan)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    rep = Reporter(args.tool, progress=not args.no_progress)
+    try:
+        args.func(args, rep)
+    except KeyboardInterrupt:
+        rep.emit('error', message="interrupted")
+        return 130
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        rep.emit('error', message=str(e), type=type(e).__name__)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
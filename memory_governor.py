@@ -0,0 +1,259 @@
+import gc
+import time
+import weakref
+import itertools
+import traceback
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QPixmapCache
+
+# Memory-pressure governor
+#
+# Subsystems that hold memory they can give back register a cache:
+#
+#     memory_governor.register("ImageEditorPro undo", self._history_bytes, self._trim_history,
+#                              priority=memory_governor.PRIORITY_HISTORY, owner=self)
+#
+# size_fn() returns the current estimate in bytes, evict_fn(level) frees what
+# it can (level is LEVEL_LOW or LEVEL_CRITICAL) and may return the bytes freed;
+# bound methods are held weakly, so registering never keeps a widget alive.
+# The governor polls psutil.virtual_memory(); above low_percent it evicts the
+# lowest priorities first until enough is estimated free, above critical_percent
+# it evicts everything, clears QPixmapCache and runs gc. It also owns the
+# QPixmapCache limit, which shrinks while memory is tight.
+#
+# Without psutil there is no polling; relieve() can still be called by hand.
+
+LEVEL_NORMAL = 0
+LEVEL_LOW = 1
+LEVEL_CRITICAL = 2
+LEVEL_NAMES = {LEVEL_NORMAL: "normal", LEVEL_LOW: "low", LEVEL_CRITICAL: "critical"}
+
+# evicted first: pure caches that are rebuilt on demand
+PRIORITY_CACHE = 0
+# state the user may miss (undo steps)
+PRIORITY_HISTORY = 50
+# data that must be spilled to disk rather than dropped (recordings)
+PRIORITY_BUFFER = 100
+
+POLL_MS = 2000
+COOLDOWN_MS = 10000
+HYSTERESIS_PERCENT = 5
+PIXMAP_CACHE_MB = 32
+
+
+def pixmap_bytes(pixmap):
+    """Approximate memory held by a QPixmap/QImage (0 for None or null)."""
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+
+def _weak(fn):
+    # bound methods are held weakly so a registration never keeps an app widget alive
+    if hasattr(fn, '__self__') and hasattr(fn, '__func__'):
+        method = weakref.WeakMethod(fn)
+        return lambda: method()
+    return lambda: fn
+
+
+class _Cache:
+    def __init__(self, key, name, size_fn, evict_fn, priority, owner_ref):
+        self.key = key
+        self.name = name
+        self._size_fn = _weak(size_fn)
+        self._evict_fn = _weak(evict_fn)
+        self.priority = priority
+        self.owner_ref = owner_ref
+        self.evictions = 0
+        self.freed = 0
+
+    def alive(self):
+        if self._size_fn() is None or self._evict_fn() is None:
+            return False
+        if self.owner_ref is None:
+            return True
+        owner = self.owner_ref()
+        return owner is not None and not sip.isdeleted(owner)
+
+    def size(self):
+        fn = self._size_fn()
+        try:
+            return max(0, int(fn() or 0)) if fn is not None else 0
+        except Exception:
+            traceback.print_exc()
+            return 0
+
+    def evict(self, level):
+        fn = self._evict_fn()
+        return fn(level) if fn is not None else 0
+
+
+class MemoryGovernor(QObject):
+    pressure_changed = pyqtSignal(int)
+
+    def __init__(self, low_percent=80, critical_percent=90, poll_ms=POLL_MS,
+                 pixmap_cache_mb=PIXMAP_CACHE_MB, parent=None):
+        super().__init__(parent)
+        self.low_percent = low_percent
+        self.critical_percent = max(critical_percent, low_percent)
+        self.pixmap_cache_kb = int(pixmap_cache_mb * 1024)
+        self.level = LEVEL_NORMAL
+        self.reliefs = 0
+        self.last_percent = None
+        self._caches = {}
+        self._ids = itertools.count(1)
+        self._last_relief = (LEVEL_NORMAL, 0.0)
+        QPixmapCache.setCacheLimit(self.pixmap_cache_kb)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(poll_ms)
+        self._timer.timeout.connect(self.check)
+
+    def start(self):
+        if psutil is None:
+            print("[MemoryGovernor] psutil not available, memory pressure is not monitored")
+            return
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    # Registration
+
+    def register(self, name, size_fn, evict_fn, priority=PRIORITY_CACHE, owner=None):
+        """Register a cache; returns a key for unregister(). With owner=<QObject> it is dropped with the owner."""
+        key = next(self._ids)
+        owner_ref = weakref.ref(owner) if owner is not None else None
+        self._caches[key] = _Cache(key, name, size_fn, evict_fn, priority, owner_ref)
+        if owner is not None:
+            owner.destroyed.connect(lambda _obj=None, k=key: self.unregister(k))
+        return key
+
+    def unregister(self, key):
+        self._caches.pop(key, None)
+
+    def caches(self):
+        return [{'name': c.name, 'priority': c.priority, 'bytes': c.size(),
+                 'evictions': c.evictions, 'freed': c.freed}
+                for c in self._live_caches()]
+
+    def estimated_bytes(self):
+        return sum(c.size() for c in self._live_caches())
+
+    def stats(self):
+        return {
+            'level': LEVEL_NAMES[self.level],
+            'memory_percent': self.last_percent,
+            'reliefs': self.reliefs,
+            'pixmap_cache_kb': QPixmapCache.cacheLimit(),
+            'caches': self.caches(),
+        }
+
+    def _live_caches(self):
+        for key, cache in list(self._caches.items()):
+            if not cache.alive():
+                self._caches.pop(key, None)
+        return list(self._caches.values())
+
+    # Pressure
+
+    def _level_for(self, percent):
+        if percent >= self.critical_percent:
+            return LEVEL_CRITICAL
+        if percent >= self.low_percent:
+            return LEVEL_LOW
+        if self.level != LEVEL_NORMAL and percent > self.low_percent - HYSTERESIS_PERCENT:
+            return LEVEL_LOW  # stay low until usage drops clearly below the threshold
+        return LEVEL_NORMAL
+
+    def check(self):
+        try:
+            vm = psutil.virtual_memory()
+        except Exception:
+            traceback.print_exc()
+            return
+        self.last_percent = vm.percent
+        level = self._level_for(vm.percent)
+        if level != self.level:
+            self.level = level
+            self._apply_pixmap_limit(level)
+            self.pressure_changed.emit(level)
+        if level == LEVEL_NORMAL:
+            return
+        last_level, last_time = self._last_relief
+        if level > last_level or (time.monotonic() - last_time) * 1000 >= COOLDOWN_MS:
+            target = self.low_percent - HYSTERESIS_PERCENT
+            needed = int(max(0.0, vm.percent - target) / 100.0 * vm.total)
+            self.relieve(level, needed)
+
+    def _apply_pixmap_limit(self, level):
+        QPixmapCache.setCacheLimit(self.pixmap_cache_kb if level == LEVEL_NORMAL
+                                   else max(1024, self.pixmap_cache_kb // 4))
+
+    def relieve(self, level=LEVEL_LOW, needed_bytes=None):
+        """Evict registered caches, lowest priority (then largest) first; returns the estimated bytes freed.
+
+        LEVEL_LOW stops once `needed_bytes` are freed (None = evict every
+        cache below PRIORITY_BUFFER); LEVEL_CRITICAL evicts everything."""
+        self._last_relief = (level, time.monotonic())
+        self.reliefs += 1
+        freed = 0
+        report = []
+        caches = sorted(((c, c.size()) for c in self._live_caches()), key=lambda cs: (cs[0].priority, -cs[1]))
+        for cache, before in caches:
+            if level == LEVEL_LOW:
+                if needed_bytes is not None and freed >= needed_bytes:
+                    break
+                if needed_bytes is None and cache.priority >= PRIORITY_BUFFER:
+                    break
+            if before <= 0:
+                continue
+            try:
+                result = cache.evict(level)
+            except Exception:
+                traceback.print_exc()
+                continue
+            got = int(result) if isinstance(result, (int, float)) else max(0, before - cache.size())
+            cache.evictions += 1
+            cache.freed += got
+            freed += got
+            report.append(f"{cache.name} {got / (1024 * 1024):.1f} MB")
+        if level >= LEVEL_CRITICAL:
+            QPixmapCache.clear()
+            gc.collect()
+        percent = f"{self.last_percent:.0f}% " if self.last_percent is not None else ""
+        print(f"[MemoryGovernor] memory {percent}({LEVEL_NAMES[level]}): freed ~{freed / (1024 * 1024):.1f} MB"
+              + (f" ({', '.join(report)})" if report else ""))
+        return freed
+
+
+# Process-wide governor
+
+_governor = None
+
+
+def install(low_percent=80, critical_percent=90, pixmap_cache_mb=PIXMAP_CACHE_MB, poll_ms=POLL_MS):
+    global _governor
+    if _governor is None:
+        _governor = MemoryGovernor(low_percent=low_percent, critical_percent=critical_percent,
+                                   poll_ms=poll_ms, pixmap_cache_mb=pixmap_cache_mb)
+    _governor.start()
+    return _governor
+
+
+def get_governor():
+    return _governor
+
+
+def register(name, size_fn, evict_fn, priority=PRIORITY_CACHE, owner=None):
+    """Register with the installed governor; a no-op returning None when none is installed."""
+    if _governor is None:
+        return None
+    return _governor.register(name, size_fn, evict_fn, priority=priority, owner=owner)
@@ -0,0 +1,604 @@
+import os
+import sys
+import csv
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+import traceback
+from unittest import mock
+
+# no display needed; must be set before Qt is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPoint, QSize, QEvent, QEventLoop, QTimer, QT_VERSION_STR
+from PyQt6.QtGui import QColor, QImage, QPainter, QLinearGradient, QTextDocument
+from PyQt6.QtWidgets import QApplication, QFileDialog
+
+# Headless performance benchmarks
+#
+#     python perf_bench.py                      run everything, write bench_results.json
+#     python perf_bench.py run --only dock,paint
+#     python perf_bench.py baseline             run and save bench_baseline.json
+#     python perf_bench.py compare              run and compare against the baseline
+#     python perf_bench.py compare --results bench_results.json
+#     python perf_bench.py replay input_session.json --speed 4
+#
+# Each benchmark records per-call times in ms; compare flags anything whose
+# median got slower than the baseline by more than --threshold (and by more
+# than MIN_DELTA_MS, to ignore timer noise). Counters for leaked app widgets and
+# idle dock ticks are flagged as soon as they go up. Exit status is 1 when
+# something regressed.
+# replay plays back a session recorded with `Luxxer_OS.py --record-input` (see
+# input_replay.py) and saves frame times, stalls and peak memory the same way,
+# so two replay results can be compared with --baseline/--results.
+
+RESULTS_FILE = "bench_results.json"
+REPLAY_RESULTS_FILE = "replay_results.json"
+BASELINE_FILE = "bench_baseline.json"
+STRICT_COUNTERS = ("dock_idle_ticks",)
+DEFAULT_THRESHOLD = 0.15
+MIN_DELTA_MS = 0.05
+STARTUP_CHILD_FLAG = "--startup-child"
+
+# apps opened and closed by the leak benchmark (no dialogs, network or hardware on start)
+OPEN_CLOSE_APPS = ['Calculator', 'Spreadsheet', 'ClipboardManager', 'CSVEditorPro', 'ClipStack']
+
+_benchmarks = []
+
+
+def benchmark(group):
+    def register(fn):
+        _benchmarks.append((group, fn))
+        return fn
+    return register
+
+
+def _run_for(ms, until=None):
+    """Run the event loop for `ms`, or until until() is true (checked every few ms)."""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    if until is not None:
+        poll = QTimer()
+        poll.setInterval(5)
+        poll.timeout.connect(lambda: until() and loop.quit())
+        poll.start()
+    loop.exec()
+
+
+def _process_deletes():
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    QApplication.processEvents()
+
+
+class Bench:
+    """Collects timings and counters for one run."""
+
+    def __init__(self, repeat_scale=1.0):
+        self.repeat_scale = repeat_scale
+        self.results = {}
+        self.counters = {}
+        self._desktop = None
+
+    def measure(self, name, fn, repeat=10, number=1, setup=None):
+        repeat = max(1, int(round(repeat * self.repeat_scale)))
+        fn()  # warm up caches and lazy imports
+        samples = []
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - t0) * 1000.0 / number)
+        self.record(name, samples, number)
+
+    def record(self, name, samples, number=1):
+        samples = sorted(samples)
+        self.results[name] = {
+            'median_ms': round(statistics.median(samples), 4),
+            'min_ms': round(samples[0], 4),
+            'max_ms': round(samples[-1], 4),
+            'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+            'runs': len(samples),
+            'number': number,
+        }
+        print(f"[Bench] {name:<32} median {self.results[name]['median_ms']:>10.3f} ms  "
+              f"min {self.results[name]['min_ms']:.3f}  ({len(samples)} runs)")
+
+    def counter(self, name, value):
+        self.counters[name] = value
+        print(f"[Bench] {name:<32} {value}")
+
+    def desktop(self):
+        """A fully built MainWindow that never writes app_state.json."""
+        if self._desktop is None:
+            self._desktop = build_desktop()
+        return self._desktop
+
+
+def _shell():
+    import Luxxer_OS
+    # benchmarks must not touch the user's saved state
+    Luxxer_OS.save_state = None
+    return Luxxer_OS
+
+
+def build_desktop(state=None):
+    """MainWindow with a generated wallpaper; `state` defaults to an empty desktop."""
+    lux = _shell()
+    win = lux.MainWindow(lux.APPS_LIST, state if state is not None else _bench_state())
+    # larger than every benchmarked viewport, so each rescale is a real smooth scale
+    win.wallpaper = _synthetic_wallpaper(3840, 2160)
+    win._scaled_wallpaper = None
+    return win
+
+
+def _bench_state():
+    return {'settings': {'wallpaper': '', 'restore_session': False, 'preload': {'enabled': False},
+                         'app_pool': {'enabled': False}}}
+
+
+def _synthetic_wallpaper(w, h):
+    img = QImage(w, h, QImage.Format.Format_RGB32)
+    painter = QPainter(img)
+    grad = QLinearGradient(0, 0, w, h)
+    grad.setColorAt(0.0, QColor(20, 40, 90))
+    grad.setColorAt(1.0, QColor(200, 120, 60))
+    painter.fillRect(0, 0, w, h, grad)
+    painter.end()
+    return img
+
+
+# Dock
+
+@benchmark("dock")
+def bench_dock(bench):
+    lux = _shell()
+    names = [f"{name} {i}" for i, name in enumerate((lux.APPS_LIST * 2)[:120])]
+    dock = lux.BottomDock(None, names)
+    dock._timer.stop()  # driven by hand below
+    dock.resize(1920, dock.height())
+    dock.show()
+    QApplication.processEvents()
+
+    dock._last_pos = None
+    bench.measure("dock_tick_idle_120", dock._on_timer, repeat=20, number=10)
+    hover = QPoint(dock.width() // 2, dock.height() // 2)
+
+    def tick_hover():
+        dock._last_pos = hover
+        dock._on_timer()
+    bench.measure("dock_tick_hover_120", tick_hover, repeat=20, number=10)
+    # one paint of the magnified strip (cached item pixmaps)
+    bench.measure("dock_paint_hover_120", dock.viewport().repaint, repeat=20, number=5)
+
+    # the cursor leaves: the timer must run until the buttons are back at rest,
+    # then stop; no ticks at all while idle
+    dock._last_pos = None
+    dock._wake()
+    start = dock.ticks
+    _run_for(2000, until=lambda: not dock.is_animating())
+    bench.counter("dock_ticks_to_settle", dock.ticks - start)
+    start = dock.ticks
+    _run_for(250)
+    bench.counter("dock_idle_ticks", dock.ticks - start)
+    dock.deleteLater()
+
+    # a frame (tick + paint) has to fit in 16 ms with thousands of entries too
+    for count in (500, 5000):
+        names = [f"{name} {i}" for i, name in enumerate((lux.APPS_LIST * (count // 100 + 1))[:count])]
+        bench.measure(f"dock_build_{count}", lambda: lux.BottomDock(None, names).deleteLater(), repeat=5)
+        _process_deletes()
+        dock = lux.BottomDock(None, names)
+        dock._timer.stop()
+        dock.resize(1920, dock.height())
+        dock.show()
+        QApplication.processEvents()
+
+        def frame_hover():
+            dock._last_pos = hover
+            dock._on_timer()
+            dock.viewport().repaint()
+        bench.measure(f"dock_frame_hover_{count}", frame_hover, repeat=20, number=5)
+
+        def type_filter():
+            for text in ("c", "ca", "cal", ""):
+                dock.set_filter(text)
+        bench.measure(f"dock_filter_{count}", type_filter, repeat=10)
+        dock.deleteLater()
+        _process_deletes()
+
+
+# Desktop background
+
+@benchmark("paint")
+def bench_paint(bench):
+    win = bench.desktop()
+    try:
+        for label, size in (("1080p", QSize(1920, 1080)), ("1440p", QSize(2560, 1440))):
+            win.resize(size)
+            win.show()
+            QApplication.processEvents()
+            viewport = win.mdi.viewport()
+            # once per resize or wallpaper change
+            bench.measure(f"wallpaper_rescale_{label}", win._rescale_wallpaper, repeat=5)
+            bench.measure(f"paint_background_{label}", viewport.repaint, repeat=15)
+            # roughly what one step of dragging a 640x480 window repaints
+            bench.measure(f"paint_background_damage_{label}", lambda: viewport.repaint(200, 150, 660, 500), repeat=15)
+    finally:
+        win.hide()
+
+    # decoding an 8K photo: in full and then scaled, or straight at screen size
+    lux = _shell()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "wallpaper.jpg")
+        _synthetic_wallpaper(7680, 4320).save(path, "JPG", 90)
+        screen = QSize(2560, 1440)
+        bench.measure("wallpaper_decode_full_8k", lambda: lux.scale_to_cover(QImage(path), screen), repeat=3)
+        bench.measure("wallpaper_decode_at_size_8k", lambda: lux.decode_wallpaper(path, screen), repeat=3)
+
+
+# Desktop icons
+
+@benchmark("icons")
+def bench_icons(bench):
+    from iconadderonmainscreen import IconAdderArea
+    names = [f"App {i}" for i in range(1000)]
+    state = {}
+
+    def new_area():
+        old = state.get('area')
+        if old is not None:
+            old.deleteLater()
+            _process_deletes()
+        area = IconAdderArea(cell_size=96, spacing=12)
+        area.resize(1920, 1080)
+        state['area'] = area
+
+    def add_all():
+        for name in names:
+            state['area'].add_icon(name)
+
+    new_area()
+    add_all()
+    state['area'].clear_icons()
+    _process_deletes()
+    bench.measure("icons_add_1000", add_all, repeat=3, setup=new_area)
+    bench.measure("icons_relayout_1000", lambda: state['area']._relayout_icons(), repeat=20)
+    state['area'].deleteLater()
+    _process_deletes()
+
+
+# Virtual file system
+
+def _deep_tree(depth=40, fanout=20):
+    root = {}
+    node = root
+    for level in range(depth):
+        for i in range(fanout):
+            node[f"file{i}.txt"] = f"level {level} file {i}\n" * 4
+            if i:
+                node[f"dir{i}"] = {}
+        child = {}
+        node["d"] = child
+        node = child
+    node["leaf.txt"] = "leaf"
+    return root
+
+
+@benchmark("vfs")
+def bench_vfs(bench):
+    lux = _shell()
+    deep = "/" + "/".join(["d"] * 40)
+    saved = lux.APP_STATE.get('files')
+    lux.APP_STATE['files'] = _deep_tree()
+    try:
+        bench.measure("vfs_listdir_depth40", lambda: lux.vfs_listdir_safe(deep), repeat=10, number=1000)
+        bench.measure("vfs_read_depth40", lambda: lux.vfs_read_safe(deep + "/leaf.txt"), repeat=10, number=1000)
+
+        def write_delete():
+            lux.vfs_write_safe(deep + "/new.txt", "x")
+            lux.vfs_delete_safe(deep + "/new.txt")
+        bench.measure("vfs_write_delete_depth40", write_delete, repeat=10, number=1000)
+    finally:
+        if saved is None:
+            lux.APP_STATE.pop('files', None)
+        else:
+            lux.APP_STATE['files'] = saved
+
+
+# Zer3 syntax highlighting
+
+_ZER3_SAMPLE = '''def fib(n):
+    # classic recursion
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+class Greeter(object):
+    def __init__(self, name="world"):
+        self.name = name
+    def greet(self):
+        print("Hello, %s!" % self.name, len(self.name), 0x1F, 3.14)
+'''
+
+
+@benchmark("zer3")
+def bench_zer3(bench):
+    lux = _shell()
+    lines = _ZER3_SAMPLE.splitlines()
+    doc = QTextDocument()
+    doc.setPlainText("\n".join((lines * (20000 // len(lines) + 1))[:20000]))
+
+    def highlight():
+        h = lux.Zer3Highlighter(doc)
+        h.rehighlight()
+        h.setDocument(None)
+    bench.measure("zer3_highlight_20k_lines", highlight, repeat=3)
+
+
+# CSV loading
+
+@benchmark("csv")
+def bench_csv(bench):
+    lux = _shell()
+    from apps_extra3 import CSVEditorProApp
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([f"col{c}" for c in range(12)])
+            for r in range(5000):
+                writer.writerow([f"r{r}c{c}" if c % 3 else str(r * c) for c in range(12)])
+        with mock.patch.object(QFileDialog, 'getOpenFileName', return_value=(path, "CSV Files (*.csv)")):
+            sheet = lux.SpreadsheetApp()
+            bench.measure("csv_spreadsheet_5000x12", sheet.load_csv, repeat=3)
+            editor = CSVEditorProApp()
+            bench.measure("csv_editor_pro_5000x12", editor._open, repeat=3)
+        sheet.deleteLater()
+        editor.deleteLater()
+        _process_deletes()
+    finally:
+        os.remove(path)
+
+
+# Open/close cycles and leaked app widgets
+
+@benchmark("apps")
+def bench_apps(bench):
+    import leak_detector
+    lux = _shell()
+    win = bench.desktop()
+    win.resize(1920, 1080)
+    win.show()
+    QApplication.processEvents()
+    detector = leak_detector.get_detector() or leak_detector.install(log_file=None)
+    # keep the reference check out of the timed loop, run it once at the end
+    detector.grace_ms = 60 * 60 * 1000
+    names = [n for n in OPEN_CLOSE_APPS if n in lux.APP_MAPPING]
+
+    def open_close():
+        for name in names:
+            before = set(win.mdi.subWindowList())
+            win.launch_app(name)
+            for sub in set(win.mdi.subWindowList()) - before:
+                sub.close()
+        _process_deletes()
+    bench.measure("apps_open_close_cycle", open_close, repeat=5)
+    detector.grace_ms = 0
+    detector.check()
+    stats = detector.stats()
+    bench.counter("leaked_app_widgets", stats['leaked'])
+    bench.counter("closed_app_widgets", stats['watched'])
+    win.hide()
+
+
+# Startup to first frame (fresh interpreter each run)
+
+def _startup_child():
+    t0 = time.perf_counter()
+    lux = _shell()
+    t_import = time.perf_counter()
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    win = lux.MainWindow(lux.APPS_LIST, _bench_state())
+    t_build = time.perf_counter()
+    win.show()
+    deadline = time.perf_counter() + 30
+    while not win._first_paint_done and time.perf_counter() < deadline:
+        app.processEvents()
+    t_frame = time.perf_counter()
+    print(json.dumps({'import_ms': (t_import - t0) * 1000, 'build_ms': (t_build - t_import) * 1000,
+                      'first_frame_ms': (t_frame - t0) * 1000, 'painted': win._first_paint_done}))
+
+
+@benchmark("startup")
+def bench_startup(bench):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.pop("LUX_PROFILE_STARTUP", None)
+    runs = max(1, int(round(3 * bench.repeat_scale)))
+    totals, imports, builds, frames = [], [], [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), STARTUP_CHILD_FLAG],
+                             capture_output=True, text=True, env=env, timeout=120,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        total = (time.perf_counter() - t0) * 1000
+        lines = [l for l in out.stdout.splitlines() if l.startswith("{")]
+        if out.returncode != 0 or not lines:
+            print(f"[Bench] startup child failed ({out.returncode}):\n{out.stderr[-2000:]}")
+            return
+        data = json.loads(lines[-1])
+        totals.append(total)
+        imports.append(data['import_ms'])
+        builds.append(data['build_ms'])
+        frames.append(data['first_frame_ms'])
+    bench.record("startup_import", imports)
+    bench.record("startup_build_desktop", builds)
+    bench.record("startup_first_frame", frames)
+    bench.record("startup_process_to_first_frame", totals)
+
+
+# Running and comparing
+
+def _meta(**extra):
+    meta = {
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'qt': QT_VERSION_STR,
+        'platform': platform.platform(),
+        'machine': platform.node(),
+    }
+    meta.update(extra)
+    return meta
+
+
+def run(only=None, repeat_scale=1.0):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    bench = Bench(repeat_scale=repeat_scale)
+    for group, fn in _benchmarks:
+        if only and group not in only:
+            continue
+        try:
+            fn(bench)
+        except Exception:
+            print(f"[Bench] '{group}' failed")
+            traceback.print_exc()
+    return {'meta': _meta(repeat_scale=repeat_scale), 'results': bench.results, 'counters': bench.counters}
+
+
+def run_replay(session_path, speed=1.0, state_path=None):
+    """Replay a recorded input session offscreen and collect frame times, stalls and memory."""
+    import input_replay
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    lux = _shell()
+    session = input_replay.load_session(session_path)
+    state = load(state_path) if state_path else None
+    if state is not None:
+        settings = state.setdefault('settings', {})
+        settings['restore_session'] = False
+        settings['preload'] = {'enabled': False}
+    desktop = build_desktop(state)
+    report = input_replay.replay(session, desktop, speed=speed, registry=lux.APP_MAPPING)
+
+    bench = Bench()
+    if report['frames_ms']:
+        bench.record("replay_frame", report['frames_ms'])
+    if report['stalls']:
+        bench.record("replay_stall", [s['duration_ms'] for s in report['stalls']])
+    bench.counter("replay_frames", len(report['frames_ms']))
+    bench.counter("replay_frames_over_33ms", sum(1 for f in report['frames_ms'] if f > 33.3))
+    bench.counter("replay_stalls", len(report['stalls']))
+    bench.counter("replay_max_latency_ms", report['max_latency_ms'])
+    bench.counter("replay_peak_rss_mb", round(report['peak_rss_bytes'] / (1024 * 1024), 1))
+    bench.counter("replay_missed_events", report['missed'])
+    bench.counter("replay_dock_ticks", desktop.dock.ticks)
+    return {
+        'meta': _meta(session=os.path.abspath(session_path), speed=speed, events=report['events'],
+                      duration_ms=report['duration_ms']),
+        'results': bench.results,
+        'counters': bench.counters,
+        'stalls': report['stalls'],
+    }
+
+
+def save(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"[Bench] Wrote {os.path.abspath(path)}")
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    """Rows of (name, baseline, current, ratio, status); status is ok/regressed/improved/new/missing."""
+    rows = []
+    base_results = baseline.get('results', {})
+    cur_results = current.get('results', {})
+    for name in sorted(set(base_results) | set(cur_results)):
+        base = base_results.get(name, {}).get('median_ms')
+        cur = cur_results.get(name, {}).get('median_ms')
+        if base is None or cur is None:
+            rows.append((name, base, cur, None, 'new' if base is None else 'missing'))
+            continue
+        ratio = cur / base if base > 0 else float('inf')
+        status = 'ok'
+        if cur - base > min_delta_ms and ratio > 1.0 + threshold:
+            status = 'regressed'
+        elif base - cur > min_delta_ms and ratio < 1.0 - threshold:
+            status = 'improved'
+        rows.append((name, base, cur, ratio, status))
+    base_counters = baseline.get('counters', {})
+    cur_counters = current.get('counters', {})
+    for name in sorted(set(base_counters) | set(cur_counters)):
+        base, cur = base_counters.get(name), cur_counters.get(name)
+        if base is None or cur is None:
+            rows.append((name, base, cur, None, 'new' if base is None else 'missing'))
+            continue
+        # leak and idle-work counters: any increase is a regression
+        strict = name.startswith('leaked') or name in STRICT_COUNTERS
+        status = 'regressed' if cur > base and strict else 'ok'
+        rows.append((name, base, cur, None, status))
+    return rows
+
+
+def print_comparison(rows, threshold):
+    print(f"\n{'benchmark':<34}{'baseline':>12}{'current':>12}{'change':>10}  status")
+    for name, base, cur, ratio, status in rows:
+        change = f"{(ratio - 1) * 100:+.1f}%" if ratio is not None else ""
+        fmt = lambda v: "-" if v is None else (f"{v:.3f}" if isinstance(v, float) else str(v))
+        marker = "  <<" if status == 'regressed' else ""
+        print(f"{name:<34}{fmt(base):>12}{fmt(cur):>12}{change:>10}  {status}{marker}")
+    regressed = [r for r in rows if r[4] == 'regressed']
+    print(f"\n{len(regressed)} regression(s) beyond {threshold * 100:.0f}%")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Luxxer headless performance benchmarks")
+    parser.add_argument("mode", nargs="?", default="run", choices=["run", "baseline", "compare", "replay"])
+    parser.add_argument("session", nargs="?", help="replay: input recording (see input_replay.py)")
+    parser.add_argument("--only", default="", help="comma separated groups: "
+                        + ",".join(group for group, _fn in _benchmarks))
+    parser.add_argument("--repeat-scale", type=float, default=1.0, help="scale every repeat count (e.g. 0.3 for a quick run)")
+    parser.add_argument("--out", default=None, help="where to write results")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--results", default=None, help="compare: use saved results instead of running")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--speed", type=float, default=1.0, help="replay: 1 = real time, 4 = four times faster, 0 = no waiting")
+    parser.add_argument("--state", default=None, help="replay: app_state.json to start from (never written)")
+    args = parser.parse_args(argv)
+    only = {g.strip() for g in args.only.split(",") if g.strip()}
+
+    if args.mode == "replay":
+        if not args.session:
+            parser.error("replay needs a recorded session file")
+        save(run_replay(args.session, args.speed, args.state), args.out or REPLAY_RESULTS_FILE)
+        return 0
+
+    if args.mode == "compare":
+        if not os.path.exists(args.baseline):
+            print(f"[Bench] No baseline at {args.baseline}, create one with: python perf_bench.py baseline")
+            return 2
+        current = load(args.results) if args.results else run(only, args.repeat_scale)
+        if not args.results:
+            save(current, args.out or RESULTS_FILE)
+        rows = compare(load(args.baseline), current, args.threshold)
+        return 1 if print_comparison(rows, args.threshold) else 0
+
+    data = run(only, args.repeat_scale)
+    save(data, args.out or (BASELINE_FILE if args.mode == "baseline" else RESULTS_FILE))
+    return 0
+
+
+if __name__ == "__main__":
+    if STARTUP_CHILD_FLAG in sys.argv:
+        _startup_child()
+        sys.exit(0)
+    sys.exit(main())
@@ -0,0 +1,242 @@
+import time
+import weakref
+import traceback
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QTimer, QEvent, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+# Low-power idle mode
+#
+# After `idle_ms` without input, or while no Luxxer window is active, the shell
+# drops into low power: registered timers are slowed down or stopped and
+# registered callbacks are told. The first input event restores full rate.
+#
+#     power_manager.register_timer(self.timer, owner=self)              # IDLE_FACTOR times slower
+#     power_manager.register_timer(self.timer, idle_interval=15000, owner=self)
+#     power_manager.register_timer(self._timer, stop=True, owner=self)  # animation ticks
+#     power_manager.register(on_idle, on_active, owner=self)
+#
+# While active, input is only watched on focused top-level windows (an
+# application-wide Python event filter would run for every event); in low
+# power the whole application is watched so any input wakes it up.
+
+IDLE_MS = 60000
+IDLE_FACTOR = 10
+
+REASON_IDLE = "idle"
+REASON_INACTIVE = "inactive"
+
+_INPUT_EVENTS = {
+    QEvent.Type.MouseMove, QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick,
+    QEvent.Type.KeyPress, QEvent.Type.Wheel, QEvent.Type.TouchBegin, QEvent.Type.TabletPress,
+}
+
+
+def _alive(ref):
+    obj = ref() if ref is not None else None
+    return obj is not None and not sip.isdeleted(obj)
+
+
+def _ref_callable(fn):
+    # a bound method would keep its app widget alive; hold those weakly
+    if fn is None:
+        return None
+    if hasattr(fn, '__self__') and hasattr(fn, '__func__'):
+        return weakref.WeakMethod(fn)
+    return lambda: fn
+
+
+class PowerManager(QObject):
+    # True when entering low power, False when back at full rate
+    mode_changed = pyqtSignal(bool)
+
+    def __init__(self, idle_ms=IDLE_MS, on_focus_loss=True, parent=None):
+        super().__init__(parent)
+        self.idle_ms = int(idle_ms)
+        self.on_focus_loss = on_focus_loss
+        self.low_power = False
+        self.reason = None
+        self.entered = 0
+        self._last_input = time.monotonic()
+        self._timers = []     # [timer ref, idle interval, stop, owner ref, (was active, interval, slowed) in low power]
+        self._callbacks = []  # (on_idle ref, on_active ref, owner ref)
+        self._app_filter = False
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._idle_timer.timeout.connect(self._check_idle)
+
+    def start(self):
+        app = QGuiApplication.instance()
+        app.focusWindowChanged.connect(self._watch_window)
+        app.applicationStateChanged.connect(self._on_state_changed)
+        self._watch_window(QGuiApplication.focusWindow())
+        if self.idle_ms > 0:
+            self._idle_timer.start(self.idle_ms)
+
+    # Registration
+
+    def register_timer(self, timer, idle_interval=None, stop=False, owner=None):
+        """Slow `timer` to idle_interval ms (default IDLE_FACTOR x its interval) in low power, or stop it."""
+        entry = [weakref.ref(timer), idle_interval, stop,
+                 weakref.ref(owner) if owner is not None else None, None]
+        self._timers.append(entry)
+        if self.low_power:
+            self._slow(entry)
+
+    def register(self, on_idle=None, on_active=None, owner=None):
+        self._callbacks.append((_ref_callable(on_idle), _ref_callable(on_active),
+                                weakref.ref(owner) if owner is not None else None))
+
+    def _prune(self):
+        self._timers = [e for e in self._timers if _alive(e[0]) and (e[3] is None or _alive(e[3]))]
+        self._callbacks = [c for c in self._callbacks if c[2] is None or _alive(c[2])]
+
+    # Input and focus
+
+    def _watch_window(self, window):
+        # installing the same filter twice is a no-op for Qt
+        if window is not None:
+            window.installEventFilter(self)
+
+    def eventFilter(self, obj, ev):
+        if ev.type() in _INPUT_EVENTS:
+            self._last_input = time.monotonic()
+            if self.low_power:
+                self.wake()
+        return False
+
+    def _on_state_changed(self, state):
+        if state == Qt.ApplicationState.ApplicationActive:
+            if self.low_power:
+                self.wake()
+        elif self.on_focus_loss and not self.low_power:
+            self.enter_low_power(REASON_INACTIVE)
+
+    def _check_idle(self):
+        if self.low_power:
+            return
+        idle_for = (time.monotonic() - self._last_input) * 1000
+        if idle_for >= self.idle_ms:
+            self.enter_low_power(REASON_IDLE)
+        else:
+            self._idle_timer.start(int(self.idle_ms - idle_for) + 1)
+
+    # Mode switches
+
+    def enter_low_power(self, reason=REASON_IDLE):
+        if self.low_power:
+            return
+        self.low_power = True
+        self.reason = reason
+        self.entered += 1
+        self._idle_timer.stop()
+        self._set_app_filter(True)
+        self._prune()
+        for entry in self._timers:
+            self._slow(entry)
+        for on_idle, _on_active, _owner in self._callbacks:
+            self._call(on_idle)
+        self.mode_changed.emit(True)
+
+    def wake(self):
+        if not self.low_power:
+            return
+        self.low_power = False
+        self.reason = None
+        self._last_input = time.monotonic()
+        self._set_app_filter(False)
+        self._prune()
+        for entry in self._timers:
+            self._restore(entry)
+        for _on_idle, on_active, _owner in self._callbacks:
+            self._call(on_active)
+        if self.idle_ms > 0:
+            self._idle_timer.start(self.idle_ms)
+        self.mode_changed.emit(False)
+
+    def _set_app_filter(self, on):
+        app = QGuiApplication.instance()
+        if app is None or on == self._app_filter:
+            return
+        if on:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+        self._app_filter = on
+
+    @staticmethod
+    def _slow(entry):
+        timer = entry[0]()
+        if timer is None or sip.isdeleted(timer):
+            return
+        interval = timer.interval()
+        slowed = interval if entry[2] else max(interval, entry[1] or interval * IDLE_FACTOR)
+        entry[4] = (timer.isActive(), interval, slowed)
+        if entry[2]:
+            timer.stop()
+        else:
+            # setInterval() restarts an active timer with the new interval
+            timer.setInterval(slowed)
+
+    @staticmethod
+    def _restore(entry):
+        timer, saved = entry[0](), entry[4]
+        entry[4] = None
+        if saved is None or timer is None or sip.isdeleted(timer):
+            return
+        was_active, interval, slowed = saved
+        # the owner may have restarted it with a new interval meanwhile; keep that
+        if timer.interval() == slowed:
+            timer.setInterval(interval)
+        if was_active and not timer.isActive():
+            timer.start()
+
+    @staticmethod
+    def _call(ref):
+        fn = ref() if ref is not None else None
+        if fn is None:
+            return
+        try:
+            fn()
+        except Exception:
+            traceback.print_exc()
+
+    def stats(self):
+        self._prune()
+        return {'low_power': self.low_power, 'reason': self.reason, 'entered': self.entered,
+                'timers': len(self._timers), 'callbacks': len(self._callbacks)}
+
+
+# Process-wide manager
+
+_manager = None
+
+
+def install(idle_ms=IDLE_MS, on_focus_loss=True):
+    global _manager
+    if _manager is None:
+        _manager = PowerManager(idle_ms=idle_ms, on_focus_loss=on_focus_loss)
+        _manager.start()
+    return _manager
+
+
+def get_manager():
+    return _manager
+
+
+def is_low_power():
+    return _manager is not None and _manager.low_power
+
+
+def register_timer(timer, idle_interval=None, stop=False, owner=None):
+    """Register with the installed manager; a no-op when none is installed."""
+    if _manager is not None:
+        _manager.register_timer(timer, idle_interval=idle_interval, stop=stop, owner=owner)
+
+
+def register(on_idle=None, on_active=None, owner=None):
+    if _manager is not None:
+        _manager.register(on_idle, on_active, owner=owner)
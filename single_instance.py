@@ -0,0 +1,181 @@
+import os
+import re
+import sys
+import json
+import socket
+import getpass
+import tempfile
+import traceback
+
+# Single instance
+#
+# The running desktop listens on a local socket (QLocalServer). A second
+# `python Luxxer_OS.py [--open App]` hands its request to it and exits instead
+# of booting another shell. The client side is plain Python (a Unix socket or a
+# Windows named pipe) so forwarding never pays for the Qt imports.
+
+OPEN_FLAG = "--open"
+CONNECT_TIMEOUT = 0.2
+PIPE_PREFIX = "\\\\.\\pipe\\"
+
+
+def _server_id():
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return "luxxer-os-" + re.sub(r"[^A-Za-z0-9_.-]", "_", user)
+
+
+def server_name():
+    """Name for QLocalServer.listen(): a pipe name on Windows, a full socket path elsewhere."""
+    if os.name == "nt":
+        return _server_id()
+    return os.path.join(tempfile.gettempdir(), _server_id() + ".sock")
+
+
+def parse_open_args(argv):
+    names = []
+    it = iter(argv)
+    for arg in it:
+        if arg == OPEN_FLAG:
+            name = next(it, None)
+            if name:
+                names.append(name)
+        elif arg.startswith(OPEN_FLAG + "="):
+            name = arg.split("=", 1)[1]
+            if name:
+                names.append(name)
+    return names
+
+
+def build_commands(argv):
+    names = parse_open_args(argv)
+    if names:
+        return [{"cmd": "open", "app": n} for n in names]
+    return [{"cmd": "activate"}]
+
+
+def _encode(commands):
+    return "".join(json.dumps(c) + "\n" for c in commands).encode("utf-8")
+
+
+def _send(payload):
+    if os.name == "nt":
+        # QLocalServer on Windows is a named pipe
+        with open(PIPE_PREFIX + _server_id(), "wb", buffering=0) as pipe:
+            if payload:
+                pipe.write(payload)
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(CONNECT_TIMEOUT)
+        s.connect(server_name())
+        if payload:
+            s.sendall(payload)
+
+
+def is_running():
+    """True if something is accepting connections on our server name."""
+    try:
+        _send(b"")
+        return True
+    except OSError:
+        return False
+
+
+def forward_to_running(argv):
+    """Send argv's request to an already running desktop. True if one took it."""
+    try:
+        _send(_encode(build_commands(argv)))
+        return True
+    except (OSError, ValueError):
+        # nobody listening (or a stale socket left behind by a crash)
+        return False
+    except Exception:
+        traceback.print_exc()
+        return False
+
+
+def forward_if_running(argv=None):
+    """Called at the very top of Luxxer_OS.py. True if a running desktop took the
+    request and this process should exit. The BSOD monitor's children never forward."""
+    if os.environ.get("LUX_SUPERVISED") == "1":
+        return False
+    return forward_to_running(sys.argv[1:] if argv is None else argv)
+
+
+class InstanceServer:
+    """Receives commands from later invocations. Commands arriving before a
+    handler is set (start screen still up) are queued and replayed."""
+
+    def __init__(self, parent=None):
+        from PyQt6.QtNetwork import QLocalServer
+        self._server = QLocalServer(parent)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._handler = None
+        self._pending = []
+        self._buffers = {}
+
+    def listen(self):
+        from PyQt6.QtNetwork import QLocalServer
+        name = server_name()
+        if self._server.listen(name):
+            return True
+        # a live instance owns it; leave it alone
+        if is_running():
+            return False
+        # stale socket from a crashed run
+        QLocalServer.removeServer(name)
+        ok = self._server.listen(name)
+        if not ok:
+            print(f"[single_instance] Could not listen on {name}: {self._server.errorString()}")
+        return ok
+
+    def close(self):
+        self._server.close()
+
+    def submit(self, command):
+        if self._handler is None:
+            self._pending.append(command)
+            return
+        try:
+            self._handler(command)
+        except Exception:
+            traceback.print_exc()
+
+    def set_handler(self, handler):
+        self._handler = handler
+        pending, self._pending = self._pending, []
+        for command in pending:
+            self.submit(command)
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            conn = self._server.nextPendingConnection()
+            self._buffers[conn] = b""
+            conn.readyRead.connect(lambda c=conn: self._on_ready_read(c))
+            conn.disconnected.connect(lambda c=conn: self._on_disconnected(c))
+            # data may already be there
+            self._on_ready_read(conn)
+
+    def _on_ready_read(self, conn):
+        data = self._buffers.get(conn, b"") + bytes(conn.readAll())
+        *lines, rest = data.split(b"\n")
+        self._buffers[conn] = rest
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                command = json.loads(line.decode("utf-8"))
+            except Exception:
+                print(f"[single_instance] Ignoring malformed command: {line[:200]!r}")
+                continue
+            if isinstance(command, dict):
+                self.submit(command)
+
+    def _on_disconnected(self, conn):
+        self._on_ready_read(conn)
+        self._buffers.pop(conn, None)
+        conn.deleteLater()
+
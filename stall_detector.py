@@ -0,0 +1,323 @@
+import os
+import sys
+import json
+import time
+import threading
+import traceback
+import collections
+
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSplitter,
+    QTableWidget, QTableWidgetItem, QPlainTextEdit, QSpinBox
+)
+
+# Main-thread stall detector
+#
+# A QTimer heartbeat on the GUI thread stamps the time; a watchdog thread
+# notices when the stamp gets older than the threshold, samples the GUI
+# thread's stack with sys._current_frames() while it is blocked, and when the
+# heartbeat comes back records the stall: duration, stack and the app it was
+# running. Stalls go to stall_log.jsonl and the "StallMonitor" app.
+
+LOG_FILE = "stall_log.jsonl"
+LOG_MAX_BYTES = 1024 * 1024
+HEARTBEAT_MS = 20
+SAMPLE_INTERVAL = 0.01
+MAX_SAMPLES = 50
+HISTORY = 500
+
+_SKIP_MODULES = ('stall_detector', 'PyQt6', 'sip', 'threading', 'importlib')
+
+
+class StallDetector(QObject):
+    stall_recorded = pyqtSignal(dict)
+
+    def __init__(self, registry=None, threshold_ms=50, log_file=LOG_FILE, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.threshold = threshold_ms / 1000.0
+        self.log_file = log_file
+        self.stalls = collections.deque(maxlen=HISTORY)
+        self.max_latency_ms = 0.0
+        self._class_to_app = None
+        self._main_ident = threading.main_thread().ident
+        self._beat = time.monotonic()
+        self._samples = []
+        self._stall_start = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        # cleared while paused: the watchdog sleeps on it instead of polling
+        self._awake = threading.Event()
+        self._awake.set()
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+        self._heartbeat.setInterval(HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._on_heartbeat)
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._beat = time.monotonic()
+        self._heartbeat.start()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._heartbeat.stop()
+        self._awake.set()
+
+    def pause(self):
+        """Stop the heartbeat and park the watchdog thread (low-power mode)."""
+        if not self._running:
+            return
+        self._awake.clear()
+        self._heartbeat.stop()
+
+    def resume(self):
+        if not self._running or self._awake.is_set():
+            return
+        with self._lock:
+            self._beat = time.monotonic()
+            self._stall_start, self._samples = None, []
+        self._heartbeat.start()
+        self._awake.set()
+
+    def is_running(self):
+        return self._running
+
+    # GUI thread
+
+    def _on_heartbeat(self):
+        now = time.monotonic()
+        latency = (now - self._beat) * 1000.0 - HEARTBEAT_MS
+        self.max_latency_ms = max(self.max_latency_ms, latency)
+        with self._lock:
+            self._beat = now
+            start, samples = self._stall_start, self._samples
+            self._stall_start, self._samples = None, []
+        if start is not None and samples:
+            self._record(start, now, samples)
+
+    def _record(self, start, end, samples):
+        duration_ms = (end - start) * 1000.0
+        # the most frequent innermost location is where the time went
+        counts = collections.Counter(s['stack'][-1] if s['stack'] else '' for s in samples)
+        hot = counts.most_common(1)[0][0] if counts else ''
+        stack = next((s['stack'] for s in samples if s['stack'] and s['stack'][-1] == hot), samples[-1]['stack'])
+        app = collections.Counter(s['app'] for s in samples).most_common(1)[0][0]
+        stall = {
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'duration_ms': round(duration_ms, 1),
+            'app': app,
+            'location': hot,
+            'samples': len(samples),
+            'stack': stack,
+        }
+        self.stalls.append(stall)
+        self._write_log(stall)
+        self.stall_recorded.emit(stall)
+
+    def _write_log(self, stall):
+        if not self.log_file:
+            return
+        try:
+            if os.path.exists(self.log_file) and os.path.getsize(self.log_file) > LOG_MAX_BYTES:
+                os.replace(self.log_file, self.log_file + ".1")
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(stall) + "\n")
+        except Exception:
+            traceback.print_exc()
+
+    # Watchdog thread
+
+    def _watch(self):
+        while self._running:
+            self._awake.wait()
+            time.sleep(SAMPLE_INTERVAL)
+            with self._lock:
+                blocked_since = self._beat + HEARTBEAT_MS / 1000.0
+            now = time.monotonic()
+            if now - blocked_since < self.threshold:
+                continue
+            try:
+                sample = self._sample()
+            except Exception:
+                continue
+            if sample is None:
+                continue
+            with self._lock:
+                # the heartbeat may have run meanwhile
+                if self._beat + HEARTBEAT_MS / 1000.0 != blocked_since:
+                    continue
+                if self._stall_start is None:
+                    self._stall_start = blocked_since
+                if len(self._samples) < MAX_SAMPLES:
+                    self._samples.append(sample)
+
+    def _sample(self):
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return None
+        stack = ["%s:%d in %s" % (os.path.basename(fs.filename), fs.lineno, fs.name)
+                 for fs in traceback.extract_stack(frame, limit=40)]
+        return {'stack': stack, 'app': self._attribute(frame)}
+
+    # Attribution
+
+    def _app_for_class(self, cls_name):
+        if self._class_to_app is None:
+            mapping = {}
+            if self.registry is not None:
+                for name in list(self.registry):
+                    desc = self.registry.descriptor(name) if hasattr(self.registry, 'descriptor') else None
+                    if desc:
+                        mapping.setdefault(desc.rpartition(':')[2].split('.')[-1], name)
+            self._class_to_app = mapping
+        return self._class_to_app.get(cls_name)
+
+    def _attribute(self, frame):
+        fallback = None
+        f = frame
+        while f is not None:
+            module = f.f_globals.get('__name__', '')
+            if not module.startswith(_SKIP_MODULES):
+                if 'self' in f.f_code.co_varnames[:1]:
+                    obj = f.f_locals.get('self')
+                    for cls in type(obj).__mro__ if obj is not None else ():
+                        app = self._app_for_class(cls.__name__)
+                        if app:
+                            return app
+                if fallback is None and not _is_stdlib(f.f_code.co_filename):
+                    fallback = module
+            f = f.f_back
+        return fallback or 'shell'
+
+    def summary(self):
+        per_app = {}
+        for stall in list(self.stalls):
+            entry = per_app.setdefault(stall['app'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += stall['duration_ms']
+            entry['max_ms'] = max(entry['max_ms'], stall['duration_ms'])
+        return per_app
+
+
+_STDLIB_PREFIXES = tuple({os.path.dirname(os.__file__), sys.base_prefix})
+
+
+def _is_stdlib(filename):
+    return filename.startswith(_STDLIB_PREFIXES) or filename.startswith('<')
+
+
+# Process-wide detector
+
+_detector = None
+
+
+def install(registry=None, threshold_ms=50, log_file=LOG_FILE):
+    global _detector
+    if _detector is None:
+        _detector = StallDetector(registry, threshold_ms=threshold_ms, log_file=log_file)
+    _detector.start()
+    return _detector
+
+
+def get_detector():
+    return _detector
+
+
+# In-shell viewer
+
+class StallViewerApp(QWidget):
+    def __init__(self):
+        QWidget.__init__(self)
+        self.setWindowTitle("Stall Monitor - Luxxer")
+        self.detector = get_detector()
+
+        layout = QVBoxLayout(self)
+        self.status = QLabel()
+        layout.addWidget(self.status)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Threshold (ms):"))
+        self.threshold = QSpinBox()
+        self.threshold.setRange(10, 5000)
+        self.threshold.setValue(int(self.detector.threshold * 1000) if self.detector else 50)
+        self.threshold.valueChanged.connect(self._set_threshold)
+        controls.addWidget(self.threshold)
+        controls.addStretch(1)
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self._clear)
+        controls.addWidget(clear_btn)
+        layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.per_app = QTableWidget(0, 4)
+        self.per_app.setHorizontalHeaderLabels(["App", "Stalls", "Total ms", "Worst ms"])
+        self.per_app.horizontalHeader().setStretchLastSection(True)
+        splitter.addWidget(self.per_app)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Time", "ms", "App", "Where"])
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.currentCellChanged.connect(lambda row, *_: self._show_stack(row))
+        splitter.addWidget(self.table)
+
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        splitter.addWidget(self.stack_view)
+        layout.addWidget(splitter, 1)
+
+        self._rows = []
+        if self.detector is not None:
+            self.detector.stall_recorded.connect(self._on_stall)
+        self._reload()
+
+    def _reload(self):
+        if self.detector is None:
+            self.status.setText("Stall detector is not running (settings['stall_detector']['enabled']).")
+            return
+        self._rows = list(self.detector.stalls)
+        self.table.setRowCount(0)
+        for stall in self._rows:
+            self._append_row(stall)
+        self._refresh_summary()
+
+    def _append_row(self, stall):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        for col, value in enumerate((stall['time'], f"{stall['duration_ms']:.0f}", stall['app'], stall['location'])):
+            self.table.setItem(row, col, QTableWidgetItem(str(value)))
+
+    def _refresh_summary(self):
+        summary = sorted(self.detector.summary().items(), key=lambda kv: kv[1]['total_ms'], reverse=True)
+        self.per_app.setRowCount(len(summary))
+        for row, (app, entry) in enumerate(summary):
+            for col, value in enumerate((app, entry['count'], f"{entry['total_ms']:.0f}", f"{entry['max_ms']:.0f}")):
+                self.per_app.setItem(row, col, QTableWidgetItem(str(value)))
+        self.status.setText(f"{len(self.detector.stalls)} stalls recorded, worst heartbeat latency "
+                            f"{self.detector.max_latency_ms:.0f} ms. Log: {os.path.abspath(self.detector.log_file)}")
+
+    def _on_stall(self, stall):
+        self._rows.append(stall)
+        self._append_row(stall)
+        self._refresh_summary()
+
+    def _show_stack(self, row):
+        if 0 <= row < len(self._rows):
+            self.stack_view.setPlainText("\n".join(reversed(self._rows[row]['stack'])))
+
+    def _set_threshold(self, value):
+        if self.detector is not None:
+            self.detector.threshold = value / 1000.0
+
+    def _clear(self):
+        if self.detector is not None:
+            self.detector.stalls.clear()
+        self._reload()
@@ -0,0 +1,190 @@
+import os
+import sys
+import json
+import time
+import atexit
+import builtins
+import threading
+import contextlib
+import traceback
+
+# Startup timeline profiler
+#
+# Opt-in: set LUX_PROFILE_STARTUP=1 (or a file path) or pass --profile-startup[=path].
+# Records wall-clock spans and writes them in Chrome trace format, open the file
+# in chrome://tracing or https://ui.perfetto.dev.
+#
+# Only the standard library is used here so it can be imported before anything
+# else in Luxxer_OS.py and time the remaining imports.
+
+ENV_VAR = "LUX_PROFILE_STARTUP"
+ORIGIN_ENV_VAR = "LUX_PROFILE_ORIGIN_NS"
+CLI_FLAG = "--profile-startup"
+DEFAULT_TRACE_FILE = "startup_trace.json"
+
+_events = []
+_lock = threading.Lock()
+_enabled = False
+_trace_path = DEFAULT_TRACE_FILE
+_written = False
+_orig_import = None
+# False once uninstalled while someone else's hook still calls _timed_import
+_timing_imports = False
+
+# wall clock anchor so spans from the BSOD monitor and its child line up
+_wall0 = time.time_ns()
+_perf0 = time.perf_counter_ns()
+
+
+def _now_us():
+    return (_wall0 + (time.perf_counter_ns() - _perf0)) / 1000.0
+
+
+def _read_config():
+    value = os.environ.get(ENV_VAR, "")
+    for arg in sys.argv[1:]:
+        if arg == CLI_FLAG:
+            value = value or "1"
+        elif arg.startswith(CLI_FLAG + "="):
+            value = arg.split("=", 1)[1] or "1"
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return DEFAULT_TRACE_FILE
+    return value
+
+
+def enabled():
+    return _enabled
+
+
+def _add(event):
+    event.setdefault("pid", os.getpid())
+    event.setdefault("tid", threading.get_ident())
+    with _lock:
+        _events.append(event)
+
+
+@contextlib.contextmanager
+def _span(name, cat, args):
+    start = _now_us()
+    try:
+        yield
+    finally:
+        ev = {"name": name, "cat": cat, "ph": "X", "ts": start, "dur": _now_us() - start}
+        if args:
+            ev["args"] = args
+        _add(ev)
+
+
+def span(name, cat="startup", **args):
+    """Context manager recording a complete ("X") event; no-op when disabled."""
+    if not _enabled:
+        return contextlib.nullcontext()
+    return _span(name, cat, args)
+
+
+def instant(name, cat="startup", **args):
+    if not _enabled:
+        return
+    ev = {"name": name, "cat": cat, "ph": "i", "s": "p", "ts": _now_us()}
+    if args:
+        ev["args"] = args
+    _add(ev)
+
+
+# Import timing
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # only time imports that actually load something new
+    if not _timing_imports or level or name in sys.modules:
+        return _orig_import(name, globals, locals, fromlist, level)
+    start = _now_us()
+    try:
+        return _orig_import(name, globals, locals, fromlist, level)
+    finally:
+        _add({"name": f"import {name}", "cat": "import", "ph": "X",
+              "ts": start, "dur": _now_us() - start})
+
+
+def install_import_hook():
+    global _orig_import, _timing_imports
+    if _orig_import is None:
+        _orig_import = builtins.__import__
+        builtins.__import__ = _timed_import
+    _timing_imports = True
+
+
+def uninstall_import_hook():
+    global _orig_import, _timing_imports
+    _timing_imports = False
+    if _orig_import is not None and builtins.__import__ is _timed_import:
+        builtins.__import__ = _orig_import
+        _orig_import = None
+    # otherwise it was wrapped after us: stay in the chain as a pass-through
+
+
+# Output
+
+def write_trace(path=None):
+    global _written
+    path = path or _trace_path
+    with _lock:
+        events = list(_events)
+    data = {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"argv": sys.argv, "python": sys.version.split()[0]},
+    }
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        _written = True
+        print(f"[startup_profiler] Wrote {len(events)} events to {os.path.abspath(path)}")
+    except Exception:
+        traceback.print_exc()
+    return path
+
+
+def mark_ready(name="desktop ready"):
+    """Call once the desktop is usable: ends import timing and writes the trace."""
+    if not _enabled or _written:
+        return
+    instant(name)
+    uninstall_import_hook()
+    write_trace()
+
+
+def _write_at_exit():
+    # startup never reached the desktop (crash / cancelled start screen);
+    # the BSOD monitor only forwards its origin to the child and never writes
+    if _enabled and not _written and os.environ.get("LUX_SUPERVISED") == "1":
+        write_trace()
+
+
+def enable(path=None):
+    global _enabled, _trace_path
+    _enabled = True
+    _trace_path = path or _trace_path
+    os.environ[ENV_VAR] = _trace_path
+
+    # the supervised child is a fresh process; show the time the monitor spent
+    # before spawning it as its own span at the start of the timeline
+    origin = os.environ.get(ORIGIN_ENV_VAR)
+    if origin:
+        try:
+            origin_us = int(origin) / 1000.0
+            _add({"name": "supervisor (monitor process)", "cat": "process", "ph": "X",
+                  "ts": origin_us, "dur": max(0.0, _wall0 / 1000.0 - origin_us)})
+        except ValueError:
+            pass
+    else:
+        os.environ[ORIGIN_ENV_VAR] = str(_wall0)
+
+    install_import_hook()
+    atexit.register(_write_at_exit)
+
+
+_path = _read_config()
+if _path:
+    enable(_path)
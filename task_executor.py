@@ -0,0 +1,261 @@
+import weakref
+import threading
+import traceback
+from concurrent.futures import Future, CancelledError
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QThread, QThreadPool, QCoreApplication, pyqtSignal
+
+# Shared background task executor
+#
+#     task = task_executor.submit(fn, *args, owner=self, priority=task_executor.PRIORITY_HIGH)
+#     task.then(self.on_result, self.on_error)       # always called on the GUI thread
+#     task.progress.connect(lambda value, message: ...)
+#     task.cancel()
+#
+# The task may already be done when submit() returns: connect results with
+# then(), which also delivers a result or error that came before it.
+#
+# Tasks run on a QThreadPool (highest priority first); long_running=True gives
+# the task its own daemon thread instead, for loops that block on I/O (a shell
+# session, screen capture) and would otherwise hold a pool thread forever.
+#
+# Inside the task, task_executor.current_task() returns the running Task:
+# call check_cancelled() regularly (cancellation is cooperative) and
+# report_progress(). Never touch widgets from a task; return a result, emit
+# progress, or use run_in_main(fn, *args, owner=widget).
+#
+# A task started with owner=<QObject> is cancelled when the owner is destroyed,
+# e.g. when its app window is closed.
+
+PRIORITY_LOW = -10
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 10
+
+_local = threading.local()
+
+
+class Task(QObject):
+    # signals are emitted from the worker thread; receivers on the GUI thread
+    # get them queued, so connected slots always run there
+    progress = pyqtSignal(int, str)
+    result_ready = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()  # after any of the three above
+
+    def __init__(self, fn, args=(), kwargs=None, priority=PRIORITY_NORMAL, long_running=False, name=None):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.priority = priority
+        self.long_running = long_running
+        self.name = name or getattr(fn, '__qualname__', repr(fn))
+        self.future = Future()
+        self._cancel = threading.Event()
+        # held while the outcome is stored and emitted, so then() sees either
+        # a pending task (and its connection gets the signal) or a finished one
+        self._outcome_lock = threading.Lock()
+
+    # Any thread
+
+    def cancel(self):
+        """Ask the task to stop; a task that has not started yet never runs."""
+        self._cancel.set()
+        self.future.cancel()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def then(self, on_result=None, on_error=None):
+        """Connect result/error handlers; if the task already finished they are called (queued) anyway."""
+        with self._outcome_lock:
+            if on_result is not None:
+                self.result_ready.connect(on_result)
+            if on_error is not None:
+                self.failed.connect(on_error)
+            if not self.future.done() or self.future.cancelled():
+                return self
+            error = self.future.exception()
+        if error is None and on_result is not None:
+            _redeliver(on_result, self.future.result())
+        elif error is not None and not isinstance(error, CancelledError) and on_error is not None:
+            _redeliver(on_error, error)
+        return self
+
+    # Worker thread
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise CancelledError()
+
+    def report_progress(self, value, message=""):
+        self.progress.emit(int(value), str(message))
+
+    def _run(self):
+        if not self.future.set_running_or_notify_cancel():
+            self.cancelled.emit()
+            self.finished.emit()
+            return
+        _local.task = self
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except CancelledError:
+            self.future.set_exception(CancelledError())
+            self.cancelled.emit()
+        except Exception as e:
+            traceback.print_exc()
+            with self._outcome_lock:
+                self.future.set_exception(e)
+                self.failed.emit(e)
+        else:
+            if self._cancel.is_set():
+                self.future.set_exception(CancelledError())
+                self.cancelled.emit()
+            else:
+                with self._outcome_lock:
+                    self.future.set_result(result)
+                    self.result_ready.emit(result)
+        finally:
+            _local.task = None
+        self.finished.emit()
+
+
+class TaskExecutor(QObject):
+    def __init__(self, max_threads=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads or max(4, QThread.idealThreadCount()))
+        self._lock = threading.Lock()
+        self._active = {}  # task -> (weakref to owner, owner.destroyed connection) or (None, None)
+
+    def submit(self, fn, *args, priority=PRIORITY_NORMAL, owner=None, long_running=False, name=None, **kwargs):
+        task = Task(fn, args, kwargs, priority=priority, long_running=long_running, name=name)
+        main = QCoreApplication.instance()
+        if main is not None and task.thread() is not main.thread():
+            task.moveToThread(main.thread())
+        owner_ref = connection = None
+        if owner is not None:
+            owner_ref = weakref.ref(owner)
+            connection = owner.destroyed.connect(lambda _obj=None, t=task: t.cancel())
+        with self._lock:
+            self._active[task] = (owner_ref, connection)
+        task.finished.connect(lambda t=task: self._forget(t), Qt.ConnectionType.QueuedConnection)
+
+        if long_running:
+            threading.Thread(target=task._run, name=f"task: {task.name}"[:60], daemon=True).start()
+        else:
+            self.pool.start(task._run, priority)
+        return task
+
+    def _forget(self, task):
+        with self._lock:
+            owner_ref, connection = self._active.pop(task, (None, None))
+        owner = owner_ref() if owner_ref is not None else None
+        if owner is not None and not sip.isdeleted(owner):
+            try:
+                owner.destroyed.disconnect(connection)
+            except (TypeError, RuntimeError):
+                pass
+
+    def active_tasks(self):
+        with self._lock:
+            return list(self._active)
+
+    def cancel_all(self):
+        for task in self.active_tasks():
+            task.cancel()
+
+    def shutdown(self, wait_ms=2000):
+        """Cancel everything, drop queued work and give running pool tasks `wait_ms` to stop."""
+        self.cancel_all()
+        self.pool.clear()
+        return self.pool.waitForDone(wait_ms)
+
+
+def _redeliver(slot, value):
+    # like the queued signal would have: later, and not to a deleted receiver
+    receiver = getattr(slot, '__self__', None)
+    run_in_main(slot, value, owner=receiver if isinstance(receiver, QObject) else None)
+
+
+# Main-thread dispatch
+
+class _MainThreadInvoker(QObject):
+    call = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.call.connect(self._call, Qt.ConnectionType.QueuedConnection)
+
+    def _call(self, item):
+        fn, args, owner_ref = item
+        if owner_ref is not None:
+            owner = owner_ref()
+            if owner is None or sip.isdeleted(owner):
+                return
+        try:
+            fn(*args)
+        except Exception:
+            traceback.print_exc()
+
+
+_invoker = None
+_invoker_lock = threading.Lock()
+
+
+def run_in_main(fn, *args, owner=None):
+    """Call fn(*args) on the GUI thread (later, from its event loop); skipped if `owner` is gone by then."""
+    global _invoker
+    with _invoker_lock:
+        if _invoker is None:
+            _invoker = _MainThreadInvoker()
+            app = QCoreApplication.instance()
+            if app is not None and _invoker.thread() is not app.thread():
+                _invoker.moveToThread(app.thread())
+    _invoker.call.emit((fn, args, weakref.ref(owner) if owner is not None else None))
+
+
+# Process-wide executor
+
+_executor = None
+
+
+def executor():
+    global _executor
+    if _executor is None:
+        _executor = TaskExecutor()
+        app = QCoreApplication.instance()
+        if app is not None:
+            if _executor.thread() is not app.thread():
+                _executor.moveToThread(app.thread())
+            app.aboutToQuit.connect(_executor.shutdown)
+    return _executor
+
+
+def submit(fn, *args, **kwargs):
+    return executor().submit(fn, *args, **kwargs)
+
+
+def current_task():
+    """The Task running on this thread, or None outside the executor."""
+    return getattr(_local, 'task', None)
+
+
+def check_cancelled():
+    task = current_task()
+    if task is not None:
+        task.check_cancelled()
+
+
+def report_progress(value, message=""):
+    task = current_task()
+    if task is not None:
+        task.report_progress(value, message)